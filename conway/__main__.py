@@ -2,26 +2,131 @@ import argparse
 import time
 
 from rules import RuleSet
-from grid import Grid
-from renderer import refresh
+from backends import BACKENDS, GLIDER, create_grid, randomize
+from benchmark import measure
+from cycles import CycleDetector
+from patterns import load_pattern
+from renderer import DiffRenderer, Viewport
+from snapshot import Checkpointer, Snapshot
+from stats import StatsCollector, StatsRecorder
 
 
 def main(args):
+    # --workers selects the parallel engine; report and render what is built.
+    if args.workers > 1:
+        args.backend = "parallel"
+    backend = args.backend
+    generation = 0
+
+    if args.resume:
+        with Snapshot(args.resume) as snapshot:
+            rules = RuleSet(args.ruleset or snapshot.rule)
+            args.size = snapshot.grid_size
+            grid = create_grid(
+                backend, snapshot.grid_size, snapshot.grid_wrap, workers=args.workers
+            )
+            snapshot.load_into(grid)
+            generation = snapshot.generation
+        print(f"Resumed from {args.resume} at generation {generation}")
+    else:
+        rules = RuleSet(args.ruleset or "B3/S23")
+        grid = create_grid(backend, args.size, workers=args.workers)
+
+        density = args.density
+        if density is None and args.headless:
+            density = 0.35
+
+        if args.pattern:
+            load_pattern(args.pattern, grid)
+        elif density is None:
+            for x, y in GLIDER:
+                grid.set_cell(x, y, 1)
+        else:
+            randomize(grid, args.size, density, args.seed)
+
+    checkpointer = None
+    if args.checkpoint:
+        checkpointer = Checkpointer(
+            args.checkpoint, args.checkpoint_every, rules.rule, generation
+        )
+
+    collector = None
+    if args.stats:
+        collector = StatsCollector([StatsRecorder(args.stats, args.stats_every)])
+
+    try:
+        if args.headless:
+            run_headless(grid, rules, args, checkpointer, collector)
+        else:
+            run_interactive(grid, rules, args, checkpointer, collector)
+    finally:
+        if collector is not None:
+            for observer in collector.observers:
+                observer.close()
+        if checkpointer is not None:
+            checkpointer.save(grid)
+            print(f"Checkpoint saved to {args.checkpoint}")
+        if backend == "parallel":
+            grid.close()
+
+
+def run_headless(grid, rules, args, checkpointer=None, collector=None):
+    """Evolve the grid without rendering and report its throughput."""
+
+    detector = CycleDetector() if args.stop_on_cycle else None
+    result = measure(
+        grid,
+        rules,
+        args.generations,
+        args.size,
+        detector=detector,
+        checkpointer=checkpointer,
+        collector=collector,
+    )
+
+    print(f"Backend: {args.backend}, Ruleset: {rules.rule}, Size: {args.size}")
+    print(f"Generations: {result['generations']} in {result['seconds']:.3f}s")
+    print(f"Generations per second: {result['generations_per_second']:.2f}")
+    print(f"Cell updates per second: {result['cell_updates_per_second']:.0f}")
+    if result["peak_memory_kb"] is not None:
+        print(f"Peak memory: {result['peak_memory_kb'] / 1024:.1f} MiB")
+
+    cycle = result["cycle"]
+    if cycle is not None:
+        print(
+            f"Stopped early: {cycle['kind']} with period {cycle['period']} "
+            f"from generation {cycle['start']}"
+        )
+
+
+def run_interactive(grid, rules, args, checkpointer=None, collector=None):
+    """Evolve and draw the grid until interrupted or out of generations."""
+
     # Clear screen + hide cursor
     print("\x1b[2J\x1b[?25l", end="")
 
-    rules = RuleSet(args.ruleset)
-
-    grid = Grid(grid_size=50)
+    view = Viewport(grid, grid_size=args.size) if args.backend == "sparse" else grid
+    renderer = DiffRenderer(max_fps=args.fps)
 
+    generation = 0
     try:
-        while True:
-            grid.evolve(rules)
-            refresh(grid)
-            time.sleep(0.5)
+        while args.generations is None or generation < args.generations:
+            if collector is None:
+                grid.evolve(rules)
+                renderer.refresh(view)
+            else:
+                collector.evolve(grid, rules, render=lambda: renderer.refresh(view))
+            if checkpointer is not None:
+                checkpointer.update(grid)
+            generation += 1
+            # With --fps the renderer drops frames instead of slowing the run.
+            if args.fps is None:
+                time.sleep(0.5)
     except KeyboardInterrupt:
-        print("\x1b[?25h")
-        print("Ended simulation.")
+        pass
+
+    print("\x1b[?25h")
+    print("Ended simulation.")
 
 
 if __name__ == "__main__":
@@ -31,9 +136,95 @@ if __name__ == "__main__":
     parser.add_argument(
         "--ruleset",
         required=False,
-        default="B3/S23",
-        help="Input Life-like ruleset (e.g. B3/S23)",
+        default=None,
+        help="Input Life-like ruleset (e.g. B3/S23; default: B3/S23, or the "
+        "snapshot's rule when resuming)",
+    )
+    parser.add_argument(
+        "--backend",
+        default="dense",
+        choices=[name for name in BACKENDS if name != "parallel"],
+        help="Grid engine used to evolve the board",
+    )
+    parser.add_argument(
+        "--size", type=int, default=50, help="Width and height of the board"
+    )
+    parser.add_argument(
+        "--density",
+        type=float,
+        default=None,
+        help="Fill the board with a random soup of this density (0-1) "
+        "instead of a glider (headless default: 0.35)",
+    )
+    parser.add_argument(
+        "--pattern",
+        default=None,
+        help="Load the board from an RLE, plaintext or Life 1.06 pattern file",
+    )
+    parser.add_argument(
+        "--seed", type=int, default=None, help="Seed for the random soup"
+    )
+    parser.add_argument(
+        "--generations",
+        type=int,
+        default=None,
+        help="Number of generations to run (headless default: 100)",
+    )
+    parser.add_argument(
+        "--headless",
+        action="store_true",
+        help="Run without rendering and report simulation throughput",
+    )
+    parser.add_argument(
+        "--stop-on-cycle",
+        action="store_true",
+        help="In headless mode, stop once the board dies out, settles or repeats",
+    )
+    parser.add_argument(
+        "--fps",
+        type=float,
+        default=None,
+        help="Maximum frames drawn per second; extra frames are dropped",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Number of worker processes used to evolve the grid (requires NumPy)",
+    )
+    parser.add_argument(
+        "--checkpoint",
+        default=None,
+        help="Save a binary snapshot of the board to this file periodically "
+        "and when the run ends",
+    )
+    parser.add_argument(
+        "--checkpoint-every",
+        type=int,
+        default=1000,
+        help="Generations between checkpoints",
+    )
+    parser.add_argument(
+        "--resume",
+        default=None,
+        help="Continue a run from a snapshot file (overrides --size and --pattern)",
+    )
+    parser.add_argument(
+        "--stats",
+        default=None,
+        help="Write per-generation population, births, deaths, bounding box "
+        "and step/render times to this CSV file",
+    )
+    parser.add_argument(
+        "--stats-every",
+        type=int,
+        default=1,
+        help="Only write the statistics of every Nth generation",
     )
 
     args = parser.parse_args()
+    if args.backend == "sparse" and (args.checkpoint or args.resume):
+        parser.error("Snapshots are not supported by the sparse backend.")
+    if args.headless and args.generations is None:
+        args.generations = 100
     main(args)
@@ -0,0 +1,115 @@
+import random
+
+from grid import Grid
+from packed import PackedGrid
+from parallel import ParallelGrid
+from sparse import SparseGrid
+from vectorized import NumpyGrid
+
+GLIDER = [(1, 0), (2, 1), (0, 2), (1, 2), (2, 2)]
+
+# Grid engines selectable by name. All of them provide `set_cell`,
+# `get_cell` and `evolve(ruleset)`.
+BACKENDS = {
+    "dense": Grid,
+    "packed": PackedGrid,
+    "numpy": NumpyGrid,
+    "parallel": ParallelGrid,
+    "sparse": SparseGrid,
+}
+
+
+def create_grid(backend: str, grid_size: int, grid_wrap: bool = True, workers: int = 1):
+    """
+    Create an empty grid for the given backend.
+
+    Parameters
+    ----------
+    backend : str
+        One of the names in `BACKENDS`.
+    grid_size : int
+        Width and height of the square grid. Ignored by the unbounded
+        ``"sparse"`` backend.
+    grid_wrap : bool, default=True
+        Whether the grid wraps around at the edges. Ignored by ``"sparse"``.
+    workers : int, default=1
+        Number of worker processes for the ``"parallel"`` backend.
+
+    Returns
+    -------
+    Grid | PackedGrid | NumpyGrid | ParallelGrid | SparseGrid
+        A grid with every cell dead.
+
+    Raises
+    ------
+    ValueError
+        If the backend name is unknown.
+    """
+
+    if backend not in BACKENDS:
+        raise ValueError(
+            f"Unknown backend '{backend}'. Expected one of: {', '.join(BACKENDS)}."
+        )
+
+    if backend == "sparse":
+        return SparseGrid(cells=[])
+
+    if backend == "parallel":
+        grid = ParallelGrid(grid_wrap=grid_wrap, grid_size=grid_size, workers=workers)
+    else:
+        grid = BACKENDS[backend](grid_wrap=grid_wrap, grid_size=grid_size)
+
+    # Clear the default glider.
+    for x, y in GLIDER:
+        if x < grid_size and y < grid_size:
+            grid.set_cell(x, y, 0)
+
+    return grid
+
+
+def random_soup(grid_size: int, density: float, seed: int | None = None) -> list[int]:
+    """
+    Generate a random soup as a flat list of ``grid_size * grid_size`` cells.
+
+    Parameters
+    ----------
+    grid_size : int
+        Width and height of the soup.
+    density : float
+        Probability (0-1) that a cell is alive.
+    seed : int | None, default=None
+        Seed for the random number generator.
+
+    Returns
+    -------
+    list[int]
+        Cell states in row-major order, suitable as the `grid` argument of
+        the bounded grid types.
+    """
+
+    rng = random.Random(seed)
+    return [1 if rng.random() < density else 0 for _ in range(grid_size * grid_size)]
+
+
+def randomize(grid, grid_size: int, density: float, seed: int | None = None) -> None:
+    """
+    Fill the square ``[0, grid_size)`` of a grid with a random soup.
+
+    The same seed, size and density produce the same soup on every backend,
+    so their results can be compared.
+
+    Parameters
+    ----------
+    grid
+        Any grid providing `set_cell(x, y, state)`.
+    grid_size : int
+        Width and height of the area to fill.
+    density : float
+        Probability (0-1) that a cell is alive.
+    seed : int | None, default=None
+        Seed for the random number generator.
+    """
+
+    soup = random_soup(grid_size, density, seed)
+    for index, state in enumerate(soup):
+        grid.set_cell(index % grid_size, index // grid_size, state)
@@ -0,0 +1,244 @@
+import argparse
+import csv
+import sys
+import time
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+from backends import BACKENDS, create_grid, randomize
+from rules import RuleSet
+
+DEFAULT_SIZES = [64, 128, 256]
+DEFAULT_RULES = ["B3/S23", "B36/S23", "B2/S"]
+RESULT_FIELDS = [
+    "backend",
+    "rule",
+    "size",
+    "generations",
+    "seconds",
+    "generations_per_second",
+    "cell_updates_per_second",
+    "peak_memory_kb",
+]
+
+
+def peak_memory_kb() -> int | None:
+    """Return the peak resident memory of the process in KiB, if available."""
+
+    if resource is None:
+        return None
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is reported in bytes on macOS and in KiB elsewhere.
+    if sys.platform == "darwin":
+        peak //= 1024
+    return peak
+
+
+def measure(
+    grid,
+    ruleset,
+    generations: int,
+    grid_size: int,
+    detector=None,
+    checkpointer=None,
+    collector=None,
+) -> dict:
+    """
+    Evolve a grid without rendering and measure its throughput.
+
+    Parameters
+    ----------
+    grid
+        Any grid providing `evolve(ruleset)`.
+    ruleset : RuleSet
+        The rule to evolve the grid with.
+    generations : int
+        Maximum number of generations to run.
+    grid_size : int
+        Width and height of the board, used to count cell updates.
+    detector : CycleDetector | None, default=None
+        If given, the run stops early once the detector reports extinction,
+        a still life or an oscillator.
+    checkpointer : Checkpointer | None, default=None
+        If given, it is updated after every generation so that snapshots are
+        saved at its interval.
+    collector : StatsCollector | None, default=None
+        If given, every generation is evolved through it so that its
+        observers receive per-generation statistics.
+
+    Returns
+    -------
+    dict
+        The generations run, elapsed seconds, generations per second, cell
+        updates per second, peak process memory in KiB, and the detector's
+        report under ``cycle`` (None if no cycle was found).
+    """
+
+    if detector is not None:
+        detector.reset(grid)
+    if collector is not None:
+        collector.reset(grid)
+
+    cycle = None
+    completed = 0
+    start = time.perf_counter()
+    for _ in range(generations):
+        if collector is None:
+            grid.evolve(ruleset)
+        else:
+            collector.evolve(grid, ruleset)
+        completed += 1
+        if checkpointer is not None:
+            checkpointer.update(grid)
+        if detector is not None:
+            cycle = detector.update(grid)
+            if cycle is not None:
+                break
+    seconds = time.perf_counter() - start
+
+    rate = completed / seconds if seconds > 0 else float("inf")
+    return {
+        "generations": completed,
+        "seconds": seconds,
+        "generations_per_second": rate,
+        "cell_updates_per_second": rate * grid_size * grid_size,
+        "peak_memory_kb": peak_memory_kb(),
+        "cycle": cycle,
+    }
+
+
+def run_benchmark(
+    backend: str,
+    rule: str,
+    grid_size: int,
+    generations: int,
+    density: float = 0.35,
+    seed: int = 0,
+    workers: int = 1,
+) -> dict:
+    """
+    Run one reproducible benchmark case from a seeded random soup.
+
+    Returns
+    -------
+    dict
+        One row with the fields listed in `RESULT_FIELDS`.
+    """
+
+    ruleset = RuleSet(rule)
+    grid = create_grid(backend, grid_size, workers=workers)
+    try:
+        randomize(grid, grid_size, density, seed)
+        result = measure(grid, ruleset, generations, grid_size)
+    finally:
+        if backend == "parallel":
+            grid.close()
+
+    del result["cycle"]
+    return {"backend": backend, "rule": ruleset.rule, "size": grid_size, **result}
+
+
+def load_results(path: str) -> dict:
+    """Load a results CSV written by this script, keyed by (backend, rule, size)."""
+
+    with open(path, "r", newline="", encoding="utf-8") as f:
+        return {
+            (row["backend"], row["rule"], int(row["size"])): row
+            for row in csv.DictReader(f)
+        }
+
+
+def main(args):
+    backends = args.backends or [name for name in BACKENDS if name != "parallel"]
+    baseline = load_results(args.baseline) if args.baseline else {}
+
+    results = []
+    regressions = []
+    for backend in backends:
+        for rule in args.rules:
+            for size in args.sizes:
+                try:
+                    result = run_benchmark(
+                        backend,
+                        rule,
+                        size,
+                        args.generations,
+                        density=args.density,
+                        seed=args.seed,
+                        workers=args.workers,
+                    )
+                except ImportError as e:
+                    print(f"Skipping backend '{backend}': {e}")
+                    break
+
+                results.append(result)
+                print(
+                    f"{backend:>9} {result['rule']:>10} {size:>6} "
+                    f"{result['generations_per_second']:>12.2f} gen/s "
+                    f"{result['cell_updates_per_second']:>14.0f} cells/s"
+                )
+
+                previous = baseline.get((backend, result["rule"], size))
+                if previous is not None:
+                    previous_rate = float(previous["generations_per_second"])
+                    if result["generations_per_second"] < previous_rate * (
+                        1 - args.tolerance
+                    ):
+                        regressions.append((backend, result["rule"], size))
+
+    if args.output:
+        with open(args.output, "w", newline="", encoding="utf-8") as f:
+            writer = csv.DictWriter(f, fieldnames=RESULT_FIELDS)
+            writer.writeheader()
+            writer.writerows(results)
+        print(f"Results saved to {args.output}")
+
+    if regressions:
+        for backend, rule, size in regressions:
+            print(f"Regression: {backend} {rule} size {size} is slower than baseline")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Benchmark grid backends across board sizes and rulesets"
+    )
+    parser.add_argument(
+        "--backends",
+        nargs="+",
+        choices=list(BACKENDS),
+        help="Backends to benchmark (default: all except parallel)",
+    )
+    parser.add_argument(
+        "--rules", nargs="+", default=DEFAULT_RULES, help="Rulesets to benchmark"
+    )
+    parser.add_argument(
+        "--sizes", nargs="+", type=int, default=DEFAULT_SIZES, help="Board sizes"
+    )
+    parser.add_argument(
+        "--generations", type=int, default=10, help="Generations per case"
+    )
+    parser.add_argument(
+        "--density", type=float, default=0.35, help="Initial live cell density"
+    )
+    parser.add_argument("--seed", type=int, default=0, help="Random soup seed")
+    parser.add_argument(
+        "--workers", type=int, default=2, help="Workers for the parallel backend"
+    )
+    parser.add_argument("--output", help="Write results to this CSV file")
+    parser.add_argument(
+        "--baseline", help="Compare against a results CSV from an earlier run"
+    )
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.2,
+        help="Allowed slowdown against the baseline before failing (0-1)",
+    )
+
+    args = parser.parse_args()
+    main(args)
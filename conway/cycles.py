@@ -0,0 +1,195 @@
+from collections import OrderedDict
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+MASK_64 = (1 << 64) - 1
+
+
+def cell_key(cell: int, seed: int = 0) -> int:
+    """
+    Return the 64-bit Zobrist key of a cell.
+
+    Keys are derived from the cell id with the SplitMix64 finalizer instead
+    of being stored in a table, so boards of any size need no key memory.
+
+    Parameters
+    ----------
+    cell : int
+        The cell id (a flat index, or `sparse.cell_id` on the plane).
+    seed : int, default=0
+        Seed mixed into every key.
+
+    Returns
+    -------
+    int
+        A pseudo-random 64-bit key.
+    """
+
+    z = (cell + seed + 0x9E3779B97F4A7C15) & MASK_64
+    z = ((z ^ (z >> 30)) * 0xBF58476D1CE4E5B9) & MASK_64
+    z = ((z ^ (z >> 27)) * 0x94D049BB133111EB) & MASK_64
+    return z ^ (z >> 31)
+
+
+def hash_cells(cells, seed: int = 0) -> int:
+    """
+    XOR together the Zobrist keys of a collection of cells.
+
+    Parameters
+    ----------
+    cells : Iterable[int] | numpy.ndarray
+        Cell ids. NumPy arrays are hashed in a single vectorized pass.
+    seed : int, default=0
+        Seed mixed into every key.
+
+    Returns
+    -------
+    int
+        The XOR of the keys of all cells.
+    """
+
+    if np is not None and isinstance(cells, np.ndarray):
+        if cells.size == 0:
+            return 0
+        with np.errstate(over="ignore"):
+            z = cells.astype(np.uint64) + np.uint64(
+                (seed + 0x9E3779B97F4A7C15) & MASK_64
+            )
+            z = (z ^ (z >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+            z = (z ^ (z >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+            z ^= z >> np.uint64(31)
+        return int(np.bitwise_xor.reduce(z))
+
+    result = 0
+    for cell in cells:
+        result ^= cell_key(cell, seed)
+    return result
+
+
+class CycleDetector:
+    """
+    Detects extinction, still lifes and oscillators during a run.
+
+    The detector keeps a Zobrist hash of the board: the XOR of a random key
+    for every live cell. Each generation only the cells that were born or
+    died are XORed in or out, using the grid's `changes` method, so the
+    cost scales with the activity rather than the board size. Hashes of
+    recent generations are kept in a bounded history table; when a hash
+    reappears the board has (barring a 64-bit collision) returned to an
+    earlier state.
+
+    The hash starts at 0 for the board passed to `reset`, so no initial
+    scan of the board is needed. Grids must only be changed through
+    `evolve` between updates; call `reset` after editing cells directly.
+
+    Parameters
+    ----------
+    history : int, default=1024
+        Number of past generations remembered. Oscillators with a longer
+        period are not detected.
+    seed : int, default=0
+        Seed for the Zobrist keys.
+    """
+
+    def __init__(self, history: int = 1024, seed: int = 0) -> None:
+        self.history = history
+        self.seed = seed
+
+        self.hash = 0
+        self.generation = 0
+        self.population = 0
+        self._seen = OrderedDict()
+
+    def reset(self, grid) -> None:
+        """
+        Start tracking a grid from its current state.
+
+        Parameters
+        ----------
+        grid
+            Any grid providing `population` and `changes()`.
+        """
+
+        self.hash = 0
+        self.generation = 0
+        self.population = grid.population
+        self._seen = OrderedDict({0: 0})
+
+    def update(self, grid) -> dict | None:
+        """
+        Account for one call to `grid.evolve`.
+
+        Parameters
+        ----------
+        grid
+            The grid passed to `reset`, just after it evolved.
+
+        Returns
+        -------
+        dict | None
+            None while the run is still changing. Otherwise a dict with
+            ``kind`` (``"extinct"``, ``"still life"`` or ``"oscillator"``),
+            ``period`` and ``start``, the generation at which the final
+            state or cycle was first reached.
+        """
+
+        births, deaths = grid.changes()
+        self.hash ^= hash_cells(births, self.seed) ^ hash_cells(deaths, self.seed)
+        self.population += len(births) - len(deaths)
+        self.generation += 1
+
+        if self.population == 0:
+            return {"kind": "extinct", "period": 1, "start": self.generation}
+
+        previous = self._seen.get(self.hash)
+        if previous is not None:
+            period = self.generation - previous
+            return {
+                "kind": "still life" if period == 1 else "oscillator",
+                "period": period,
+                "start": previous,
+            }
+
+        self._seen[self.hash] = self.generation
+        if len(self._seen) > self.history:
+            self._seen.popitem(last=False)
+
+        return None
+
+
+def run_until_stable(grid, ruleset, max_generations: int, detector=None) -> dict:
+    """
+    Evolve a grid until it dies out, settles or repeats.
+
+    Parameters
+    ----------
+    grid
+        Any grid providing `evolve`, `population` and `changes()`.
+    ruleset : RuleSet
+        The rule to evolve the grid with.
+    max_generations : int
+        Upper bound on the number of generations to run.
+    detector : CycleDetector | None, default=None
+        Detector to use. A default one is created if omitted.
+
+    Returns
+    -------
+    dict
+        ``generations`` run, and ``result``: the detector's report, or None
+        if the run was still changing after `max_generations`.
+    """
+
+    if detector is None:
+        detector = CycleDetector()
+    detector.reset(grid)
+
+    for _ in range(max_generations):
+        grid.evolve(ruleset)
+        result = detector.update(grid)
+        if result is not None:
+            return {"generations": detector.generation, "result": result}
+
+    return {"generations": detector.generation, "result": None}
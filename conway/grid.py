@@ -9,31 +9,72 @@ class Grid:
     out-of-bounds neighbor lookups wrap around to the opposite edge. When disabled,
     out-of-bounds neighbors are treated as dead.
 
+    The grid is split into square tiles. `evolve` only recomputes tiles in
+    which, or next to which, a cell changed during the previous generation
+    (or through `set_cell`); every other tile is known to be stable and is
+    skipped. Cells should therefore be modified through `set_cell`, or by
+    assigning a new list to `grid`, rather than by mutating `grid` in place.
+
     Parameters
     ----------
     grid: list[int] | None
         An optional list representing the initial grid state. Must have
-        length `grid_size * grid_size` if provided. If omitted, a zero-filled
-        grid is created and initialized with a glider pattern.
+        length `grid_size * grid_size` if provided, otherwise a ValueError is
+        raised. If omitted, a zero-filled grid is created and initialized with
+        a glider pattern.
     grid_wrap: bool, default=True
         Whether the grid should wrap around at the edges (toroidal topology).
         If False, neighbor lookups outside the grid return 0.
     grid_size: int, default=10
         Width and height of the square grid.
+    tile_size: int, default=32
+        Width and height of the tiles used to skip stable regions.
     """
 
-    def __init__(self, grid=None, grid_wrap: bool = True, grid_size: int = 10) -> None:
+    def __init__(
+        self,
+        grid=None,
+        grid_wrap: bool = True,
+        grid_size: int = 10,
+        tile_size: int = 32,
+    ) -> None:
         self.grid_size = grid_size
 
-        self.grid = [0] * (grid_size * grid_size)
+        if grid is None:
+            self.grid = [0] * (grid_size * grid_size)
+        elif len(grid) != grid_size * grid_size:
+            raise ValueError("Initial grid must have grid_size * grid_size cells.")
+        else:
+            self.grid = list(grid)
 
         self.grid_wrap = grid_wrap
 
-        self.set_cell(1, 0, 1)
-        self.set_cell(2, 1, 1)
-        self.set_cell(0, 2, 1)
-        self.set_cell(1, 2, 1)
-        self.set_cell(2, 2, 1)
+        self.tile_size = tile_size
+        self.tiles_per_side = -(-grid_size // tile_size)
+
+        # Tiles containing a cell that changed since the last evolve. The
+        # tile set is only trusted while the grid list and rule table are the
+        # ones the previous evolve worked with.
+        self._dirty_tiles = set()
+        self._evolved_grid = None
+        self._evolved_table = None
+
+        # Flat indices of the cells born and died in the last evolve.
+        self._births = []
+        self._deaths = []
+
+        if grid is None:
+            self.set_cell(1, 0, 1)
+            self.set_cell(2, 1, 1)
+            self.set_cell(0, 2, 1)
+            self.set_cell(1, 2, 1)
+            self.set_cell(2, 2, 1)
+
+    @property
+    def population(self) -> int:
+        """The number of live cells."""
+
+        return sum(self.grid)
 
     def set_cell(self, x: int, y: int, state: int) -> None:
         """
@@ -50,6 +91,34 @@ class Grid:
         """
 
         self.grid[y * self.grid_size + x] = state
+        self._dirty_tiles.add(
+            (y // self.tile_size) * self.tiles_per_side + x // self.tile_size
+        )
+
+    def set_run(self, x: int, y: int, length: int, state: int = 1) -> None:
+        """
+        Set the state of a horizontal run of cells in one row.
+
+        Parameters
+        ----------
+        x: int
+            The x-coordinate of the first cell in the run.
+        y: int
+            The y-coordinate (row index) of the run.
+        length: int
+            The number of cells in the run.
+        state: int, default=1
+            The new state of the cells: 1 for alive, 0 for dead.
+        """
+
+        start = y * self.grid_size + x
+        self.grid[start : start + length] = [state] * length
+
+        tile_row = (y // self.tile_size) * self.tiles_per_side
+        for tile_x in range(
+            x // self.tile_size, (x + length - 1) // self.tile_size + 1
+        ):
+            self._dirty_tiles.add(tile_row + tile_x)
 
     def get_cell(self, x: int, y: int) -> int:
         """
@@ -111,37 +180,116 @@ class Grid:
 
         return count
 
+    def _active_tiles(self, ruleset) -> set[int]:
+        """
+        Determine which tiles must be recomputed in the next generation.
+
+        A tile can only change if a cell in it or in one of its eight
+        neighboring tiles changed since the previous generation. When the
+        grid list was replaced or a different rule is used, every tile
+        is recomputed.
+
+        Parameters
+        ----------
+        ruleset : RuleSet
+            The ruleset the next generation is computed with.
+
+        Returns
+        -------
+        set[int]
+            Indices (``tile_y * tiles_per_side + tile_x``) of active tiles.
+        """
+
+        count = self.tiles_per_side
+
+        if (
+            self.grid is not self._evolved_grid
+            or ruleset.table is not self._evolved_table
+        ):
+            return set(range(count * count))
+
+        active = set()
+        for tile in self._dirty_tiles:
+            tile_y, tile_x = divmod(tile, count)
+            for dy in (-1, 0, 1):
+                for dx in (-1, 0, 1):
+                    x = tile_x + dx
+                    y = tile_y + dy
+                    if self.grid_wrap:
+                        x %= count
+                        y %= count
+                    elif x < 0 or x >= count or y < 0 or y >= count:
+                        continue
+                    active.add(y * count + x)
+
+        return active
+
     def evolve(self, ruleset):
         """
         Advance the grid by one generation using the provided ruleset.
 
-        For each cell, the method determines:
+        For each cell in an active tile, the method determines:
             - whether the cell is currently alive,
             - how many neighbors it has, and
-            - what action the ruleset prescribes (“die”, “survive”, or “born”).
+            - what state the ruleset's transition table prescribes.
 
-        A new grid state is computed and then replaces the current one.
+        A new grid state is computed and then replaces the current one. Cells
+        in stable tiles keep their state, which gives the same result as
+        recomputing them.
 
         Parameters
         ----------
         ruleset : RuleSet
-            A `RuleSet` object that determines the state a cell evolves into based on
-            the count of neighboring cells.
+            A `RuleSet` object whose transition table determines the state a cell
+            evolves into based on the count of neighboring cells.
         """
 
+        size = self.grid_size
+        tile_size = self.tile_size
+        table = ruleset.table
+
+        changed_tiles = set()
+        births = []
+        deaths = []
         new_grid = self.grid.copy()
-        for y in range(self.grid_size):
-            for x in range(self.grid_size):
-                index = y * self.grid_size + x
-                is_alive = self.grid[index] == 1
-                neighbor_count = self.count_neighbors(x, y)
-                action = ruleset.evaluate(is_alive, neighbor_count)
-
-                if action == "die":
-                    new_grid[index] = 0
-                elif action in "survive" and is_alive:
-                    new_grid[index] = 1
-                elif action == "born":
-                    new_grid[index] = 1
+        for tile in self._active_tiles(ruleset):
+            tile_y, tile_x = divmod(tile, self.tiles_per_side)
+            x_start = tile_x * tile_size
+            y_start = tile_y * tile_size
+
+            for y in range(y_start, min(y_start + tile_size, size)):
+                for x in range(x_start, min(x_start + tile_size, size)):
+                    index = y * size + x
+                    state = self.grid[index]
+                    neighbor_count = self.count_neighbors(x, y)
+                    new_state = table[state * 9 + neighbor_count]
+
+                    if new_state != state:
+                        new_grid[index] = new_state
+                        changed_tiles.add(tile)
+                        if new_state:
+                            births.append(index)
+                        else:
+                            deaths.append(index)
 
         self.grid = new_grid
+        self._dirty_tiles = changed_tiles
+        self._evolved_grid = new_grid
+        self._evolved_table = table
+        self._births = births
+        self._deaths = deaths
+
+    def changes(self) -> tuple[list[int], list[int]]:
+        """
+        Return the cells that changed during the last call to `evolve`.
+
+        Cells are identified by their flat index ``y * grid_size + x``.
+        Changes made through `set_cell` are not included.
+
+        Returns
+        -------
+        tuple[list[int], list[int]]
+            The indices of cells that were born, and of cells that died.
+        """
+
+        return self._births, self._deaths
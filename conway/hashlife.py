@@ -0,0 +1,490 @@
+class _Node:
+    """
+    A canonical quadtree node. Level 0 nodes are single cells; a node at
+    level ``k`` covers a square of ``2**k`` by ``2**k`` cells split into four
+    level ``k - 1`` quadrants. Nodes are only ever created through
+    `HashLife._join`, so two nodes with the same contents are the same object.
+    """
+
+    __slots__ = ("nw", "ne", "sw", "se", "level", "population")
+
+    def __init__(self, nw, ne, sw, se, level: int, population: int) -> None:
+        self.nw = nw
+        self.ne = ne
+        self.sw = sw
+        self.se = se
+        self.level = level
+        self.population = population
+
+
+class HashLife:
+    """
+    A HashLife engine for Life-like rulesets on an unbounded plane.
+
+    The pattern is stored as a canonicalized quadtree: identical regions are
+    shared, and the result of advancing a node is memoized, so periodic and
+    repetitive patterns can be advanced millions of generations at a time.
+    Jumps of ``2**k`` generations cost roughly the same as a single one once
+    the pattern's structure has been cached.
+
+    The node cache grows as new regions are seen. Whenever it exceeds
+    `max_cache` nodes after a step, `collect` discards every node that is no
+    longer reachable from the current pattern, together with the memoized
+    results.
+
+    HashLife assumes that empty space stays empty, so rules containing
+    ``B0`` are not supported. The plane is unbounded; the wrap mode of a
+    `Grid` is not modelled when importing from or exporting to one.
+
+    Parameters
+    ----------
+    ruleset : RuleSet
+        A `RuleSet` object providing its compiled transition `table`.
+    max_cache : int, default=1_000_000
+        Number of cached nodes above which the cache is garbage-collected.
+
+    Raises
+    ------
+    ValueError
+        If the ruleset contains ``B0``.
+    """
+
+    def __init__(self, ruleset, max_cache: int = 1_000_000) -> None:
+        if 0 in ruleset.birth:
+            raise ValueError("HashLife does not support rules containing B0.")
+
+        self.table = ruleset.table
+
+        self.max_cache = max_cache
+
+        self._off = _Node(None, None, None, None, 0, 0)
+        self._on = _Node(None, None, None, None, 0, 1)
+        self._nodes = {}
+        self._results = {}
+        self._empty = [self._off]
+
+        # The root covers [origin_x, origin_x + 2**level) horizontally and
+        # [origin_y, origin_y + 2**level) vertically.
+        self.root = self._empty_node(3)
+        self.origin_x = -4
+        self.origin_y = -4
+
+        self.generation = 0
+
+    @property
+    def population(self) -> int:
+        """The number of live cells in the pattern."""
+
+        return self.root.population
+
+    def _join(self, nw, ne, sw, se):
+        """Return the canonical node with the given four quadrants."""
+
+        key = (nw, ne, sw, se)
+        node = self._nodes.get(key)
+        if node is None:
+            node = _Node(
+                nw,
+                ne,
+                sw,
+                se,
+                nw.level + 1,
+                nw.population + ne.population + sw.population + se.population,
+            )
+            self._nodes[key] = node
+        return node
+
+    def _empty_node(self, level: int):
+        """Return the canonical empty node at the given level."""
+
+        while len(self._empty) <= level:
+            empty = self._empty[-1]
+            self._empty.append(self._join(empty, empty, empty, empty))
+        return self._empty[level]
+
+    def _centre(self, node):
+        """Return the node one level down covering the centre of `node`."""
+
+        return self._join(node.nw.se, node.ne.sw, node.sw.ne, node.se.nw)
+
+    def _expand(self, node):
+        """Return a node one level up with `node` in its centre."""
+
+        empty = self._empty_node(node.level - 1)
+        return self._join(
+            self._join(empty, empty, empty, node.nw),
+            self._join(empty, empty, node.ne, empty),
+            self._join(empty, node.sw, empty, empty),
+            self._join(node.se, empty, empty, empty),
+        )
+
+    def _base_case(self, node):
+        """Advance a level 2 node by one generation, returning its 2x2 centre."""
+
+        cells = [[0] * 4 for _ in range(4)]
+        for qy, row in enumerate(((node.nw, node.ne), (node.sw, node.se))):
+            for qx, quadrant in enumerate(row):
+                cells[2 * qy][2 * qx] = quadrant.nw.population
+                cells[2 * qy][2 * qx + 1] = quadrant.ne.population
+                cells[2 * qy + 1][2 * qx] = quadrant.sw.population
+                cells[2 * qy + 1][2 * qx + 1] = quadrant.se.population
+
+        result = []
+        for y in (1, 2):
+            for x in (1, 2):
+                count = 0
+                for dy in (-1, 0, 1):
+                    for dx in (-1, 0, 1):
+                        if dx or dy:
+                            count += cells[y + dy][x + dx]
+                state = self.table[cells[y][x] * 9 + count]
+                result.append(self._on if state else self._off)
+
+        return self._join(*result)
+
+    def _successor(self, node, j: int):
+        """
+        Return the centre of `node` advanced by ``2**j`` generations.
+
+        The result is one level below `node`. `j` must not exceed
+        ``node.level - 2``.
+        """
+
+        if node.population == 0:
+            return self._empty_node(node.level - 1)
+
+        key = (node, j)
+        result = self._results.get(key)
+        if result is not None:
+            return result
+
+        if node.level == 2:
+            result = self._base_case(node)
+        else:
+            nw, ne, sw, se = node.nw, node.ne, node.sw, node.se
+            join = self._join
+
+            # Nine overlapping sub-nodes one level down, each advanced by at
+            # most 2**(level - 3) generations.
+            step = min(j, node.level - 3)
+            c1 = self._successor(nw, step)
+            c2 = self._successor(join(nw.ne, ne.nw, nw.se, ne.sw), step)
+            c3 = self._successor(ne, step)
+            c4 = self._successor(join(nw.sw, nw.se, sw.nw, sw.ne), step)
+            c5 = self._successor(self._centre(node), step)
+            c6 = self._successor(join(ne.sw, ne.se, se.nw, se.ne), step)
+            c7 = self._successor(sw, step)
+            c8 = self._successor(join(sw.ne, se.nw, sw.se, se.sw), step)
+            c9 = self._successor(se, step)
+
+            if j < node.level - 2:
+                result = join(
+                    join(c1.se, c2.sw, c4.ne, c5.nw),
+                    join(c2.se, c3.sw, c5.ne, c6.nw),
+                    join(c4.se, c5.sw, c7.ne, c8.nw),
+                    join(c5.se, c6.sw, c8.ne, c9.nw),
+                )
+            else:
+                result = join(
+                    self._successor(join(c1, c2, c4, c5), step),
+                    self._successor(join(c2, c3, c5, c6), step),
+                    self._successor(join(c4, c5, c7, c8), step),
+                    self._successor(join(c5, c6, c8, c9), step),
+                )
+
+        self._results[key] = result
+        return result
+
+    def _is_padded(self, node) -> bool:
+        """Whether every live cell of `node` lies in its central quarter."""
+
+        inner = self._join(node.nw.se.se, node.ne.sw.sw, node.sw.ne.ne, node.se.nw.nw)
+        return inner.population == node.population
+
+    def _grow_root(self) -> None:
+        """Expand the root one level, keeping the pattern in place."""
+
+        offset = 1 << (self.root.level - 1)
+        self.root = self._expand(self.root)
+        self.origin_x -= offset
+        self.origin_y -= offset
+
+    def _advance(self, j: int) -> None:
+        """Advance the pattern by ``2**j`` generations."""
+
+        while self.root.level < j + 3 or not self._is_padded(self.root):
+            self._grow_root()
+
+        offset = 1 << (self.root.level - 2)
+        self.root = self._successor(self.root, j)
+        self.origin_x += offset
+        self.origin_y += offset
+        self.generation += 1 << j
+
+    def step(self, generations: int = 1) -> None:
+        """
+        Advance the pattern by a number of generations.
+
+        The count is split into powers of two, each of which is advanced in a
+        single memoized jump, so ``step(2**k)`` is the fastest way to skip
+        far ahead.
+
+        Parameters
+        ----------
+        generations : int, default=1
+            Number of generations to advance. Must not be negative.
+
+        Raises
+        ------
+        ValueError
+            If `generations` is negative.
+        """
+
+        if generations < 0:
+            raise ValueError("Cannot step a negative number of generations.")
+
+        j = 0
+        while generations:
+            if generations & 1:
+                self._advance(j)
+            generations >>= 1
+            j += 1
+
+        if len(self._nodes) > self.max_cache:
+            self.collect()
+
+    def collect(self) -> None:
+        """
+        Garbage-collect the node cache.
+
+        Every node not reachable from the current pattern is dropped, and
+        the memoized results are cleared.
+        """
+
+        keep = {}
+        stack = [self.root, *self._empty]
+        while stack:
+            node = stack.pop()
+            if node.level == 0:
+                continue
+            key = (node.nw, node.ne, node.sw, node.se)
+            if key in keep:
+                continue
+            keep[key] = node
+            stack.extend(key)
+
+        self._nodes = keep
+        self._results = {}
+
+    def set_cell(self, x: int, y: int, state: int) -> None:
+        """
+        Set the state of a specific cell on the plane.
+
+        Parameters
+        ----------
+        x: int
+            The x-coordinate (column index) of the cell.
+        y: int
+            The y-coordinate (row index) of the cell.
+        state: int
+            The new state of the cell: 1 for alive, 0 for dead.
+        """
+
+        while not self._contains(x, y):
+            self._grow_root()
+
+        self.root = self._set(self.root, x - self.origin_x, y - self.origin_y, state)
+
+    def _contains(self, x: int, y: int) -> bool:
+        """Whether (x, y) lies inside the area covered by the root."""
+
+        size = 1 << self.root.level
+        return (
+            self.origin_x <= x < self.origin_x + size
+            and self.origin_y <= y < self.origin_y + size
+        )
+
+    def _set(self, node, x: int, y: int, state: int):
+        """Return a copy of `node` with the cell at local (x, y) set."""
+
+        if node.level == 0:
+            return self._on if state else self._off
+
+        half = 1 << (node.level - 1)
+        nw, ne, sw, se = node.nw, node.ne, node.sw, node.se
+        if y < half:
+            if x < half:
+                nw = self._set(nw, x, y, state)
+            else:
+                ne = self._set(ne, x - half, y, state)
+        else:
+            if x < half:
+                sw = self._set(sw, x, y - half, state)
+            else:
+                se = self._set(se, x - half, y - half, state)
+
+        return self._join(nw, ne, sw, se)
+
+    def get_cell(self, x: int, y: int) -> int:
+        """
+        Retrieve the state of a cell on the plane.
+
+        Parameters
+        ----------
+        x : int
+            The x-coordinate of the cell to retrieve.
+        y : int
+            The y-coordinate of the cell to retrieve.
+
+        Returns
+        -------
+        int
+            The state of the cell at (x, y): 1 if alive, 0 if dead.
+        """
+
+        if not self._contains(x, y):
+            return 0
+
+        node = self.root
+        x -= self.origin_x
+        y -= self.origin_y
+        while node.level > 0:
+            if node.population == 0:
+                return 0
+            half = 1 << (node.level - 1)
+            if y < half:
+                node = node.nw if x < half else node.ne
+            else:
+                node = node.sw if x < half else node.se
+            x %= half
+            y %= half
+
+        return node.population
+
+    def live_cells(self, x0=None, y0=None, x1=None, y1=None):
+        """
+        Iterate over the coordinates of live cells.
+
+        Parameters
+        ----------
+        x0, y0, x1, y1 : int | None
+            Optional window ``[x0, x1) x [y0, y1)`` to restrict the search
+            to. Omitted bounds are unbounded.
+
+        Yields
+        ------
+        tuple[int, int]
+            The (x, y) coordinates of every live cell in the window.
+        """
+
+        stack = [(self.root, self.origin_x, self.origin_y)]
+        while stack:
+            node, nx, ny = stack.pop()
+            if node.population == 0:
+                continue
+
+            size = 1 << node.level
+            if x0 is not None and nx + size <= x0:
+                continue
+            if y0 is not None and ny + size <= y0:
+                continue
+            if x1 is not None and nx >= x1:
+                continue
+            if y1 is not None and ny >= y1:
+                continue
+
+            if node.level == 0:
+                yield nx, ny
+                continue
+
+            half = size >> 1
+            stack.append((node.se, nx + half, ny + half))
+            stack.append((node.sw, nx, ny + half))
+            stack.append((node.ne, nx + half, ny))
+            stack.append((node.nw, nx, ny))
+
+    def load_cells(self, cells) -> None:
+        """
+        Replace the pattern with the given live cells.
+
+        Parameters
+        ----------
+        cells : Iterable[tuple[int, int]]
+            The (x, y) coordinates of the live cells.
+        """
+
+        cells = list(cells)
+        if not cells:
+            self.root = self._empty_node(3)
+            self.origin_x = self.origin_y = -4
+            return
+
+        min_x = min(x for x, _ in cells)
+        min_y = min(y for _, y in cells)
+        extent = max(max(x for x, _ in cells) - min_x, max(y for _, y in cells) - min_y)
+
+        level = 3
+        while (1 << level) <= extent:
+            level += 1
+
+        self.root = self._build(cells, level, min_x, min_y)
+        self.origin_x = min_x
+        self.origin_y = min_y
+
+    def _build(self, cells, level: int, x0: int, y0: int):
+        """Build the node at level `level` and origin (x0, y0) from live cells."""
+
+        if not cells:
+            return self._empty_node(level)
+        if level == 0:
+            return self._on
+
+        half = 1 << (level - 1)
+        quadrants = ([], [], [], [])
+        for x, y in cells:
+            quadrants[(y >= y0 + half) * 2 + (x >= x0 + half)].append((x, y))
+
+        return self._join(
+            self._build(quadrants[0], level - 1, x0, y0),
+            self._build(quadrants[1], level - 1, x0 + half, y0),
+            self._build(quadrants[2], level - 1, x0, y0 + half),
+            self._build(quadrants[3], level - 1, x0 + half, y0 + half),
+        )
+
+    def from_grid(self, grid) -> None:
+        """
+        Replace the pattern with the live cells of a `Grid`.
+
+        Parameters
+        ----------
+        grid : Grid
+            A Grid instance providing `grid_size` and a `get_cell(x, y)` method.
+        """
+
+        size = grid.grid_size
+        self.load_cells(
+            (x, y) for y in range(size) for x in range(size) if grid.get_cell(x, y)
+        )
+
+    def to_grid(self, grid, x: int = 0, y: int = 0) -> None:
+        """
+        Copy a square window of the plane into a `Grid`, e.g. for rendering.
+
+        Parameters
+        ----------
+        grid : Grid
+            A Grid instance providing `grid_size` and a `set_cell` method.
+            Every cell of the grid is overwritten.
+        x : int, default=0
+            The x-coordinate of the window's top-left corner on the plane.
+        y : int, default=0
+            The y-coordinate of the window's top-left corner on the plane.
+        """
+
+        size = grid.grid_size
+        for row in range(size):
+            for column in range(size):
+                grid.set_cell(column, row, 0)
+
+        for cell_x, cell_y in self.live_cells(x, y, x + size, y + size):
+            grid.set_cell(cell_x - x, cell_y - y, 1)
@@ -0,0 +1,172 @@
+import os
+import multiprocessing
+from multiprocessing import shared_memory
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from vectorized import NumpyGrid, apply_rule_table, change_table, neighbor_counts
+
+# Per-worker views onto the two shared cell buffers and the shared buffer of
+# transition codes, set up by `_attach`.
+_worker_buffers = []
+_worker_arrays = []
+_worker_wrap = True
+
+
+def _attach(names: list[str], grid_size: int, grid_wrap: bool) -> None:
+    """Pool initializer: map the shared buffers into the worker process."""
+
+    global _worker_wrap
+
+    for name in names:
+        buffer = shared_memory.SharedMemory(name=name)
+        _worker_buffers.append(buffer)
+        _worker_arrays.append(
+            np.ndarray((grid_size, grid_size), dtype=np.uint8, buffer=buffer.buf)
+        )
+    _worker_wrap = grid_wrap
+
+
+def _evolve_strip(source: int, y_start: int, y_end: int, table) -> None:
+    """
+    Advance the rows ``[y_start, y_end)`` of one shared buffer into the other.
+
+    The strip is copied together with one halo row above and below it, so
+    the neighbor counts of its rows can be computed locally. When the grid
+    does not wrap, halo rows beyond the edge of the board are dead. `table`
+    is a `change_table`; the transition codes of the strip, which mark its
+    births and deaths, are kept in the shared codes buffer.
+    """
+
+    cells = _worker_arrays[source]
+    target = _worker_arrays[1 - source]
+    codes = _worker_arrays[2]
+    size = cells.shape[0]
+
+    if _worker_wrap:
+        strip = np.take(cells, range(y_start - 1, y_end + 1), axis=0, mode="wrap")
+    else:
+        strip = np.zeros((y_end - y_start + 2, size), dtype=np.uint8)
+        top = max(y_start - 1, 0)
+        bottom = min(y_end + 1, size)
+        strip[top - (y_start - 1) : bottom - (y_start - 1)] = cells[top:bottom]
+
+    counts = neighbor_counts(strip, _worker_wrap)
+    table = np.frombuffer(table, dtype=np.uint8)
+    codes[y_start:y_end] = apply_rule_table(table, strip[1:-1], counts[1:-1])
+    np.bitwise_and(codes[y_start:y_end], 1, out=target[y_start:y_end])
+
+
+class ParallelGrid(NumpyGrid):
+    """
+    A `NumpyGrid` that advances the board on several cores at once.
+
+    The board is split into horizontal strips, one per worker. The current
+    and next generation live in two `multiprocessing.shared_memory` buffers
+    that every worker maps once at startup, so no cell data is pickled
+    between processes; each generation only sends the strip bounds and the
+    rule table to the pool, and the buffers are swapped afterwards. Workers
+    also write the transition codes of their strip to a third shared
+    buffer, from which `changes` reads the births and deaths.
+
+    The worker pool and shared buffers must be released with `close`, or by
+    using the grid as a context manager.
+
+    Parameters
+    ----------
+    grid: list[int] | None
+        An optional list representing the initial grid state. Must have
+        length `grid_size * grid_size` if provided, otherwise a ValueError is
+        raised. If omitted, a zero-filled grid is created and initialized with
+        a glider pattern.
+    grid_wrap: bool, default=True
+        Whether the grid should wrap around at the edges (toroidal topology).
+        If False, neighbor lookups outside the grid return 0.
+    grid_size: int, default=10
+        Width and height of the square grid.
+    workers: int | None, default=None
+        Number of worker processes. Defaults to the number of CPUs, and is
+        capped at one worker per row.
+    """
+
+    def __init__(
+        self,
+        grid=None,
+        grid_wrap: bool = True,
+        grid_size: int = 10,
+        workers: int | None = None,
+    ) -> None:
+        super().__init__(grid=grid, grid_wrap=grid_wrap, grid_size=grid_size)
+
+        workers = workers or os.cpu_count() or 1
+        self.workers = max(1, min(workers, grid_size))
+
+        self._buffers = [
+            shared_memory.SharedMemory(create=True, size=max(1, grid_size * grid_size))
+            for _ in range(3)
+        ]
+        self._arrays = [
+            np.ndarray((grid_size, grid_size), dtype=np.uint8, buffer=buffer.buf)
+            for buffer in self._buffers
+        ]
+        self._arrays[0][:] = self.cells
+        self._current = 0
+        self.cells = self._arrays[0]
+
+        bounds = [grid_size * i // self.workers for i in range(self.workers + 1)]
+        self._strips = list(zip(bounds[:-1], bounds[1:]))
+
+        self._pool = multiprocessing.Pool(
+            self.workers,
+            initializer=_attach,
+            initargs=([buffer.name for buffer in self._buffers], grid_size, grid_wrap),
+        )
+
+    def evolve(self, ruleset) -> None:
+        """
+        Advance the grid by one generation using the provided ruleset.
+
+        Parameters
+        ----------
+        ruleset : RuleSet
+            A `RuleSet` object providing its compiled transition `table`.
+        """
+
+        table = change_table(ruleset).tobytes()
+        self._pool.starmap(
+            _evolve_strip,
+            [(self._current, y_start, y_end, table) for y_start, y_end in self._strips],
+        )
+
+        self._codes = self._arrays[2]
+        self._current = 1 - self._current
+        self.cells = self._arrays[self._current]
+
+    def close(self) -> None:
+        """Stop the worker pool and release the shared buffers."""
+
+        if self._pool is None:
+            return
+
+        self._pool.terminate()
+        self._pool.join()
+        self._pool = None
+
+        # Keep a private copy of the board so it stays readable after close.
+        self.cells = self.cells.copy()
+        if self._codes is not None:
+            self._codes = self._codes.copy()
+        self._arrays = []
+        for buffer in self._buffers:
+            buffer.close()
+            buffer.unlink()
+        self._buffers = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
@@ -0,0 +1,456 @@
+import contextlib
+import mmap
+import os
+import re
+
+RLE_HEADER = re.compile(
+    rb"^\s*x\s*=\s*(\d+)\s*,\s*y\s*=\s*(\d+)(?:\s*,\s*rule\s*=\s*(\S+))?"
+)
+RLE_TOKEN = re.compile(rb"(\d*)([A-Za-z$!])")
+PLAINTEXT_RUN = re.compile(rb"[O*]+")
+LIFE_106_CELL = re.compile(rb"^\s*(-?\d+)\s+(-?\d+)\s*$")
+
+FORMATS = {
+    ".rle": "rle",
+    ".cells": "plaintext",
+    ".txt": "plaintext",
+    ".lif": "life106",
+    ".life": "life106",
+}
+
+
+@contextlib.contextmanager
+def _open_mapped(path: str):
+    """
+    Memory-map a pattern file for reading, closing the map on exit.
+
+    Yields
+    ------
+    mmap.mmap | bytes
+        A read-only memory map of the file, or empty bytes for empty files
+        (which cannot be mapped).
+    """
+
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            yield b""
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            yield data
+
+
+def _iter_lines(data):
+    """Iterate over the lines of a memory map or bytes object without copying it whole."""
+
+    start = 0
+    end = len(data)
+    while start < end:
+        stop = data.find(b"\n", start)
+        if stop == -1:
+            stop = end
+        yield start, data[start:stop].rstrip(b"\r")
+        start = stop + 1
+
+
+class _RunWriter:
+    """
+    Writes runs of live cells into any grid, using the grid's `set_run`
+    method when it has one so that runs are stored without a per-cell call.
+    Bounded grids (those with a `grid_size`) reject cells outside the board.
+    """
+
+    def __init__(self, grid, x: int, y: int) -> None:
+        self.set_run = getattr(grid, "set_run", None)
+        self.set_cell = grid.set_cell
+        self.size = getattr(grid, "grid_size", None)
+        self.x = x
+        self.y = y
+
+    def write(self, x: int, y: int, length: int) -> None:
+        x += self.x
+        y += self.y
+        if self.size is not None and (
+            x < 0 or y < 0 or x + length > self.size or y >= self.size
+        ):
+            raise ValueError("Pattern does not fit in the grid.")
+
+        if self.set_run is not None:
+            self.set_run(x, y, length)
+        else:
+            for offset in range(length):
+                self.set_cell(x + offset, y, 1)
+
+
+def load_rle(path: str, grid, x: int = 0, y: int = 0) -> dict:
+    """
+    Decode an RLE pattern file into a grid.
+
+    The file is memory-mapped and its run-length tokens are decoded
+    directly into runs of live cells, so memory use does not grow with the
+    size of the pattern. Any cell state other than ``b`` counts as alive.
+
+    Parameters
+    ----------
+    path : str
+        Path to the ``.rle`` file.
+    grid
+        The grid to write live cells into. Dead cells are left untouched,
+        so the grid should start empty.
+    x : int, default=0
+        Column at which the pattern's left edge is placed.
+    y : int, default=0
+        Row at which the pattern's top edge is placed.
+
+    Returns
+    -------
+    dict
+        The ``width``, ``height`` and ``rule`` (or None) from the header.
+
+    Raises
+    ------
+    ValueError
+        If the header is missing or the pattern does not fit in the grid.
+    """
+
+    with _open_mapped(path) as data:
+        writer = _RunWriter(grid, x, y)
+
+        header = None
+        body_start = len(data)
+        for start, line in _iter_lines(data):
+            if line.startswith(b"#") or not line.strip():
+                continue
+            header = RLE_HEADER.match(line)
+            body_start = start + len(line)
+            break
+
+        if header is None:
+            raise ValueError("RLE file is missing its 'x = ..., y = ...' header.")
+
+        row = 0
+        column = 0
+        for match in RLE_TOKEN.finditer(data, body_start):
+            count = int(match.group(1) or 1)
+            tag = match.group(2)
+            if tag == b"!":
+                break
+            if tag == b"$":
+                row += count
+                column = 0
+            elif tag == b"b":
+                column += count
+            else:
+                writer.write(column, row, count)
+                column += count
+
+    rule = header.group(3)
+    return {
+        "width": int(header.group(1)),
+        "height": int(header.group(2)),
+        "rule": rule.decode() if rule else None,
+    }
+
+
+def load_plaintext(path: str, grid, x: int = 0, y: int = 0) -> dict:
+    """
+    Decode a plaintext (``.cells``) pattern file into a grid.
+
+    Lines starting with ``!`` are comments; every other line is a row where
+    ``O`` (or ``*``) marks a live cell and any other character a dead one.
+
+    Parameters
+    ----------
+    path : str
+        Path to the plaintext file.
+    grid
+        The grid to write live cells into. The grid should start empty.
+    x : int, default=0
+        Column at which the pattern's left edge is placed.
+    y : int, default=0
+        Row at which the pattern's top edge is placed.
+
+    Returns
+    -------
+    dict
+        The ``width`` and ``height`` of the pattern, and ``rule`` (None).
+
+    Raises
+    ------
+    ValueError
+        If the pattern does not fit in the grid.
+    """
+
+    with _open_mapped(path) as data:
+        writer = _RunWriter(grid, x, y)
+
+        row = 0
+        width = 0
+        for _, line in _iter_lines(data):
+            if line.startswith(b"!"):
+                continue
+            for match in PLAINTEXT_RUN.finditer(line):
+                writer.write(match.start(), row, match.end() - match.start())
+            width = max(width, len(line))
+            row += 1
+
+    return {"width": width, "height": row, "rule": None}
+
+
+def load_life106(path: str, grid, x: int = 0, y: int = 0) -> dict:
+    """
+    Decode a Life 1.06 pattern file into a grid.
+
+    Lines starting with ``#`` are headers or comments; every other line
+    holds the ``x y`` coordinates of one live cell, which may be negative.
+
+    Parameters
+    ----------
+    path : str
+        Path to the ``.lif`` file.
+    grid
+        The grid to write live cells into. The grid should start empty.
+    x : int, default=0
+        Offset added to every x-coordinate.
+    y : int, default=0
+        Offset added to every y-coordinate.
+
+    Returns
+    -------
+    dict
+        The ``width`` and ``height`` of the pattern's bounding box, and
+        ``rule`` (None).
+
+    Raises
+    ------
+    ValueError
+        If a line is malformed or a cell does not fit in the grid.
+    """
+
+    with _open_mapped(path) as data:
+        writer = _RunWriter(grid, x, y)
+
+        min_x = min_y = max_x = max_y = None
+        for _, line in _iter_lines(data):
+            if line.startswith(b"#") or not line.strip():
+                continue
+            match = LIFE_106_CELL.match(line)
+            if match is None:
+                raise ValueError(
+                    f"Invalid Life 1.06 line: {line.decode(errors='replace')!r}"
+                )
+
+            cell_x = int(match.group(1))
+            cell_y = int(match.group(2))
+            writer.write(cell_x, cell_y, 1)
+
+            if min_x is None:
+                min_x = max_x = cell_x
+                min_y = max_y = cell_y
+            else:
+                min_x, max_x = min(min_x, cell_x), max(max_x, cell_x)
+                min_y, max_y = min(min_y, cell_y), max(max_y, cell_y)
+
+    if min_x is None:
+        return {"width": 0, "height": 0, "rule": None}
+    return {"width": max_x - min_x + 1, "height": max_y - min_y + 1, "rule": None}
+
+
+def _pattern_format(path: str, format: str | None) -> str:
+    """Resolve a pattern format name from an explicit name or a file extension."""
+
+    if format is None:
+        format = FORMATS.get(os.path.splitext(path)[1].lower())
+        if format is None:
+            raise ValueError(f"Cannot determine pattern format of '{path}'.")
+    if format not in LOADERS:
+        raise ValueError(
+            f"Unknown pattern format '{format}'. Expected one of: {', '.join(LOADERS)}."
+        )
+    return format
+
+
+def load_pattern(
+    path: str, grid, x: int = 0, y: int = 0, format: str | None = None
+) -> dict:
+    """
+    Decode a pattern file into a grid, picking the format from its extension.
+
+    Parameters
+    ----------
+    path : str
+        Path to a ``.rle``, ``.cells``/``.txt`` or ``.lif``/``.life`` file.
+    grid
+        The grid to write live cells into. The grid should start empty.
+    x : int, default=0
+        Column offset of the pattern.
+    y : int, default=0
+        Row offset of the pattern.
+    format : str | None, default=None
+        One of ``"rle"``, ``"plaintext"`` or ``"life106"`` to override the
+        extension.
+
+    Returns
+    -------
+    dict
+        The ``width``, ``height`` and ``rule`` of the pattern.
+
+    Raises
+    ------
+    ValueError
+        If the format is unknown or the file cannot be decoded into the grid.
+    """
+
+    return LOADERS[_pattern_format(path, format)](path, grid, x, y)
+
+
+def _pattern_area(grid) -> tuple[int, int, int, int]:
+    """Return the (x, y, width, height) area of a grid to save."""
+
+    size = getattr(grid, "grid_size", None)
+    if size is not None:
+        return 0, 0, size, size
+
+    box = grid.bounding_box()
+    if box is None:
+        return 0, 0, 0, 0
+    min_x, min_y, max_x, max_y = box
+    return min_x, min_y, max_x - min_x + 1, max_y - min_y + 1
+
+
+def _row_runs(grid, x0: int, y: int, width: int):
+    """Yield (start, length) runs of live cells in one row of an area."""
+
+    get_cell = grid.get_cell
+    start = None
+    for x in range(width):
+        if get_cell(x0 + x, y):
+            if start is None:
+                start = x
+        elif start is not None:
+            yield start, x - start
+            start = None
+    if start is not None:
+        yield start, width - start
+
+
+def save_rle(grid, path: str, rule: str = "B3/S23") -> None:
+    """
+    Write a grid to an RLE pattern file.
+
+    Rows are encoded one at a time, and output lines are kept under 70
+    characters as recommended by the format.
+
+    Parameters
+    ----------
+    grid
+        A bounded grid (with `grid_size`) or a `SparseGrid`.
+    path : str
+        Destination path.
+    rule : str, default="B3/S23"
+        Rule written to the header.
+    """
+
+    x0, y0, width, height = _pattern_area(grid)
+
+    with open(path, "w", encoding="ascii") as f:
+        f.write(f"x = {width}, y = {height}, rule = {rule}\n")
+
+        line = []
+        line_length = 0
+
+        def emit(count: int, tag: str) -> None:
+            nonlocal line_length
+            token = f"{count}{tag}" if count > 1 else tag
+            if line_length + len(token) > 70:
+                f.write("".join(line) + "\n")
+                line.clear()
+                line_length = 0
+            line.append(token)
+            line_length += len(token)
+
+        current_row = 0
+        for y in range(height):
+            runs = list(_row_runs(grid, x0, y0 + y, width))
+            if not runs:
+                continue
+            if y > current_row:
+                emit(y - current_row, "$")
+                current_row = y
+
+            column = 0
+            for start, length in runs:
+                if start > column:
+                    emit(start - column, "b")
+                emit(length, "o")
+                column = start + length
+
+        emit(1, "!")
+        f.write("".join(line) + "\n")
+
+
+def save_plaintext(grid, path: str) -> None:
+    """
+    Write a grid to a plaintext (``.cells``) pattern file.
+
+    Parameters
+    ----------
+    grid
+        A bounded grid (with `grid_size`) or a `SparseGrid`.
+    path : str
+        Destination path.
+    """
+
+    x0, y0, width, height = _pattern_area(grid)
+
+    with open(path, "w", encoding="ascii") as f:
+        for y in range(height):
+            row = ["."] * width
+            for start, length in _row_runs(grid, x0, y0 + y, width):
+                row[start : start + length] = ["O"] * length
+            f.write("".join(row).rstrip(".") + "\n")
+
+
+def save_life106(grid, path: str) -> None:
+    """
+    Write a grid to a Life 1.06 pattern file.
+
+    Parameters
+    ----------
+    grid
+        A bounded grid (with `grid_size`) or a `SparseGrid`.
+    path : str
+        Destination path.
+    """
+
+    x0, y0, width, height = _pattern_area(grid)
+
+    with open(path, "w", encoding="ascii") as f:
+        f.write("#Life 1.06\n")
+        for y in range(height):
+            for start, length in _row_runs(grid, x0, y0 + y, width):
+                for x in range(start, start + length):
+                    f.write(f"{x0 + x} {y0 + y}\n")
+
+
+LOADERS = {"rle": load_rle, "plaintext": load_plaintext, "life106": load_life106}
+SAVERS = {"rle": save_rle, "plaintext": save_plaintext, "life106": save_life106}
+
+
+def save_pattern(grid, path: str, format: str | None = None, **options) -> None:
+    """
+    Write a grid to a pattern file, picking the format from its extension.
+
+    Parameters
+    ----------
+    grid
+        A bounded grid (with `grid_size`) or a `SparseGrid`.
+    path : str
+        Destination path.
+    format : str | None, default=None
+        One of ``"rle"``, ``"plaintext"`` or ``"life106"`` to override the
+        extension.
+    **options
+        Extra options for the writer, such as ``rule`` for RLE.
+    """
+
+    SAVERS[_pattern_format(path, format)](grid, path, **options)
@@ -1,4 +1,5 @@
 import sys
+import time
 
 BLACK = "\x1b[30m"
 WHITE = "\x1b[37m"
@@ -76,3 +77,219 @@ def refresh(grid) -> None:
     sys.stdout.write(f"\x1b[{lines}A")
     sys.stdout.write(output + "\n")
     sys.stdout.flush()
+
+
+class DiffRenderer:
+    """
+    An incremental terminal renderer that only redraws what changed.
+
+    The renderer keeps the last frame it drew as a list of half-block
+    cells. Each refresh compares the new frame against it row by row, and
+    only emits a cursor move and a glyph for changed half-block cells.
+    Consecutive changed cells are written without extra cursor moves, and
+    color codes are only emitted when the color differs from the previous
+    glyph, so runs of identical color share a single SGR sequence.
+
+    An optional frame-rate cap drops refreshes that arrive too soon after
+    the previous frame instead of sleeping, so it never blocks the
+    simulation; the next accepted frame is diffed against the last one
+    actually drawn.
+
+    Parameters
+    ----------
+    max_fps: float | None, default=None
+        Maximum number of frames drawn per second. None draws every frame.
+    origin_row: int, default=1
+        Terminal row (1-based) of the top of the frame.
+    origin_column: int, default=1
+        Terminal column (1-based) of the left of the frame.
+    stream: TextIO | None, default=None
+        Output stream. Defaults to `sys.stdout`.
+    """
+
+    def __init__(
+        self,
+        max_fps: float | None = None,
+        origin_row: int = 1,
+        origin_column: int = 1,
+        stream=None,
+    ) -> None:
+        self.min_interval = 1 / max_fps if max_fps else 0.0
+        self.origin_row = origin_row
+        self.origin_column = origin_column
+        self.stream = stream if stream is not None else sys.stdout
+
+        self._frame = None
+        self._last_draw = None
+
+    def invalidate(self) -> None:
+        """Forget the last frame, so the next refresh redraws everything."""
+
+        self._frame = None
+
+    def refresh(self, grid) -> bool:
+        """
+        Draw the changes between the last frame and the current grid state.
+
+        Parameters
+        ----------
+        grid: Grid
+            A Grid instance providing `grid_size` and a `get_cell(x, y)` method.
+
+        Returns
+        -------
+        bool
+            True if the frame was drawn, False if it was dropped by the
+            frame-rate cap.
+        """
+
+        now = time.monotonic()
+        if self._last_draw is not None and now - self._last_draw < self.min_interval:
+            return False
+        self._last_draw = now
+
+        frame = grid_to_cells(grid)
+        output = self.render_diff(frame)
+        self._frame = frame
+
+        self.stream.write(output)
+        self.stream.flush()
+        return True
+
+    def render_diff(self, frame: list[list[int]]) -> str:
+        """
+        Build the escape sequences that turn the last frame into `frame`.
+
+        Parameters
+        ----------
+        frame: list[list[int]]
+            Half-block cells as produced by `grid_to_cells`.
+
+        Returns
+        -------
+        str
+            Cursor moves, color codes and glyphs for the changed cells,
+            followed by a color reset and a cursor move below the frame.
+        """
+
+        previous = self._frame
+        if previous is not None and (
+            len(previous) != len(frame) or len(previous[0]) != len(frame[0])
+        ):
+            previous = None
+
+        parts = []
+        fg = bg = None
+        for row_index, row in enumerate(frame):
+            previous_row = previous[row_index] if previous is not None else None
+            if row == previous_row:
+                continue
+
+            cursor = None
+            for column, cell in enumerate(row):
+                if previous_row is not None and previous_row[column] == cell:
+                    continue
+
+                if cursor != column:
+                    parts.append(
+                        f"\x1b[{self.origin_row + row_index};"
+                        f"{self.origin_column + column}H"
+                    )
+
+                new_fg = WHITE if cell & 2 else BLACK
+                new_bg = WHITE_BG if cell & 1 else BLACK_BG
+                if new_fg != fg:
+                    parts.append(new_fg)
+                    fg = new_fg
+                if new_bg != bg:
+                    parts.append(new_bg)
+                    bg = new_bg
+
+                parts.append(BLOCK)
+                cursor = column + 1
+
+        parts.append(RESET)
+        parts.append(f"\x1b[{self.origin_row + len(frame)};1H")
+        return "".join(parts)
+
+
+def grid_to_cells(grid) -> list[list[int]]:
+    """
+    Convert a Grid object into rows of half-block cells.
+
+    Each entry encodes the top cell in bit 1 and the bottom cell in bit 0,
+    matching the layout drawn by `grid_to_string`.
+
+    Parameters
+    ----------
+    grid: Grid
+        A Grid instance providing `grid_size` and a `get_cell(x, y)` method.
+
+    Returns
+    -------
+    list[list[int]]
+        One list per terminal row, each holding a value from 0 to 3 per column.
+    """
+
+    size = grid.grid_size
+    rows = []
+
+    for y in range(0, size, 2):
+        top = _row_states(grid, y, size)
+        if y + 1 < size:
+            bottom = _row_states(grid, y + 1, size)
+            rows.append([upper * 2 + lower for upper, lower in zip(top, bottom)])
+        else:
+            rows.append([upper * 2 for upper in top])
+
+    return rows
+
+
+def _row_states(grid, y: int, size: int) -> list[int]:
+    """
+    Read the states of one row of a bounded grid at once.
+
+    The NumPy, packed and dense engines are read from their cell storage
+    directly; any other grid falls back to one `get_cell` call per cell.
+    """
+
+    if hasattr(grid, "cells"):
+        return grid.cells[y].tolist()
+    if hasattr(grid, "rows"):
+        bits = format(grid.rows[y], f"0{size}b")[::-1]
+        return list(map(int, bits[:size]))
+    if hasattr(grid, "grid"):
+        return grid.grid[y * size : (y + 1) * size]
+
+    get_cell = grid.get_cell
+    return [get_cell(x, y) for x in range(size)]
+
+
+class Viewport:
+    """
+    A square window onto an unbounded grid, such as `SparseGrid` or
+    `HashLife`, exposing the `grid_size` and `get_cell(x, y)` surface
+    expected by the renderer.
+
+    Parameters
+    ----------
+    source
+        Any object providing a `get_cell(x, y)` method on the plane.
+    x: int, default=0
+        The x-coordinate of the window's top-left corner on the plane.
+    y: int, default=0
+        The y-coordinate of the window's top-left corner on the plane.
+    grid_size: int, default=50
+        Width and height of the window.
+    """
+
+    def __init__(self, source, x: int = 0, y: int = 0, grid_size: int = 50) -> None:
+        self.source = source
+        self.x = x
+        self.y = y
+        self.grid_size = grid_size
+
+    def get_cell(self, x: int, y: int) -> int:
+        """Retrieve the state of the cell at (x, y) relative to the window."""
+
+        return self.source.get_cell(self.x + x, self.y + y)
@@ -1,3 +1,9 @@
+import functools
+
+# Number of distinct rules whose parsed form, table and function are cached.
+RULE_CACHE_SIZE = 4096
+
+
 class RuleSet:
     """
     Represents a Life-like cellular automaton ruleset.
@@ -11,9 +17,18 @@ class RuleSet:
         B36/S23 - HighLife
         B34/S34 - 34-Life
 
-    The rule string is compiled into a small Python function.
-    That function is then called at runtime
-    to determine the state transition for each cell during grid evolution.
+    The rule is compiled into a next-state `table` of 18 entries indexed
+    by ``alive * 9 + neighbors``, and into 9-bit `birth_mask` and
+    `survive_mask` integers where bit ``n`` is set when ``n`` neighbors
+    cause a birth or survival. The engines evolve cells with these.
+
+    `rule_func`, a small Python function generated from the rule string and
+    used by `evaluate`, is only compiled the first time it is accessed.
+
+    Parsed rules and tables are kept in LRU caches of `RULE_CACHE_SIZE`
+    entries, keyed by the rule string as given and by the masks, so
+    creating many RuleSets for the same rule neither parses it again nor
+    builds another table, and sweeping many rules keeps memory bounded.
     """
 
     def __init__(self, dsl_rule: str = None) -> None:
@@ -36,11 +51,112 @@ class RuleSet:
 
         if dsl_rule is None:
             raise ValueError("Must provide a rule string (e.g. 'B3/S23')")
-        self.rule_func = RuleSet.compile_life_rule(dsl_rule)
+        (
+            self.birth,
+            self.survive,
+            self.rule,
+            self.birth_mask,
+            self.survive_mask,
+        ) = _parse_cached(dsl_rule)
+        self.table = _table_cached(self.birth_mask, self.survive_mask)
+
+    @property
+    def rule_func(self):
+        """The function generated by `compile_life_rule`, compiled on first use."""
+        return _rule_func_cached(self.rule)
 
     def evaluate(self, is_alive: bool, neighbors: int) -> str:
         return self.rule_func(is_alive, neighbors)
 
+    @staticmethod
+    def parse_life_rule(rule_str: str) -> tuple[set[int], set[int]]:
+        """
+        Parse a Life-like rule string into its birth and survival counts.
+
+        Parameters
+        ----------
+        rule_str : str
+            A rule in the standard Life-like notation, e.g. ``"B3/S23"``.
+
+        Returns
+        -------
+        tuple[set[int], set[int]]
+            The neighbor counts at which dead cells are born, and the
+            neighbor counts at which live cells survive.
+
+        Raises
+        ------
+        ValueError
+            If the rule does not follow the required ``B.../S...`` format.
+        """
+
+        rule_str = rule_str.strip().upper()
+        if not rule_str.startswith("B"):
+            raise ValueError("Rule must start with a B (Birth).")
+
+        try:
+            born_part, survive_part = rule_str.split("/")
+        except ValueError:
+            raise ValueError("Rule must be in 'B.../S...' format.")
+
+        if not survive_part.startswith("S"):
+            raise ValueError("Rule must start with an S (Survive).")
+
+        born = {int(n) for n in born_part[1:]}
+        survive = {int(n) for n in survive_part[1:]}
+
+        if any(n > 8 for n in born | survive):
+            raise ValueError("Neighbor counts must be between 0 and 8.")
+
+        return born, survive
+
+    @staticmethod
+    def format_life_rule(born: set[int], survive: set[int]) -> str:
+        """
+        Format birth and survival counts as a normalized rule string.
+
+        Parameters
+        ----------
+        born : set[int]
+            Neighbor counts at which dead cells are born.
+        survive : set[int]
+            Neighbor counts at which live cells survive.
+
+        Returns
+        -------
+        str
+            The rule in ``"Bxxx/Syyy"`` notation with sorted digits.
+        """
+
+        born_digits = "".join(str(n) for n in sorted(born))
+        survive_digits = "".join(str(n) for n in sorted(survive))
+        return f"B{born_digits}/S{survive_digits}"
+
+    @staticmethod
+    def compile_transition_table(born: set[int], survive: set[int]) -> bytes:
+        """
+        Compile birth and survival counts into a next-state table.
+
+        Parameters
+        ----------
+        born : set[int]
+            Neighbor counts at which dead cells are born.
+        survive : set[int]
+            Neighbor counts at which live cells survive.
+
+        Returns
+        -------
+        bytes
+            18 next states (0 or 1) indexed by ``alive * 9 + neighbors``.
+        """
+
+        table = bytearray(18)
+        for n in born:
+            table[n] = 1
+        for n in survive:
+            table[9 + n] = 1
+        return bytes(table)
+
     @staticmethod
     def compile_life_rule(rule_str: str):
         """
@@ -77,20 +193,7 @@ class RuleSet:
             If the rule does not follow the required ``B.../S...`` format.
         """
 
-        rule_str = rule_str.strip().upper()
-        if not rule_str.startswith("B"):
-            raise ValueError("Rule must start with a B (Birth).")
-
-        try:
-            born_part, survive_part = rule_str.split("/")
-        except ValueError:
-            raise ValueError("Rule must be in 'B.../S...' format.")
-
-        if not survive_part.startswith("S"):
-            raise ValueError("Rule must start with an S (Survive).")
-
-        born = {int(n) for n in born_part[1:]}
-        survive = {int(n) for n in survive_part[1:]}
+        born, survive = RuleSet.parse_life_rule(rule_str)
 
         src = f"""
 def rule(is_alive: bool, neighbors: int) -> str:
@@ -104,3 +207,34 @@ def rule(is_alive: bool, neighbors: int) -> str:
         scope = {}
         exec(src, scope)
         return scope["rule"]
+
+
+@functools.lru_cache(maxsize=RULE_CACHE_SIZE)
+def _parse_cached(dsl_rule: str) -> tuple:
+    """Parse a rule string into (birth, survive, rule, birth_mask, survive_mask)."""
+
+    birth, survive = RuleSet.parse_life_rule(dsl_rule)
+    return (
+        frozenset(birth),
+        frozenset(survive),
+        RuleSet.format_life_rule(birth, survive),
+        sum(1 << n for n in birth),
+        sum(1 << n for n in survive),
+    )
+
+
+@functools.lru_cache(maxsize=RULE_CACHE_SIZE)
+def _table_cached(birth_mask: int, survive_mask: int) -> bytes:
+    """Build the transition table of a rule from its birth and survival masks."""
+
+    return RuleSet.compile_transition_table(
+        {n for n in range(9) if (birth_mask >> n) & 1},
+        {n for n in range(9) if (survive_mask >> n) & 1},
+    )
+
+
+@functools.lru_cache(maxsize=RULE_CACHE_SIZE)
+def _rule_func_cached(rule: str):
+    """Compile the function of a normalized rule string."""
+
+    return RuleSet.compile_life_rule(rule)
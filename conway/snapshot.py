@@ -0,0 +1,315 @@
+import mmap
+import os
+import struct
+import zlib
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from grid import Grid
+from packed import PackedGrid
+from vectorized import NumpyGrid
+
+MAGIC = b"CWSN"
+VERSION = 1
+
+# Magic, version, flags, grid size, generation and rule length.
+HEADER = struct.Struct("<4sHHIQH")
+FLAG_WRAP = 1
+FLAG_ZLIB = 2
+
+# The payload starts at a multiple of this offset so that it can be viewed
+# as an aligned array.
+PAYLOAD_ALIGNMENT = 8
+
+
+def row_bytes(grid_size: int) -> int:
+    """Return the number of bytes used to store one row of a snapshot."""
+
+    return (grid_size + 7) // 8
+
+
+def _packed_rows(grid):
+    """
+    Yield the rows of a bounded grid as little-endian bitsets.
+
+    Bit ``x`` of each row holds the cell at column ``x``, matching the
+    layout of `PackedGrid.rows`.
+    """
+
+    size = grid.grid_size
+    if isinstance(grid, PackedGrid):
+        yield from grid.rows
+    elif isinstance(grid, NumpyGrid):
+        # Converting through packbits avoids a Python-level loop per cell.
+        packed = np.packbits(grid.cells, axis=1, bitorder="little")
+        for row in packed:
+            yield int.from_bytes(row.tobytes(), "little")
+    elif isinstance(grid, Grid):
+        cells = grid.grid
+        for y in range(size):
+            bits = "".join(
+                "1" if state else "0" for state in cells[y * size : (y + 1) * size]
+            )
+            yield int(bits[::-1] or "0", 2)
+    else:
+        raise TypeError(f"Cannot snapshot a grid of type {type(grid).__name__}.")
+
+
+def save_snapshot(
+    grid, path: str, rule: str = "B3/S23", generation: int = 0, compress: bool = False
+) -> None:
+    """
+    Write the state of a bounded grid to a binary snapshot file.
+
+    The file starts with a header holding the board size, wrap mode, rule
+    and generation, followed by the cells bit-packed one row at a time
+    (``ceil(grid_size / 8)`` bytes per row, bit ``x`` of a row holding
+    column ``x``). A 10^8-cell board therefore takes about 12 MB. Rows are
+    written as they are packed, so the whole payload is never held in
+    memory at once.
+
+    Parameters
+    ----------
+    grid : Grid | PackedGrid | NumpyGrid
+        The grid to save. Unbounded grids such as `SparseGrid` are not
+        supported; save them with `patterns.save_pattern` instead.
+    path : str
+        Destination path.
+    rule : str, default="B3/S23"
+        Rule the grid is evolved with.
+    generation : int, default=0
+        Generation number of the current state.
+    compress : bool, default=False
+        Whether to deflate the payload with zlib. Compressed snapshots are
+        much smaller for sparse boards but cannot be memory-mapped.
+
+    Raises
+    ------
+    TypeError
+        If the grid type cannot be snapshotted.
+    """
+
+    size = grid.grid_size
+    width = row_bytes(size)
+    rule_bytes = rule.encode("ascii")
+
+    flags = FLAG_WRAP if grid.grid_wrap else 0
+    if compress:
+        flags |= FLAG_ZLIB
+
+    header = HEADER.pack(MAGIC, VERSION, flags, size, generation, len(rule_bytes))
+    header += rule_bytes
+    header += b"\0" * (-len(header) % PAYLOAD_ALIGNMENT)
+
+    with open(path, "wb") as f:
+        f.write(header)
+        compressor = zlib.compressobj() if compress else None
+        for row in _packed_rows(grid):
+            data = row.to_bytes(width, "little")
+            f.write(compressor.compress(data) if compressor else data)
+        if compressor:
+            f.write(compressor.flush())
+
+
+class Snapshot:
+    """
+    A snapshot file opened for reading.
+
+    The file is memory-mapped and `payload` is a view into the mapping, so
+    opening even a very large snapshot reads nothing but the header; rows
+    are paged in from disk as they are accessed. Compressed snapshots are
+    decompressed into memory instead.
+
+    Parameters
+    ----------
+    path : str
+        Path to a file written by `save_snapshot`.
+
+    Raises
+    ------
+    ValueError
+        If the file is not a snapshot or its payload is truncated.
+    """
+
+    def __init__(self, path: str) -> None:
+        with open(path, "rb") as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        try:
+            if len(self._map) < HEADER.size:
+                raise ValueError(f"'{path}' is not a snapshot file.")
+            magic, version, flags, size, generation, rule_length = HEADER.unpack_from(
+                self._map
+            )
+            if magic != MAGIC:
+                raise ValueError(f"'{path}' is not a snapshot file.")
+            if version != VERSION:
+                raise ValueError(f"Unsupported snapshot version {version}.")
+        except ValueError:
+            self._map.close()
+            raise
+
+        self.grid_size = size
+        self.grid_wrap = bool(flags & FLAG_WRAP)
+        self.compressed = bool(flags & FLAG_ZLIB)
+        self.generation = generation
+        self.row_bytes = row_bytes(size)
+
+        rule_start = HEADER.size
+        rule_end = rule_start + rule_length
+        self.rule = self._map[rule_start:rule_end].decode("ascii")
+
+        payload_start = rule_end + (-rule_end % PAYLOAD_ALIGNMENT)
+        if self.compressed:
+            self.payload = memoryview(zlib.decompress(self._map[payload_start:]))
+        else:
+            self.payload = memoryview(self._map)[payload_start:]
+
+        if len(self.payload) < size * self.row_bytes:
+            self.close()
+            raise ValueError(f"Snapshot '{path}' is truncated.")
+
+    def row(self, y: int) -> int:
+        """Return row ``y`` as a bitset, with bit ``x`` holding column ``x``."""
+
+        start = y * self.row_bytes
+        return int.from_bytes(self.payload[start : start + self.row_bytes], "little")
+
+    def get_cell(self, x: int, y: int) -> int:
+        """Return the state of the cell at (x, y) without loading the board."""
+
+        return (self.payload[y * self.row_bytes + (x >> 3)] >> (x & 7)) & 1
+
+    def array(self):
+        """
+        Return the payload as a ``(grid_size, row_bytes)`` ``uint8`` array.
+
+        The array is a view of the memory-mapped file, not a copy. It must be
+        released before the snapshot is closed.
+        """
+
+        if np is None:
+            raise ImportError("Snapshot.array requires NumPy to be installed.")
+
+        rows = np.frombuffer(
+            self.payload, dtype=np.uint8, count=self.grid_size * self.row_bytes
+        )
+        return rows.reshape(self.grid_size, self.row_bytes)
+
+    def load_into(self, grid) -> None:
+        """
+        Copy the snapshot's cells into a bounded grid of the same size.
+
+        Parameters
+        ----------
+        grid : Grid | PackedGrid | NumpyGrid
+            The grid to overwrite.
+
+        Raises
+        ------
+        ValueError
+            If the grid size does not match the snapshot.
+        TypeError
+            If the grid type is not supported.
+        """
+
+        size = self.grid_size
+        if grid.grid_size != size:
+            raise ValueError(
+                f"Grid size {grid.grid_size} does not match snapshot size {size}."
+            )
+
+        if isinstance(grid, PackedGrid):
+            grid.rows = [self.row(y) & grid.row_mask for y in range(size)]
+        elif isinstance(grid, NumpyGrid):
+            # Written in place, as ParallelGrid keeps its cells in shared memory.
+            rows = self.array()
+            grid.cells[:] = np.unpackbits(rows, axis=1, count=size, bitorder="little")
+            del rows
+        elif isinstance(grid, Grid):
+            cells = []
+            for y in range(size):
+                bits = format(self.row(y), f"0{size}b")[::-1]
+                cells.extend(1 if bit == "1" else 0 for bit in bits[:size])
+            grid.grid = cells
+        else:
+            raise TypeError(f"Cannot load a snapshot into {type(grid).__name__}.")
+
+    def close(self) -> None:
+        """Release the payload view and unmap the file."""
+
+        self.payload.release()
+        self._map.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+
+class Checkpointer:
+    """
+    Saves a snapshot of a running simulation every `interval` generations.
+
+    Snapshots are first written to a temporary file and then moved over
+    `path`, so an interruption while saving never leaves a corrupt
+    checkpoint behind.
+
+    Parameters
+    ----------
+    path : str
+        Path of the checkpoint file, overwritten on every save.
+    interval : int
+        Number of generations between checkpoints.
+    rule : str
+        Rule stored in the snapshots.
+    generation : int, default=0
+        Generation of the grid when checkpointing starts, such as the
+        generation of a snapshot the run was resumed from.
+    compress : bool, default=False
+        Whether to write compressed snapshots.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        interval: int,
+        rule: str,
+        generation: int = 0,
+        compress: bool = False,
+    ) -> None:
+        if interval < 1:
+            raise ValueError("Checkpoint interval must be at least 1.")
+
+        self.path = path
+        self.interval = interval
+        self.rule = rule
+        self.generation = generation
+        self.compress = compress
+
+    def update(self, grid) -> bool:
+        """
+        Account for one call to `grid.evolve`, saving a checkpoint when due.
+
+        Returns
+        -------
+        bool
+            True if a checkpoint was written.
+        """
+
+        self.generation += 1
+        if self.generation % self.interval:
+            return False
+        self.save(grid)
+        return True
+
+    def save(self, grid) -> None:
+        """Write a checkpoint of the grid's current state."""
+
+        temporary = self.path + ".tmp"
+        save_snapshot(grid, temporary, self.rule, self.generation, self.compress)
+        os.replace(temporary, self.path)
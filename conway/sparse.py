@@ -0,0 +1,248 @@
+NEIGHBOR_OFFSETS = tuple((dx, dy) for dy in (-1, 0, 1) for dx in (-1, 0, 1) if dx or dy)
+
+
+class SparseGrid:
+    """
+    An unbounded, sparse cellular automaton grid that only stores live cells.
+
+    Live cells are kept as a set of (x, y) coordinates on an infinite plane,
+    so there is no `grid_size` and no wrapping. Each generation only visits
+    the live cells and their neighbors (the frontier), so the cost scales
+    with the population rather than with the area of the board.
+
+    Births and deaths are recorded while `evolve` applies the rule, and the
+    number of live cells in every row and column is kept up to date from
+    them, so `changes` and `bounding_box` never walk the live cells. Edit
+    cells through `set_cell` or `set_run` so the counts stay correct.
+
+    To draw a sparse grid with the renderer, wrap it in a
+    `renderer.Viewport` that selects the square window to display.
+
+    Parameters
+    ----------
+    cells: Iterable[tuple[int, int]] | None
+        Optional coordinates of the initially live cells. If omitted, the
+        grid is initialized with a glider pattern.
+    """
+
+    def __init__(self, cells=None) -> None:
+        if cells is None:
+            cells = [(1, 0), (2, 1), (0, 2), (1, 2), (2, 2)]
+
+        self.cells = set(cells)
+        self._births = []
+        self._deaths = []
+        # Live cells per column (x) and per row (y); lines without any are
+        # removed, so the keys span the bounding box.
+        self._columns = {}
+        self._rows = {}
+        for x, y in self.cells:
+            self._count(x, y, 1)
+
+    @property
+    def population(self) -> int:
+        """The number of live cells."""
+
+        return len(self.cells)
+
+    def set_cell(self, x: int, y: int, state: int) -> None:
+        """
+        Set the state of a specific cell on the plane.
+
+        Parameters
+        ----------
+        x: int
+            The x-coordinate (column index) of the cell.
+        y: int
+            The y-coordinate (row index) of the cell.
+        state: int
+            The new state of the cell: 1 for alive, 0 for dead.
+        """
+
+        if state and (x, y) not in self.cells:
+            self.cells.add((x, y))
+            self._count(x, y, 1)
+        elif not state and (x, y) in self.cells:
+            self.cells.discard((x, y))
+            self._count(x, y, -1)
+
+    def set_run(self, x: int, y: int, length: int, state: int = 1) -> None:
+        """
+        Set the state of a horizontal run of cells in one row.
+
+        Parameters
+        ----------
+        x: int
+            The x-coordinate of the first cell in the run.
+        y: int
+            The y-coordinate (row index) of the run.
+        length: int
+            The number of cells in the run.
+        state: int, default=1
+            The new state of the cells: 1 for alive, 0 for dead.
+        """
+
+        for offset in range(length):
+            self.set_cell(x + offset, y, state)
+
+    def _count(self, x: int, y: int, delta: int) -> None:
+        """Add `delta` to the live-cell counts of column `x` and row `y`."""
+
+        for counts, line in ((self._columns, x), (self._rows, y)):
+            count = counts.get(line, 0) + delta
+            if count:
+                counts[line] = count
+            else:
+                del counts[line]
+
+    def get_cell(self, x: int, y: int) -> int:
+        """
+        Retrieve the state of a cell on the plane.
+
+        Parameters
+        ----------
+        x : int
+            The x-coordinate of the cell to retrieve.
+        y : int
+            The y-coordinate of the cell to retrieve.
+
+        Returns
+        -------
+        int
+            The state of the cell at (x, y): 1 if alive, 0 if dead.
+        """
+
+        return 1 if (x, y) in self.cells else 0
+
+    def count_neighbors(self, x: int, y: int) -> int:
+        """
+        Count the number of alive neighbors surrounding the cell at (x, y).
+
+        Parameters
+        ----------
+        x : int
+            The x-coordinate of the target cell.
+        y : int
+            The y-coordinate of the target cell.
+
+        Returns
+        -------
+        int
+            The number of neighboring cells that are alive.
+        """
+
+        cells = self.cells
+        return sum((x + dx, y + dy) in cells for dx, dy in NEIGHBOR_OFFSETS)
+
+    def bounding_box(self) -> tuple[int, int, int, int] | None:
+        """
+        Compute the smallest rectangle containing every live cell.
+
+        The box is read from the per-row and per-column live-cell counts, so
+        it costs time proportional to the number of occupied rows and
+        columns rather than to the population.
+
+        Returns
+        -------
+        tuple[int, int, int, int] | None
+            ``(min_x, min_y, max_x, max_y)`` (inclusive), or None if the
+            grid is empty.
+        """
+
+        if not self._rows:
+            return None
+
+        return min(self._columns), min(self._rows), max(self._columns), max(self._rows)
+
+    def evolve(self, ruleset) -> None:
+        """
+        Advance the grid by one generation using the provided ruleset.
+
+        Every live cell adds one to the neighbor count of each of its eight
+        neighbors. Only cells that received a count (plus live cells with no
+        neighbors, for rules that let those survive) can be alive in the next
+        generation, so nothing outside the frontier is visited.
+
+        Parameters
+        ----------
+        ruleset : RuleSet
+            A `RuleSet` object providing its compiled transition `table`.
+
+        Raises
+        ------
+        ValueError
+            If the ruleset contains ``B0``, which would fill the infinite plane.
+        """
+
+        table = ruleset.table
+        if table[0]:
+            raise ValueError("SparseGrid does not support rules containing B0.")
+
+        cells = self.cells
+
+        counts = {}
+        for x, y in cells:
+            for dx, dy in NEIGHBOR_OFFSETS:
+                key = (x + dx, y + dy)
+                counts[key] = counts.get(key, 0) + 1
+
+        new_cells = set()
+        births = []
+        deaths = []
+        for cell, count in counts.items():
+            alive = cell in cells
+            if table[alive * 9 + count]:
+                new_cells.add(cell)
+                if not alive:
+                    births.append(cell)
+            elif alive:
+                deaths.append(cell)
+
+        # Live cells without live neighbors received no count.
+        isolated = [cell for cell in cells if cell not in counts]
+        if table[9]:
+            new_cells.update(isolated)
+        else:
+            deaths.extend(isolated)
+
+        columns = self._columns
+        rows = self._rows
+        for x, y in births:
+            columns[x] = columns.get(x, 0) + 1
+            rows[y] = rows.get(y, 0) + 1
+        for x, y in deaths:
+            columns[x] -= 1
+            if not columns[x]:
+                del columns[x]
+            rows[y] -= 1
+            if not rows[y]:
+                del rows[y]
+
+        self._births = births
+        self._deaths = deaths
+        self.cells = new_cells
+
+    def changes(self) -> tuple[list[int], list[int]]:
+        """
+        Return the cells that changed during the last call to `evolve`.
+
+        The births and deaths are the ones recorded by `evolve`. Cells are
+        identified by `cell_id`, since the plane has no flat index. Changes
+        made through `set_cell` are not included.
+
+        Returns
+        -------
+        tuple[list[int], list[int]]
+            The ids of cells that were born, and of cells that died.
+        """
+
+        return (
+            [cell_id(x, y) for x, y in self._births],
+            [cell_id(x, y) for x, y in self._deaths],
+        )
+
+
+def cell_id(x: int, y: int) -> int:
+    """Pack plane coordinates into a single 64-bit integer id."""
+
+    return ((x & 0xFFFFFFFF) << 32) | (y & 0xFFFFFFFF)
@@ -0,0 +1,289 @@
+import csv
+import time
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+STATS_FIELDS = [
+    "generation",
+    "population",
+    "births",
+    "deaths",
+    "min_x",
+    "min_y",
+    "max_x",
+    "max_y",
+    "step_seconds",
+    "render_seconds",
+]
+
+
+class GenerationStats:
+    """
+    Measurements of one generation of a run.
+
+    Attributes
+    ----------
+    generation : int
+        Number of the generation, counted from the start of the run.
+    population : int
+        Live cells after the step.
+    births : int
+        Cells born during the step.
+    deaths : int
+        Cells that died during the step.
+    bounding_box : tuple[int, int, int, int] | None
+        ``(min_x, min_y, max_x, max_y)`` of the live cells, or None if the
+        board is empty.
+    step_seconds : float
+        Wall time spent in `evolve`.
+    render_seconds : float
+        Wall time spent drawing the generation (0 when not rendering).
+    """
+
+    def __init__(
+        self,
+        generation: int,
+        population: int,
+        births: int,
+        deaths: int,
+        bounding_box: tuple[int, int, int, int] | None,
+        step_seconds: float,
+        render_seconds: float = 0.0,
+    ) -> None:
+        self.generation = generation
+        self.population = population
+        self.births = births
+        self.deaths = deaths
+        self.bounding_box = bounding_box
+        self.step_seconds = step_seconds
+        self.render_seconds = render_seconds
+
+    def as_dict(self) -> dict:
+        """Return the stats as a flat dict with the keys in `STATS_FIELDS`."""
+
+        min_x, min_y, max_x, max_y = self.bounding_box or (None, None, None, None)
+        return {
+            "generation": self.generation,
+            "population": self.population,
+            "births": self.births,
+            "deaths": self.deaths,
+            "min_x": min_x,
+            "min_y": min_y,
+            "max_x": max_x,
+            "max_y": max_y,
+            "step_seconds": self.step_seconds,
+            "render_seconds": self.render_seconds,
+        }
+
+
+def _line_counts(grid) -> tuple[list[int], list[int]]:
+    """Count the live cells in every row and every column of a bounded grid."""
+
+    size = grid.grid_size
+    if hasattr(grid, "cells"):
+        cells = grid.cells
+        return cells.sum(axis=1).tolist(), cells.sum(axis=0).tolist()
+
+    rows = [0] * size
+    columns = [0] * size
+    for y in range(size):
+        for x in range(size):
+            if grid.get_cell(x, y):
+                rows[y] += 1
+                columns[x] += 1
+    return rows, columns
+
+
+def _tally(rows: list[int], columns: list[int], cells, size: int, delta: int) -> None:
+    """Add `delta` to the row and column counts of every cell in `cells`."""
+
+    if np is not None and isinstance(cells, np.ndarray):
+        for y, count in zip(*np.unique(cells // size, return_counts=True)):
+            rows[y] += delta * int(count)
+        for x, count in zip(*np.unique(cells % size, return_counts=True)):
+            columns[x] += delta * int(count)
+        return
+
+    for cell in cells:
+        y, x = divmod(cell, size)
+        rows[y] += delta
+        columns[x] += delta
+
+
+def _span(counts: list[int]) -> tuple[int, int] | None:
+    """Return the first and last index with a non-zero count."""
+
+    first = next((i for i, count in enumerate(counts) if count), None)
+    if first is None:
+        return None
+    last = (
+        len(counts) - 1 - next(i for i, count in enumerate(reversed(counts)) if count)
+    )
+    return first, last
+
+
+class StatsCollector:
+    """
+    Evolves a grid while gathering per-generation statistics for observers.
+
+    Population, births and deaths are derived from the cells the grid
+    reports through `changes`. `Grid` and `SparseGrid` record them while
+    applying the rule, and `NumpyGrid` and `ParallelGrid` mark them in the
+    rule lookup itself, so `changes` only extracts their indices.
+    `PackedGrid` derives them by XOR-ing each row with its previous state,
+    one integer operation per row. The bounding box comes from live-cell
+    counts per row and column that are adjusted by the same changes, so
+    after `reset` the board is never scanned again. Unbounded grids, which
+    have no rows to count, use their own `bounding_box`, which `SparseGrid`
+    keeps from running row and column counts as well.
+
+    Observers are callables receiving one `GenerationStats` per generation.
+
+    Parameters
+    ----------
+    observers : list | None, default=None
+        Callables to notify after every generation.
+    """
+
+    def __init__(self, observers=None) -> None:
+        self.observers = list(observers or [])
+        self.generation = 0
+        self.population = 0
+        self._grid = None
+        self._rows = None
+        self._columns = None
+
+    def add_observer(self, observer) -> None:
+        """Register a callable to receive the `GenerationStats` of each step."""
+
+        self.observers.append(observer)
+
+    def reset(self, grid) -> None:
+        """
+        Start collecting statistics for a grid from its current state.
+
+        This is the only time a bounded board is scanned. Call it again
+        after editing cells directly instead of through `evolve`.
+        """
+
+        self._grid = grid
+        self.generation = 0
+        self.population = grid.population
+        if hasattr(grid, "grid_size"):
+            self._rows, self._columns = _line_counts(grid)
+        else:
+            self._rows = self._columns = None
+
+    def bounding_box(self) -> tuple[int, int, int, int] | None:
+        """Return ``(min_x, min_y, max_x, max_y)`` of the live cells, or None."""
+
+        if self._rows is None:
+            return self._grid.bounding_box()
+
+        rows = _span(self._rows)
+        if rows is None:
+            return None
+        columns = _span(self._columns)
+        return columns[0], rows[0], columns[1], rows[1]
+
+    def evolve(self, grid, ruleset, render=None) -> GenerationStats:
+        """
+        Advance the grid by one generation and notify the observers.
+
+        Parameters
+        ----------
+        grid
+            Any grid providing `evolve`, `population` and `changes()`.
+            `reset` is called automatically for a grid not seen before.
+        ruleset : RuleSet
+            The rule to evolve the grid with.
+        render : Callable[[], object] | None, default=None
+            Called after the step to draw the board; its wall time is
+            reported as ``render_seconds``.
+
+        Returns
+        -------
+        GenerationStats
+            The statistics passed to the observers.
+        """
+
+        if grid is not self._grid:
+            self.reset(grid)
+
+        start = time.perf_counter()
+        grid.evolve(ruleset)
+        step_seconds = time.perf_counter() - start
+
+        births, deaths = grid.changes()
+        self.population += len(births) - len(deaths)
+        self.generation += 1
+        if self._rows is not None:
+            size = grid.grid_size
+            _tally(self._rows, self._columns, births, size, 1)
+            _tally(self._rows, self._columns, deaths, size, -1)
+
+        render_seconds = 0.0
+        if render is not None:
+            start = time.perf_counter()
+            render()
+            render_seconds = time.perf_counter() - start
+
+        stats = GenerationStats(
+            self.generation,
+            self.population,
+            len(births),
+            len(deaths),
+            self.bounding_box(),
+            step_seconds,
+            render_seconds,
+        )
+        for observer in self.observers:
+            observer(stats)
+        return stats
+
+
+class StatsRecorder:
+    """
+    An observer that writes sampled generation statistics to a CSV file.
+
+    Only every `every`-th generation is written, which keeps the file small
+    for long production runs while still showing where time is spent.
+    Rows are flushed as they are written, so the file can be followed while
+    the simulation runs.
+
+    Parameters
+    ----------
+    path : str
+        Destination CSV file, overwritten if it exists.
+    every : int, default=1
+        Sampling interval in generations.
+    """
+
+    def __init__(self, path: str, every: int = 1) -> None:
+        if every < 1:
+            raise ValueError("Sampling interval must be at least 1.")
+
+        self.every = every
+        self._file = open(path, "w", newline="", encoding="utf-8")
+        self._writer = csv.DictWriter(self._file, fieldnames=STATS_FIELDS)
+        self._writer.writeheader()
+
+    def __call__(self, stats: GenerationStats) -> None:
+        if stats.generation % self.every:
+            return
+        self._writer.writerow(stats.as_dict())
+        self._file.flush()
+
+    def close(self) -> None:
+        """Close the output file."""
+
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
@@ -0,0 +1,355 @@
+import argparse
+import csv
+import json
+import multiprocessing
+import os
+
+from backends import BACKENDS, random_soup
+from cycles import CycleDetector, hash_cells
+from rules import RuleSet
+
+RULE_SPACE = 1 << 18
+CSV_FIELDS = [
+    "rule",
+    "seed",
+    "generations",
+    "result",
+    "period",
+    "start",
+    "final_population",
+    "hash",
+    "population",
+]
+
+# Per-worker settings and soup cache, set up by `_init_worker`.
+_settings = {}
+_soups = {}
+
+
+def rule_from_index(index: int) -> str:
+    """Return the rule string for a rule index without compiling its table."""
+
+    birth = {n for n in range(9) if (index >> n) & 1}
+    survive = {n for n in range(9) if (index >> (n + 9)) & 1}
+    return RuleSet.format_life_rule(birth, survive)
+
+
+def parse_rules(specs: list[str]) -> list[str]:
+    """
+    Expand rule specifications into normalized rule strings.
+
+    Parameters
+    ----------
+    specs : list[str]
+        Each entry is a rule string (``"B36/S23"``), ``"all"`` for every
+        Life-like rule, or a range ``"start-stop"`` (inclusive) of rule
+        indices, where a rule's index is ``birth_mask | survive_mask << 9``.
+
+    Returns
+    -------
+    list[str]
+        Normalized rule strings, without duplicates, in the order given.
+
+    Raises
+    ------
+    ValueError
+        If a specification is not a valid rule, range or ``"all"``.
+    """
+
+    rules = {}
+    for spec in specs:
+        if spec.lower() == "all":
+            indices = range(RULE_SPACE)
+        elif "-" in spec and "/" not in spec:
+            start, stop = (int(part) for part in spec.split("-"))
+            if not 0 <= start <= stop < RULE_SPACE:
+                raise ValueError(f"Rule range '{spec}' is outside 0-{RULE_SPACE - 1}.")
+            indices = range(start, stop + 1)
+        else:
+            rules[RuleSet(spec).rule] = None
+            continue
+
+        for index in indices:
+            rules[rule_from_index(index)] = None
+
+    return list(rules)
+
+
+def parse_seeds(specs: list[str]) -> list[int]:
+    """Expand seed specifications such as ``"7"`` or ``"0-99"`` into seeds."""
+
+    seeds = []
+    for spec in specs:
+        if "-" in spec:
+            start, stop = (int(part) for part in spec.split("-"))
+            seeds.extend(range(start, stop + 1))
+        else:
+            seeds.append(int(spec))
+    return seeds
+
+
+def _init_worker(settings: dict) -> None:
+    """Pool initializer: store the sweep settings in the worker process."""
+
+    _settings.update(settings)
+
+
+def _soup(seed: int) -> tuple[list[int], int]:
+    """Return the soup for a seed and the Zobrist hash of its live cells, cached."""
+
+    cached = _soups.get(seed)
+    if cached is None:
+        soup = random_soup(_settings["size"], _settings["density"], seed)
+        cached = (soup, hash_cells(i for i, state in enumerate(soup) if state))
+        _soups[seed] = cached
+    return cached
+
+
+def run_job(job: tuple[str, int]) -> dict:
+    """
+    Evolve one soup under one rule and summarize how it behaved.
+
+    The rule is looked up in the bounded RuleSet caches, so the seeds of a
+    rule share its parsed form and transition table, and its Python rule
+    function is never compiled. Soups are generated once per seed.
+
+    Parameters
+    ----------
+    job : tuple[str, int]
+        The rule string and soup seed.
+
+    Returns
+    -------
+    dict
+        The rule, seed, generations run, the detector's classification
+        (``result``, ``period``, ``start``; ``"active"`` if the run never
+        settled), the final population, the final state hash, and the
+        population sampled every ``sample_every`` generations.
+    """
+
+    rule, seed = job
+    ruleset = RuleSet(rule)
+    soup, initial_hash = _soup(seed)
+
+    size = _settings["size"]
+    grid = BACKENDS[_settings["backend"]](
+        grid=soup, grid_wrap=_settings["wrap"], grid_size=size
+    )
+
+    detector = CycleDetector(history=_settings["history"])
+    detector.reset(grid)
+    sample_every = _settings["sample_every"]
+    population = [detector.population]
+
+    cycle = None
+    for _ in range(_settings["generations"]):
+        grid.evolve(ruleset)
+        cycle = detector.update(grid)
+        if detector.generation % sample_every == 0:
+            population.append(detector.population)
+        if cycle is not None:
+            break
+
+    return {
+        "rule": rule,
+        "seed": seed,
+        "generations": detector.generation,
+        "result": cycle["kind"] if cycle else "active",
+        "period": cycle["period"] if cycle else None,
+        "start": cycle["start"] if cycle else None,
+        "final_population": detector.population,
+        "hash": f"{initial_hash ^ detector.hash:016x}",
+        "population": population,
+    }
+
+
+def completed_jobs(path: str) -> set[tuple[str, int]]:
+    """
+    Read the (rule, seed) pairs already present in a results file.
+
+    A trailing partial line left by an interrupted run is removed, so the
+    file can be appended to safely.
+
+    Parameters
+    ----------
+    path : str
+        A ``.jsonl`` or ``.csv`` results file. It does not need to exist.
+
+    Returns
+    -------
+    set[tuple[str, int]]
+        The jobs that have a complete result in the file.
+    """
+
+    if not os.path.exists(path):
+        return set()
+
+    with open(path, "rb+") as f:
+        data = f.read()
+        if data and not data.endswith(b"\n"):
+            f.truncate(data.rfind(b"\n") + 1)
+
+    done = set()
+    with open(path, "r", newline="", encoding="utf-8") as f:
+        if path.endswith(".csv"):
+            for row in csv.DictReader(f):
+                done.add((row["rule"], int(row["seed"])))
+        else:
+            for line in f:
+                try:
+                    result = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                done.add((result["rule"], result["seed"]))
+
+    return done
+
+
+def sweep(
+    rules: list[str],
+    seeds: list[int],
+    output: str,
+    generations: int = 1000,
+    size: int = 64,
+    density: float = 0.35,
+    backend: str = "packed",
+    wrap: bool = True,
+    history: int = 1024,
+    sample_every: int = 10,
+    workers: int | None = None,
+) -> int:
+    """
+    Run every (rule, seed) combination on a process pool, streaming results.
+
+    Results are appended to `output` as each run finishes, as JSON lines or,
+    for a ``.csv`` path, CSV rows. Combinations already present in the file
+    are skipped, so an interrupted sweep resumes where it stopped.
+
+    Returns
+    -------
+    int
+        The number of runs performed.
+    """
+
+    done = completed_jobs(output)
+    jobs = [
+        (rule, seed) for rule in rules for seed in seeds if (rule, seed) not in done
+    ]
+    if not jobs:
+        return 0
+
+    settings = {
+        "generations": generations,
+        "size": size,
+        "density": density,
+        "backend": backend,
+        "wrap": wrap,
+        "history": history,
+        "sample_every": max(1, sample_every),
+    }
+
+    is_csv = output.endswith(".csv")
+    write_header = is_csv and (
+        not os.path.exists(output) or os.path.getsize(output) == 0
+    )
+    workers = workers or os.cpu_count() or 1
+    chunksize = max(1, min(64, len(jobs) // (workers * 8)))
+
+    with open(output, "a", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=CSV_FIELDS) if is_csv else None
+        if write_header:
+            writer.writeheader()
+
+        with multiprocessing.Pool(
+            workers, initializer=_init_worker, initargs=(settings,)
+        ) as pool:
+            for result in pool.imap_unordered(run_job, jobs, chunksize):
+                if is_csv:
+                    row = dict(result)
+                    row["population"] = " ".join(map(str, result["population"]))
+                    writer.writerow(row)
+                else:
+                    f.write(json.dumps(result) + "\n")
+                f.flush()
+
+    return len(jobs)
+
+
+def main(args):
+    rules = parse_rules(args.rules)
+    seeds = parse_seeds(args.seeds)
+    total = len(rules) * len(seeds)
+    print(f"Sweeping {len(rules)} rules x {len(seeds)} seeds ({total} runs)")
+
+    try:
+        count = sweep(
+            rules,
+            seeds,
+            args.output,
+            generations=args.generations,
+            size=args.size,
+            density=args.density,
+            backend=args.backend,
+            wrap=not args.no_wrap,
+            history=args.history,
+            sample_every=args.sample_every,
+            workers=args.workers,
+        )
+    except KeyboardInterrupt:
+        print("Interrupted; rerun the same command to resume.")
+        return
+
+    print(
+        f"Completed {count} runs ({total - count} already done). Results in {args.output}"
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Classify Life-like rules by evolving random soups"
+    )
+    parser.add_argument(
+        "--rules",
+        nargs="+",
+        required=True,
+        help="Rule strings, index ranges (e.g. 0-1023) or 'all'",
+    )
+    parser.add_argument(
+        "--seeds", nargs="+", default=["0"], help="Soup seeds or ranges (e.g. 0-9)"
+    )
+    parser.add_argument(
+        "--generations", type=int, default=1000, help="Generation limit per run"
+    )
+    parser.add_argument("--size", type=int, default=64, help="Board size")
+    parser.add_argument(
+        "--density", type=float, default=0.35, help="Initial live cell density"
+    )
+    parser.add_argument(
+        "--backend",
+        default="packed",
+        choices=["dense", "packed", "numpy"],
+        help="Grid engine used for each run",
+    )
+    parser.add_argument(
+        "--no-wrap", action="store_true", help="Use a bounded, non-wrapping board"
+    )
+    parser.add_argument(
+        "--history", type=int, default=1024, help="Cycle detection history length"
+    )
+    parser.add_argument(
+        "--sample-every",
+        type=int,
+        default=10,
+        help="Record the population every N generations",
+    )
+    parser.add_argument(
+        "--workers", type=int, default=None, help="Worker processes (default: CPUs)"
+    )
+    parser.add_argument(
+        "--output",
+        default="sweep.jsonl",
+        help="Results file (.jsonl or .csv); existing results are resumed",
+    )
+
+    args = parser.parse_args()
+    main(args)
@@ -0,0 +1,303 @@
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Codes of a cell that was born or died in `change_table`; a cell that did
+# not change is coded by its state, 0 or 1.
+CODE_DIED = 2
+CODE_BORN = 3
+
+
+class NumpyGrid:
+    """
+    A NumPy-backed variant of `Grid` that advances the whole board with
+    vectorized array operations.
+
+    Cells are stored in a two-dimensional ``uint8`` array indexed as
+    ``cells[y, x]``. Each generation computes the neighbor count of every
+    cell at once from shifted copies of the board, and then applies the
+    ruleset as a single lookup into a table indexed by (alive, count).
+    The public surface (`set_cell`, `get_cell`, `count_neighbors` and
+    `evolve`) matches `Grid`.
+
+    NumPy is an optional dependency; constructing a `NumpyGrid` without it
+    installed raises an `ImportError`.
+
+    Parameters
+    ----------
+    grid: list[int] | None
+        An optional list representing the initial grid state. Must have
+        length `grid_size * grid_size` if provided, otherwise a ValueError is
+        raised. If omitted, a zero-filled grid is created and initialized with
+        a glider pattern.
+    grid_wrap: bool, default=True
+        Whether the grid should wrap around at the edges (toroidal topology).
+        If False, neighbor lookups outside the grid return 0.
+    grid_size: int, default=10
+        Width and height of the square grid.
+    """
+
+    def __init__(self, grid=None, grid_wrap: bool = True, grid_size: int = 10) -> None:
+        if np is None:
+            raise ImportError("NumpyGrid requires NumPy to be installed.")
+
+        self.grid_size = grid_size
+        self.grid_wrap = grid_wrap
+
+        # Transition codes of the last `evolve`, see `change_table`.
+        self._codes = None
+
+        if grid is not None:
+            if len(grid) != grid_size * grid_size:
+                raise ValueError("Initial grid must have grid_size * grid_size cells.")
+            self.cells = np.array(grid, dtype=np.uint8).reshape(grid_size, grid_size)
+            return
+
+        self.cells = np.zeros((grid_size, grid_size), dtype=np.uint8)
+
+        self.set_cell(1, 0, 1)
+        self.set_cell(2, 1, 1)
+        self.set_cell(0, 2, 1)
+        self.set_cell(1, 2, 1)
+        self.set_cell(2, 2, 1)
+
+    @property
+    def population(self) -> int:
+        """The number of live cells."""
+
+        return int(np.count_nonzero(self.cells))
+
+    def set_cell(self, x: int, y: int, state: int) -> None:
+        """
+        Set the state of a specific cell in the grid.
+
+        Parameters
+        ----------
+        x: int
+            The x-coordinate (column index) of the cell.
+        y: int
+            The y-coordinate (row index) of the cell.
+        state: int
+            The new state of the cell: 1 for alive, 0 for dead.
+        """
+
+        self.cells[y, x] = state
+
+    def set_run(self, x: int, y: int, length: int, state: int = 1) -> None:
+        """
+        Set the state of a horizontal run of cells in one row.
+
+        Parameters
+        ----------
+        x: int
+            The x-coordinate of the first cell in the run.
+        y: int
+            The y-coordinate (row index) of the run.
+        length: int
+            The number of cells in the run.
+        state: int, default=1
+            The new state of the cells: 1 for alive, 0 for dead.
+        """
+
+        self.cells[y, x : x + length] = state
+
+    def get_cell(self, x: int, y: int) -> int:
+        """
+        Retrieve the state of a cell, applying wrapping or boundary checks as needed.
+
+        Parameters
+        ----------
+        x : int
+            The x-coordinate of the cell to retrieve.
+        y : int
+            The y-coordinate of the cell to retrieve.
+
+        Returns
+        -------
+        int
+            The state of the cell at (x, y): 1 if alive, 0 if dead.
+        """
+
+        if self.grid_wrap:
+            x %= self.grid_size
+            y %= self.grid_size
+        else:
+            if x < 0 or x >= self.grid_size or y < 0 or y >= self.grid_size:
+                return 0
+
+        return int(self.cells[y, x])
+
+    def count_neighbors(self, x: int, y: int) -> int:
+        """
+        Count the number of alive neighbors surrounding the cell at (x, y).
+
+        Parameters
+        ----------
+        x : int
+            The x-coordinate of the target cell.
+        y : int
+            The y-coordinate of the target cell.
+
+        Returns
+        -------
+        int
+            The number of neighboring cells that are alive.
+        """
+
+        count = 0
+        for dy in (-1, 0, 1):
+            for dx in (-1, 0, 1):
+                if dx == 0 and dy == 0:
+                    continue
+                count += self.get_cell(x + dx, y + dy)
+
+        return count
+
+    def evolve(self, ruleset) -> None:
+        """
+        Advance the grid by one generation using the provided ruleset.
+
+        Parameters
+        ----------
+        ruleset : RuleSet
+            A `RuleSet` object providing its compiled transition `table`.
+        """
+
+        counts = neighbor_counts(self.cells, self.grid_wrap)
+        self._codes = apply_rule_table(change_table(ruleset), self.cells, counts)
+        self.cells = self._codes & np.uint8(1)
+
+    def changes(self):
+        """
+        Return the cells that changed during the last call to `evolve`.
+
+        Births and deaths are marked by the rule lookup of `evolve` itself
+        (see `change_table`); this only extracts their indices. Cells are
+        identified by their flat index ``y * grid_size + x``. Changes made
+        through `set_cell` are not included.
+
+        Returns
+        -------
+        tuple[numpy.ndarray, numpy.ndarray]
+            The indices of cells that were born, and of cells that died.
+        """
+
+        if self._codes is None:
+            empty = np.zeros(0, dtype=np.intp)
+            return empty, empty
+
+        codes = self._codes.ravel()
+        changed = np.flatnonzero(codes >= CODE_DIED)
+        born = codes[changed] == CODE_BORN
+        return changed[born], changed[~born]
+
+
+def neighbor_counts(cells, wrap: bool):
+    """
+    Compute the Moore neighbor count of every cell in a board.
+
+    The counts are built from shifted copies of the board: first the
+    horizontal three-cell sums, then the vertical sum of those, minus the
+    cell itself. Wrapping boards are shifted with ``np.roll``; non-wrapping
+    boards are padded with a border of dead cells and sliced.
+
+    Only the last two axes are treated as the board, so a stack of boards
+    with shape ``(..., height, width)`` is handled in a single call.
+
+    Parameters
+    ----------
+    cells : numpy.ndarray
+        Array of 0/1 cell states with shape ``(..., height, width)``.
+    wrap : bool
+        Whether the board wraps around at the edges.
+
+    Returns
+    -------
+    numpy.ndarray
+        A ``uint8`` array of the same shape holding neighbor counts (0-8).
+    """
+
+    cells = cells.astype(np.uint8, copy=False)
+
+    if wrap:
+        rows = np.roll(cells, 1, axis=-1) + cells + np.roll(cells, -1, axis=-1)
+        counts = np.roll(rows, 1, axis=-2) + rows + np.roll(rows, -1, axis=-2)
+    else:
+        padding = [(0, 0)] * (cells.ndim - 2) + [(1, 1), (1, 1)]
+        padded = np.pad(cells, padding)
+        rows = padded[..., :, :-2] + padded[..., :, 1:-1] + padded[..., :, 2:]
+        counts = rows[..., :-2, :] + rows[..., 1:-1, :] + rows[..., 2:, :]
+
+    counts -= cells
+    return counts
+
+
+def rule_table(ruleset):
+    """
+    Return the next-state lookup table of a ruleset as an array.
+
+    The table has 18 entries indexed by ``alive * 9 + neighbors``: the first
+    nine give the next state of a dead cell, the last nine that of a live one.
+
+    Parameters
+    ----------
+    ruleset : RuleSet
+        A `RuleSet` object providing its compiled transition `table`.
+
+    Returns
+    -------
+    numpy.ndarray
+        A read-only ``uint8`` array of 18 next states.
+    """
+
+    return np.frombuffer(ruleset.table, dtype=np.uint8)
+
+
+def change_table(ruleset):
+    """
+    Return a lookup table giving the next state of a cell and whether it changed.
+
+    Like `rule_table`, the table has 18 entries indexed by
+    ``alive * 9 + neighbors``. Bit 0 of each entry is the next state and
+    bit 1 is set when the cell changes, so an entry is `CODE_BORN` for a
+    birth, `CODE_DIED` for a death, and the next state otherwise.
+
+    Parameters
+    ----------
+    ruleset : RuleSet
+        A `RuleSet` object providing its compiled transition `table`.
+
+    Returns
+    -------
+    numpy.ndarray
+        A ``uint8`` array of 18 transition codes.
+    """
+
+    table = rule_table(ruleset)
+    alive = np.repeat(np.array([0, 1], dtype=np.uint8), 9)
+    return table | ((table ^ alive) << np.uint8(1))
+
+
+def apply_rule_table(table, cells, counts):
+    """
+    Apply a next-state table to a board in a single lookup.
+
+    Parameters
+    ----------
+    table : numpy.ndarray
+        The 18-entry table produced by `rule_table`.
+    cells : numpy.ndarray
+        Array of 0/1 cell states.
+    counts : numpy.ndarray
+        Neighbor counts of the same shape as `cells`.
+
+    Returns
+    -------
+    numpy.ndarray
+        A new ``uint8`` array holding the next generation.
+    """
+
+    index = cells * np.uint8(9)
+    index += counts
+    return np.take(table, index)
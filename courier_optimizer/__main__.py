@@ -3,10 +3,17 @@ import sys
 import csv
 import argparse
 
-from delivery import Delivery
-from route_optimizer import optimize_route
+from distance_cache import DEFAULT_MAX_BYTES, DistanceCache
+from fleet import FLEET_METHODS, plan_fleet
+from ingest import read_deliveries
+from report import ROUTE_FIELDS, route_rows, write_route_csv
+from route_optimizer import (
+    CRITERIA,
+    LOCAL_SEARCH_MAX_STOPS,
+    location_matrix,
+    plan_route,
+)
 from transport import TRANSPORT_MODES
-from haversine import get_haversine_distance
 from logger import log_time, logging
 
 PACKAGE_ROOT = os.path.dirname(os.path.abspath(__file__))
@@ -14,19 +21,6 @@ REJECTED_PATH = os.path.join(PACKAGE_ROOT, "rejected.csv")
 ROUTE_OUTPUT_PATH = os.path.join(PACKAGE_ROOT, "route.csv")
 
 
-def calculate_metrics(distance: float, mode: str) -> tuple[float, float, float]:
-    """Calculates ETA, Cost, and CO2 for a given distance and transport mode."""
-    mode_data = TRANSPORT_MODES[mode]
-    speed = mode_data["speed"]
-    cost_per_km = mode_data["cost"]
-    co2_per_km = mode_data["co2"]
-
-    eta = distance / speed
-    cost = distance * cost_per_km
-    co2 = distance * co2_per_km
-    return eta, cost, co2
-
-
 @log_time
 def main(args):
     if not os.path.exists(args.input):
@@ -47,36 +41,27 @@ def main(args):
         logging.warning(f"Invalid mode '{args.mode}'. Defaulting to 'Car'.")
         mode = "Car"
 
-    criterion = args.criterion.lower()
-    if criterion not in ["time", "cost", "co2"]:
-        logging.warning(f"Invalid criterion '{args.criterion}'. Defaulting to 'time'.")
-        criterion = "time"
-
-    deliveries = []
-    rejected_rows = []
-    fields = ["customer", "latitude", "longitude", "priority", "weight_kg"]
-
+    criteria = []
+    for criterion in args.criterion.lower().split(","):
+        criterion = criterion.strip()
+        if criterion not in CRITERIA:
+            logging.warning(f"Invalid criterion '{criterion}'. Defaulting to 'time'.")
+            criterion = "time"
+        if criterion not in criteria:
+            criteria.append(criterion)
+
+    # Rows are streamed in chunks into columnar arrays, and invalid rows are
+    # written out as they are found instead of being collected in memory.
     try:
-        with open(args.input, "r", newline="", encoding="utf-8") as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                if Delivery.validate(row):
-                    deliveries.append(Delivery(**row))
-                else:
-                    rejected_rows.append(row)
+        deliveries, rejected = read_deliveries(args.input, REJECTED_PATH)
     except Exception as e:
         logging.error(f"Error reading input CSV: {e}")
         print(f"Error reading input CSV: {e}")
         sys.exit(1)
 
-    if rejected_rows:
-        with open(REJECTED_PATH, "w", newline="", encoding="utf-8") as f:
-            writer = csv.DictWriter(f, fieldnames=fields)
-            writer.writeheader()
-            writer.writerows(rejected_rows)
-
-        logging.warning(f"{len(rejected_rows)} invalid rows written to {REJECTED_PATH}")
-        print(f"{len(rejected_rows)} invalid rows written to {REJECTED_PATH}")
+    if rejected:
+        logging.warning(f"{rejected} invalid rows written to {REJECTED_PATH}")
+        print(f"{rejected} invalid rows written to {REJECTED_PATH}")
 
     if not deliveries:
         logging.info("No valid deliveries to process. Exiting.")
@@ -84,94 +69,132 @@ def main(args):
         sys.exit(0)
 
     print(f"Loaded {len(deliveries)} deliveries.")
-    print(f"Transport mode: {mode}, Optimization criterion: {criterion}")
-
-    route = optimize_route(deliveries, depot_location)
-
-    full_route_stops = (
-        [
-            type(
-                "Depot",
-                (object,),
-                {
-                    "latitude": depot_location[0],
-                    "longitude": depot_location[1],
-                    "customer": "DEPOT_START",
-                },
-            )
-        ]
-        + route
-        + [
-            type(
-                "Depot",
-                (object,),
-                {
-                    "latitude": depot_location[0],
-                    "longitude": depot_location[1],
-                    "customer": "DEPOT_END",
-                },
-            )
-        ]
-    )
+    print(f"Transport mode: {mode}, Optimization criterion: {', '.join(criteria)}")
 
-    total_distance = 0
-    total_eta = 0
-    total_cost = 0
-    total_co2 = 0
-    cumulative = 0
+    if args.improve and len(deliveries) > LOCAL_SEARCH_MAX_STOPS:
+        logging.warning(
+            f"Skipping local search: {len(deliveries)} stops exceeds "
+            f"{LOCAL_SEARCH_MAX_STOPS}."
+        )
+        print(f"Skipping local search for more than {LOCAL_SEARCH_MAX_STOPS} stops.")
+
+    # One distance matrix serves every criterion, the local search and the
+    # route metrics. With --cache it is reused across runs, and only the
+    # distances of new locations are computed. Very large instances compute
+    # distances on the fly.
+    distances = None
+    cache = None
+    if args.cache:
+        cache = DistanceCache(args.cache, int(args.cache_size * 1024 * 1024))
+    if len(deliveries) <= LOCAL_SEARCH_MAX_STOPS and (
+        args.improve or len(criteria) > 1 or cache is not None
+    ):
+        distances = location_matrix(deliveries, depot_location, cache)
+
+    fleet = args.capacity is not None
+    for criterion in criteria:
+        if fleet:
+            try:
+                routes = plan_fleet(
+                    deliveries,
+                    depot_location,
+                    args.capacity,
+                    args.vehicles,
+                    mode,
+                    criterion,
+                    distances,
+                    args.improve,
+                    args.fleet_method,
+                    args.workers,
+                )
+            except ValueError as e:
+                logging.error(f"Fleet planning failed: {e}")
+                print(f"Error: {e}")
+                sys.exit(1)
+            saved = sum(route[2] for route in routes)
+        else:
+            route, legs, saved = plan_route(
+                deliveries, depot_location, mode, criterion, distances, args.improve
+            )
+        if args.improve and saved:
+            logging.info(f"Local search saved {saved:.2f} km ({criterion})")
+            print(f"Local search saved {saved:.2f} km")
+
+        output = args.output
+        if len(criteria) > 1:
+            stem, extension = os.path.splitext(args.output)
+            output = f"{stem}_{criterion}{extension}"
+
+        if fleet:
+            write_fleet_routes(output, routes, mode, criterion)
+        else:
+            write_route(output, route, legs, mode, criterion)
+
+
+def print_summary(
+    mode: str, criterion: str, deliveries: int, totals: tuple[float, ...]
+) -> None:
+    """Prints the totals of a route or a fleet."""
+    total_distance, total_eta, total_cost, total_co2 = totals
+    print("\n--- Route Summary ---")
+    print(f"Transport Mode: {mode}")
+    print(f"Optimization Criterion: {criterion.title()}")
+    print(f"Total Deliveries: {deliveries}")
+    print(f"Total distance (Round trip): {total_distance:.2f} km")
+    print(f"Total ETA: {total_eta:.2f} hours")
+    print(f"Total cost: {total_cost:.2f} NOK")
+    print(f"Total CO2 emissions: {total_co2:.2f} g")
+    print("---------------------\n")
 
-    output_rows = []
 
-    for i in range(1, len(full_route_stops)):
-        prev_stop = full_route_stops[i - 1]
-        current_stop = full_route_stops[i]
+def write_route(
+    output: str, route: list, legs: list[float], mode: str, criterion: str
+) -> None:
+    """Writes the per-stop metrics of a route to a CSV file and prints a summary."""
+    output_rows, totals = route_rows(route, legs, mode)
+    write_route_csv(output, output_rows)
 
-        distance = get_haversine_distance(
-            float(prev_stop.latitude),
-            float(prev_stop.longitude),
-            float(current_stop.latitude),
-            float(current_stop.longitude),
-        )
+    print(f"Route saved to {output}")
+    print_summary(mode, criterion, len(route), totals)
 
-        eta, cost, co2 = calculate_metrics(distance, mode)
 
-        if i <= len(route) + 1:
-            total_distance += distance
-            total_eta += eta
-            total_cost += cost
-            total_co2 += co2
+def write_fleet_routes(
+    output: str, routes: list[tuple], mode: str, criterion: str
+) -> None:
+    """
+    Writes the routes of a fleet to a CSV file and prints a summary.
 
-        cumulative += distance
+    Every stop row names its vehicle, and cumulative distances restart for
+    each vehicle. A TOTAL row follows each vehicle's stops, and a final row
+    for vehicle ALL holds the combined totals of the fleet.
+    """
+    combined = [0.0, 0.0, 0.0, 0.0]
+    deliveries = 0
 
-        output_rows.append(
-            (
-                current_stop.customer,
-                round(distance, 2),
-                round(cumulative, 2),
-                round(eta, 2),
-                round(cost, 2),
-                round(co2, 2),
+    with open(output, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["Vehicle"] + ROUTE_FIELDS)
+        for vehicle, (route, legs, _) in enumerate(routes, start=1):
+            output_rows, totals = route_rows(route, legs, mode)
+            writer.writerows((vehicle,) + row for row in output_rows)
+            writer.writerow(
+                [vehicle, "TOTAL", round(totals[0], 2), round(totals[0], 2)]
+                + [round(value, 2) for value in totals[1:]]
             )
-        )
+            print(
+                f"Vehicle {vehicle}: {len(route)} deliveries, "
+                f"{totals[0]:.2f} km, {totals[1]:.2f} hours"
+            )
+            combined = [a + b for a, b in zip(combined, totals)]
+            deliveries += len(route)
 
-    with open(args.output, "w", newline="") as f:
-        writer = csv.writer(f)
         writer.writerow(
-            ["Customer", "Distance_km", "Cumulative_km", "ETA_h", "Cost_NOK", "CO2_g"]
+            ["ALL", "TOTAL", round(combined[0], 2), round(combined[0], 2)]
+            + [round(value, 2) for value in combined[1:]]
         )
-        writer.writerows(output_rows)
 
-    print(f"Route saved to {args.output}")
-
-    print("\n--- Route Summary ---")
-    print(f"Transport Mode: {mode}")
-    print(f"Optimization Criterion: {criterion.title()}")
-    print(f"Total Deliveries: {len(route)}")
-    print(f"Total distance (Round trip): {total_distance:.2f} km")
-    print(f"Total ETA: {total_eta:.2f} hours")
-    print(f"Total cost: {total_cost:.2f} NOK")
-    print(f"Total CO2 emissions: {total_co2:.2f} g")
-    print("---------------------\n")
+    print(f"Routes of {len(routes)} vehicles saved to {output}")
+    print_summary(mode, criterion, deliveries, combined)
 
 
 if __name__ == "__main__":
@@ -188,14 +211,65 @@ if __name__ == "__main__":
         "--mode", default="Car", help="Transport mode: Car, Bicycle, Walk"
     )
     parser.add_argument(
-        "--criterion", default="time", help="Optimization criterion: time, cost, co2"
+        "--criterion",
+        default="time",
+        help="Optimization criterion: time, cost, co2, or several separated "
+        "by commas to plan each from one distance matrix",
     )
     parser.add_argument(
         "--depot",
         required=True,
         help="Depot location (Latitude,Longitude, e.g., 59.91,10.75)",
     )
+    parser.add_argument(
+        "--improve",
+        type=float,
+        default=None,
+        metavar="SECONDS",
+        help="Improve the route with 2-opt/Or-opt local search for up to SECONDS",
+    )
+    parser.add_argument(
+        "--cache",
+        default=None,
+        metavar="DIR",
+        help="Directory of a persistent distance matrix cache shared between runs",
+    )
+    parser.add_argument(
+        "--cache-size",
+        type=float,
+        default=DEFAULT_MAX_BYTES / (1024 * 1024),
+        metavar="MB",
+        help="Maximum size of the distance cache in megabytes (default: %(default)g)",
+    )
+    parser.add_argument(
+        "--vehicles",
+        type=int,
+        default=None,
+        help="Fleet size, used with --capacity (default: as many as needed)",
+    )
+    parser.add_argument(
+        "--capacity",
+        type=float,
+        default=None,
+        metavar="KG",
+        help="Maximum load of each vehicle in kg; splits the deliveries into "
+        "one route per vehicle by their weight_kg",
+    )
+    parser.add_argument(
+        "--fleet-method",
+        choices=FLEET_METHODS,
+        default="sweep",
+        help="Algorithm splitting the deliveries between vehicles",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Worker processes optimizing the vehicle routes (default: CPUs)",
+    )
 
     args = parser.parse_args()
+    if args.vehicles is not None and args.capacity is None:
+        parser.error("--vehicles requires --capacity")
 
     main(args=args)
@@ -0,0 +1,266 @@
+import argparse
+import csv
+import multiprocessing
+import os
+import time
+
+from ingest import read_deliveries
+from logger import logging
+from report import route_rows, write_route_csv
+from route_optimizer import CRITERIA, plan_route
+from transport import TRANSPORT_MODES
+
+SUMMARY_FIELDS = [
+    "name",
+    "input",
+    "depot",
+    "mode",
+    "criterion",
+    "status",
+    "deliveries",
+    "rejected",
+    "distance_km",
+    "eta_h",
+    "cost_nok",
+    "co2_g",
+    "seconds",
+    "route",
+]
+
+
+def parse_depot(depot: str) -> tuple[float, float]:
+    """Parses a "latitude,longitude" depot string."""
+    latitude, longitude = map(float, depot.split(","))
+    return latitude, longitude
+
+
+def read_manifest(path: str) -> list[dict]:
+    """
+    Reads the jobs of a batch from a manifest CSV.
+
+    The manifest has one row per job with the columns `input` and `depot`
+    ("latitude,longitude", quoted), and optionally `mode`, `criterion` and
+    `name`. Relative input paths are resolved against the manifest's
+    directory. Unnamed jobs are named after their row and input file.
+
+    Raises:
+        ValueError: If a row is invalid or two jobs share a name.
+    """
+    base = os.path.dirname(os.path.abspath(path))
+    jobs = []
+    names = set()
+
+    with open(path, "r", newline="", encoding="utf-8") as f:
+        for line, row in enumerate(csv.DictReader(f), start=2):
+            try:
+                depot = parse_depot(row.get("depot") or "")
+            except ValueError:
+                raise ValueError(
+                    f"Line {line}: invalid depot '{row.get('depot')}'. "
+                    "Expected lat,lon."
+                )
+            if not row.get("input"):
+                raise ValueError(f"Line {line}: missing input file.")
+
+            mode = (row.get("mode") or "Car").title()
+            if mode not in TRANSPORT_MODES:
+                raise ValueError(f"Line {line}: invalid mode '{row['mode']}'.")
+            criterion = (row.get("criterion") or "time").lower()
+            if criterion not in CRITERIA:
+                raise ValueError(
+                    f"Line {line}: invalid criterion '{row['criterion']}'."
+                )
+
+            stem = os.path.splitext(os.path.basename(row["input"]))[0]
+            name = row.get("name") or f"{len(jobs) + 1:04d}_{stem}"
+            if name in names:
+                raise ValueError(f"Line {line}: duplicate job name '{name}'.")
+            names.add(name)
+
+            jobs.append(
+                {
+                    "name": name,
+                    "input": os.path.join(base, row["input"]),
+                    "depot": depot,
+                    "mode": mode,
+                    "criterion": criterion,
+                }
+            )
+
+    return jobs
+
+
+def run_job(job: dict) -> dict:
+    """
+    Plans the route of one manifest job and writes its output files.
+
+    The route goes to `<name>_route.csv` and invalid rows to
+    `<name>_rejected.csv` in the job's output directory. Errors are
+    reported in the returned summary instead of stopping the batch.
+
+    Args:
+        job: A job from `read_manifest`, plus `output_dir` and `improve`.
+
+    Returns:
+        A summary row with the `SUMMARY_FIELDS` keys.
+    """
+    start = time.perf_counter()
+    summary = {
+        "name": job["name"],
+        "input": job["input"],
+        "depot": "{},{}".format(*job["depot"]),
+        "mode": job["mode"],
+        "criterion": job["criterion"],
+        "status": "ok",
+        "deliveries": 0,
+        "rejected": 0,
+        "distance_km": 0.0,
+        "eta_h": 0.0,
+        "cost_nok": 0.0,
+        "co2_g": 0.0,
+        "route": "",
+    }
+    rejected_path = os.path.join(job["output_dir"], f"{job['name']}_rejected.csv")
+    route_path = os.path.join(job["output_dir"], f"{job['name']}_route.csv")
+
+    try:
+        deliveries, rejected = read_deliveries(job["input"], rejected_path)
+        summary["deliveries"] = len(deliveries)
+        summary["rejected"] = rejected
+
+        if not deliveries:
+            summary["status"] = "no valid deliveries"
+        else:
+            route, legs, _ = plan_route(
+                deliveries,
+                job["depot"],
+                job["mode"],
+                job["criterion"],
+                time_budget=job["improve"],
+            )
+            rows, totals = route_rows(route, legs, job["mode"])
+            write_route_csv(route_path, rows)
+            (
+                summary["distance_km"],
+                summary["eta_h"],
+                summary["cost_nok"],
+                summary["co2_g"],
+            ) = totals
+            summary["route"] = route_path
+    except Exception as e:
+        logging.error(f"Batch job {job['name']} failed: {e}")
+        summary["status"] = f"error: {e}"
+
+    summary["seconds"] = time.perf_counter() - start
+    return summary
+
+
+def run_batch(
+    jobs: list[dict],
+    output_dir: str,
+    improve: float | None = None,
+    workers: int | None = None,
+) -> list[dict]:
+    """
+    Runs manifest jobs in a worker pool.
+
+    Args:
+        jobs: Jobs from `read_manifest`.
+        output_dir: Directory receiving every job's route and rejected files.
+        improve: Seconds of local search per route, or None to skip it.
+        workers: Worker processes (default: CPUs).
+
+    Returns:
+        The summary of every job, in manifest order.
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    jobs = [dict(job, output_dir=output_dir, improve=improve) for job in jobs]
+    if not jobs:
+        return []
+
+    workers = min(workers or os.cpu_count() or 1, len(jobs))
+    if workers <= 1:
+        return [run_job(job) for job in jobs]
+
+    # Large jobs dominate the batch, so hand them out one at a time.
+    with multiprocessing.Pool(workers) as pool:
+        return pool.map(run_job, jobs, chunksize=1)
+
+
+def write_summary(path: str, summaries: list[dict]) -> None:
+    """Writes the job summaries to a CSV file."""
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=SUMMARY_FIELDS)
+        writer.writeheader()
+        for summary in summaries:
+            row = dict(summary)
+            for field in ("distance_km", "eta_h", "cost_nok", "co2_g", "seconds"):
+                row[field] = round(row[field], 2)
+            writer.writerow(row)
+
+
+def main(args):
+    try:
+        jobs = read_manifest(args.manifest)
+    except (OSError, ValueError) as e:
+        logging.error(f"Invalid manifest '{args.manifest}': {e}")
+        print(f"Error: Invalid manifest '{args.manifest}': {e}")
+        return 1
+
+    print(f"Planning {len(jobs)} jobs from {args.manifest}")
+    logging.info(f"Batch of {len(jobs)} jobs from {args.manifest}")
+    start = time.perf_counter()
+    summaries = run_batch(jobs, args.output_dir, args.improve, args.workers)
+    elapsed = time.perf_counter() - start
+
+    summary_path = os.path.join(args.output_dir, "summary.csv")
+    write_summary(summary_path, summaries)
+
+    failed = [s for s in summaries if s["status"].startswith("error")]
+    for summary in failed:
+        print(f"{summary['name']}: {summary['status']}")
+
+    print("\n--- Batch Summary ---")
+    print(f"Jobs: {len(summaries)} ({len(failed)} failed)")
+    print(f"Total Deliveries: {sum(s['deliveries'] for s in summaries)}")
+    print(f"Rejected rows: {sum(s['rejected'] for s in summaries)}")
+    print(f"Total distance: {sum(s['distance_km'] for s in summaries):.2f} km")
+    print(f"Total ETA: {sum(s['eta_h'] for s in summaries):.2f} hours")
+    print(f"Total cost: {sum(s['cost_nok'] for s in summaries):.2f} NOK")
+    print(f"Total CO2 emissions: {sum(s['co2_g'] for s in summaries):.2f} g")
+    print(f"Wall time: {elapsed:.2f} s")
+    print(f"Per-job results in {summary_path}")
+    print("---------------------\n")
+    logging.info(
+        f"Batch finished: {len(summaries)} jobs, {len(failed)} failed, "
+        f"{elapsed:.2f}s"
+    )
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Plan the routes of many depots from a manifest in parallel."
+    )
+    parser.add_argument(
+        "manifest",
+        help="CSV with input, depot and optional mode, criterion and name columns",
+    )
+    parser.add_argument(
+        "--output-dir",
+        default="batch_output",
+        help="Directory for the route, rejected and summary files",
+    )
+    parser.add_argument(
+        "--improve",
+        type=float,
+        default=None,
+        metavar="SECONDS",
+        help="Improve each route with 2-opt/Or-opt local search for up to SECONDS",
+    )
+    parser.add_argument(
+        "--workers", type=int, default=None, help="Worker processes (default: CPUs)"
+    )
+
+    args = parser.parse_args()
+    raise SystemExit(main(args))
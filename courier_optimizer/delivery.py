@@ -1,5 +1,8 @@
 import re
 
+# Compiled once at import instead of on every validated row.
+PRIORITY_PATTERN = re.compile(r"^(High|Medium|Low)$")
+
 
 class Delivery:
     PRIORITY_WEIGHTS = {"High": 0.6, "Medium": 1.0, "Low": 1.2}
@@ -21,10 +24,10 @@ class Delivery:
         priority = row["priority"]
         weight = row["weight_kg"]
 
-        if not all(c.isprintable() for c in customer):
+        if not customer.isprintable():
             return False
 
-        if not re.match(r"^(High|Medium|Low)$", priority):
+        if not PRIORITY_PATTERN.match(priority):
             return False
 
         try:
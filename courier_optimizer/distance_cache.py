@@ -0,0 +1,314 @@
+import hashlib
+import json
+import os
+import time
+
+import numpy as np
+
+from distance_matrix import distance_matrix, distance_rows
+from logger import logging
+
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+INDEX_NAME = "index.json"
+
+
+def location_key(points: np.ndarray) -> str:
+    """Hashes a radian location array, including its dtype, into a cache key."""
+    points = np.ascontiguousarray(points)
+    digest = hashlib.sha1(points.dtype.str.encode())
+    digest.update(points.tobytes())
+    return digest.hexdigest()
+
+
+def shared_locations(points: np.ndarray, cached_points: np.ndarray) -> list:
+    """
+    Matches locations of `points` to identical ones in `cached_points`.
+
+    Returns:
+        (i, j) pairs where `points[i]` equals `cached_points[j]`.
+    """
+    position = {row.tobytes(): j for j, row in enumerate(cached_points)}
+    return [
+        (i, position[key])
+        for i, key in enumerate(row.tobytes() for row in points)
+        if key in position
+    ]
+
+
+def extend_matrix(
+    points: np.ndarray, cached_matrix: np.ndarray, shared: list
+) -> tuple[np.ndarray, int]:
+    """
+    Builds the distance matrix of `points` from the matrix of other locations.
+
+    Distances between the `shared` locations are copied from `cached_matrix`
+    and only the rows and columns of the remaining locations are computed.
+
+    Args:
+        points: (n, 2) radian array.
+        cached_matrix: Distance matrix of the cached locations.
+        shared: (i, j) pairs from `shared_locations`.
+
+    Returns:
+        A tuple (matrix, computed) of the matrix and the number of locations
+        whose distances had to be computed.
+    """
+    new_positions, cached_positions = (np.array(p) for p in zip(*shared))
+    matrix = np.empty((len(points), len(points)), dtype=points.dtype)
+    matrix[np.ix_(new_positions, new_positions)] = cached_matrix[
+        np.ix_(cached_positions, cached_positions)
+    ]
+
+    missing = np.setdiff1d(np.arange(len(points)), new_positions)
+    if len(missing):
+        rows = distance_rows(points[missing], 0, len(missing), points)
+        matrix[missing] = rows
+        matrix[:, missing] = rows.T
+    return matrix, len(missing)
+
+
+class DistanceCache:
+    """
+    A size-bounded on-disk cache of distance matrices.
+
+    Each entry stores the matrix of one location set as a `.npy` file, next to
+    the locations it was computed for, keyed by a hash of those locations.
+    Exact hits are memory-mapped read-only, so nothing is recomputed or
+    copied. Otherwise the entry sharing the most locations is reused: its
+    distances between shared locations are copied and only the rows and
+    columns of new locations are computed. Locations match on their exact
+    coordinates, so a cached matrix is identical to a freshly computed one.
+
+    The least recently used entries are deleted once the cache grows beyond
+    `max_bytes`. Hits and misses are logged through `logger`.
+
+    Args:
+        directory: Directory holding the cache; created if missing.
+        max_bytes: Maximum total size of the cached files.
+    """
+
+    def __init__(self, directory: str, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.partial_hits = 0
+        self.misses = 0
+        os.makedirs(directory, exist_ok=True)
+        self._index = self._read_index()
+
+    def _path(self, key: str, suffix: str) -> str:
+        return os.path.join(self.directory, f"{key}.{suffix}.npy")
+
+    def _read_index(self) -> dict:
+        """Reads the entry index, dropping entries whose files are gone."""
+        try:
+            with open(os.path.join(self.directory, INDEX_NAME)) as f:
+                index = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        return {
+            key: entry
+            for key, entry in index.items()
+            if os.path.exists(self._path(key, "matrix"))
+            and os.path.exists(self._path(key, "points"))
+        }
+
+    def _write_index(self) -> None:
+        path = os.path.join(self.directory, INDEX_NAME)
+        temporary = path + ".tmp"
+        with open(temporary, "w") as f:
+            json.dump(self._index, f)
+        os.replace(temporary, path)
+
+    def _save_array(self, path: str, array: np.ndarray) -> None:
+        temporary = path + ".tmp"
+        with open(temporary, "wb") as f:
+            np.save(f, array)
+        os.replace(temporary, path)
+
+    def size(self) -> int:
+        """Returns the total size of the cached entries in bytes."""
+        return sum(entry["bytes"] for entry in self._index.values())
+
+    def clear(self) -> None:
+        """Deletes every entry."""
+        for key in list(self._index):
+            self._delete(key)
+        self._write_index()
+
+    def _delete(self, key: str) -> None:
+        for suffix in ("matrix", "points"):
+            try:
+                os.remove(self._path(key, suffix))
+            except FileNotFoundError:
+                pass
+        del self._index[key]
+
+    def _best_match(self, points: np.ndarray):
+        """
+        Finds the cached entry sharing the most locations with `points`.
+
+        Returns:
+            A tuple (key, shared) with pairs from `shared_locations`, or None
+            if no entry shares a location.
+        """
+        best = None
+        for key, entry in self._index.items():
+            if entry["dtype"] != points.dtype.str:
+                continue
+            try:
+                cached = np.load(self._path(key, "points"))
+            except (OSError, ValueError):
+                continue
+            shared = shared_locations(points, cached)
+            if shared and (best is None or len(shared) > len(best[1])):
+                best = (key, shared)
+        return best
+
+    def _reuse(self, points: np.ndarray, key: str, shared: list):
+        """Builds the matrix of `points` from a cached entry sharing locations."""
+        cached = np.load(self._path(key, "matrix"), mmap_mode="r")
+        return extend_matrix(points, cached, shared)
+
+    def matrix(self, points: np.ndarray) -> np.ndarray:
+        """
+        Returns the distance matrix of radian locations, from the cache if possible.
+
+        Args:
+            points: (n, 2) radian array from `distance_matrix.to_radians`.
+
+        Returns:
+            An (n, n) array in the dtype of `points`. Exact hits are read-only
+            memory maps.
+        """
+        points = np.ascontiguousarray(points)
+        key = location_key(points)
+
+        if key in self._index:
+            matrix = np.load(self._path(key, "matrix"), mmap_mode="r")
+            self.hits += 1
+            logging.info(f"Distance cache hit: {len(points)} locations ({key[:12]})")
+            self._index[key]["used"] = time.time()
+            self._write_index()
+            return matrix
+
+        match = self._best_match(points)
+        if match is None:
+            matrix = distance_matrix(points)
+            self.misses += 1
+            logging.info(f"Distance cache miss: {len(points)} locations computed")
+        else:
+            matrix, computed = self._reuse(points, *match)
+            self.partial_hits += 1
+            logging.info(
+                f"Distance cache partial hit: {len(points) - computed} of "
+                f"{len(points)} locations reused from {match[0][:12]}, "
+                f"{computed} computed"
+            )
+            self._index[match[0]]["used"] = time.time()
+
+        self._store(key, points, matrix)
+        return matrix
+
+    def _store(self, key: str, points: np.ndarray, matrix: np.ndarray) -> None:
+        """Adds an entry and evicts the least recently used ones over the limit."""
+        size = matrix.nbytes + points.nbytes
+        if size > self.max_bytes:
+            logging.info(
+                f"Distance cache: {len(points)} locations exceed the size limit, "
+                "not stored"
+            )
+            return
+
+        self._save_array(self._path(key, "points"), points)
+        self._save_array(self._path(key, "matrix"), matrix)
+        self._index[key] = {
+            "dtype": points.dtype.str,
+            "count": len(points),
+            "bytes": size,
+            "used": time.time(),
+        }
+
+        total = self.size()
+        for old in sorted(self._index, key=lambda k: self._index[k]["used"]):
+            if total <= self.max_bytes:
+                break
+            if old == key:
+                continue
+            total -= self._index[old]["bytes"]
+            self._delete(old)
+            logging.info(f"Distance cache evicted {old[:12]}")
+
+        self._write_index()
+
+
+class MemoryDistanceCache:
+    """
+    An in-process, size-bounded counterpart of `DistanceCache`.
+
+    Meant for long-running processes that plan many routes around the same
+    locations. Matrices stay in memory between calls; exact hits return the
+    cached (read-only) array and partial hits reuse the entry sharing the
+    most locations. Least recently used entries are dropped beyond
+    `max_bytes`.
+
+    Args:
+        max_bytes: Maximum total size of the cached matrices.
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.partial_hits = 0
+        self.misses = 0
+        # Maps a key to (points, matrix); the last entry is the most recent.
+        self._entries = {}
+
+    def size(self) -> int:
+        """Returns the total size of the cached entries in bytes."""
+        return sum(
+            points.nbytes + matrix.nbytes for points, matrix in self._entries.values()
+        )
+
+    def matrix(self, points: np.ndarray) -> np.ndarray:
+        """Returns the distance matrix of radian locations, as `DistanceCache.matrix`."""
+        points = np.ascontiguousarray(points)
+        key = location_key(points)
+
+        if key in self._entries:
+            self._entries[key] = self._entries.pop(key)
+            self.hits += 1
+            logging.info(f"Distance cache hit: {len(points)} locations ({key[:12]})")
+            return self._entries[key][1]
+
+        best = None
+        for cached_key, (cached_points, _) in self._entries.items():
+            if cached_points.dtype != points.dtype:
+                continue
+            shared = shared_locations(points, cached_points)
+            if shared and (best is None or len(shared) > len(best[1])):
+                best = (cached_key, shared)
+
+        if best is None:
+            matrix = distance_matrix(points)
+            self.misses += 1
+            logging.info(f"Distance cache miss: {len(points)} locations computed")
+        else:
+            matrix, computed = extend_matrix(points, self._entries[best[0]][1], best[1])
+            self.partial_hits += 1
+            logging.info(
+                f"Distance cache partial hit: {len(points) - computed} of "
+                f"{len(points)} locations reused from {best[0][:12]}, "
+                f"{computed} computed"
+            )
+            self._entries[best[0]] = self._entries.pop(best[0])
+
+        matrix.flags.writeable = False
+        if points.nbytes + matrix.nbytes <= self.max_bytes:
+            self._entries[key] = (points, matrix)
+            total = self.size()
+            while total > self.max_bytes:
+                oldest = next(iter(self._entries))
+                old_points, old_matrix = self._entries.pop(oldest)
+                total -= old_points.nbytes + old_matrix.nbytes
+        return matrix
@@ -0,0 +1,242 @@
+import math
+import multiprocessing
+import os
+
+import numpy as np
+
+from delivery import Delivery
+from distance_matrix import delivery_points, to_radians
+from logger import logging
+from route_optimizer import location_matrix, plan_route
+
+FLEET_METHODS = ("sweep", "savings")
+
+# The savings algorithm ranks every pair of deliveries, which grows
+# quadratically. Larger instances are clustered with the sweep instead.
+SAVINGS_MAX_STOPS = 3000
+
+
+def package_weights(deliveries) -> np.ndarray:
+    """
+    Returns the weight in kg of every delivery.
+
+    Unknown (NaN) weights, which `Delivery.validate` accepts, count as zero.
+    """
+    if hasattr(deliveries, "weights_kg"):
+        weights = np.asarray(deliveries.weights_kg, dtype=np.float64)
+    else:
+        weights = np.array([float(d.weight_kg) for d in deliveries])
+    return np.nan_to_num(weights, nan=0.0)
+
+
+def subset(deliveries, indices: list[int]):
+    """Selects deliveries by index from a list or an `ingest.DeliveryTable`."""
+    if hasattr(deliveries, "take"):
+        return deliveries.take(indices)
+    return [deliveries[i] for i in indices]
+
+
+def sweep_clusters(
+    deliveries, depot_location: tuple[float, float], weights, capacity: float
+) -> list[list[int]]:
+    """
+    Splits deliveries into capacity-bounded clusters with the sweep algorithm.
+
+    Deliveries are sorted by their bearing from the depot and a ray is swept
+    around it, closing the current cluster whenever the next delivery would
+    exceed the capacity. The sweep starts after the widest angular gap
+    between deliveries, so no cluster straddles an empty sector.
+
+    Args:
+        deliveries: List of Delivery objects or an `ingest.DeliveryTable`.
+        depot_location: Tuple (latitude, longitude) of the depot.
+        weights: Weight of every delivery, from `package_weights`.
+        capacity: Maximum load of one vehicle in kg.
+
+    Returns:
+        Lists of indices into `deliveries`, one per vehicle.
+    """
+    if not len(deliveries):
+        return []
+
+    points = delivery_points(deliveries)
+    depot_latitude, depot_longitude = to_radians([depot_location])[0]
+    latitude, longitude = points[:, 0], points[:, 1]
+    delta = longitude - depot_longitude
+    bearing = np.arctan2(
+        np.sin(delta) * np.cos(latitude),
+        math.cos(depot_latitude) * np.sin(latitude)
+        - math.sin(depot_latitude) * np.cos(latitude) * np.cos(delta),
+    )
+
+    order = np.argsort(bearing, kind="stable")
+    angles = bearing[order]
+    gaps = np.diff(np.append(angles, angles[0] + 2 * math.pi))
+    start = (int(np.argmax(gaps)) + 1) % len(order)
+    order = np.roll(order, -start)
+
+    clusters = []
+    current = []
+    load = 0.0
+    for i in order.tolist():
+        if current and load + weights[i] > capacity:
+            clusters.append(current)
+            current = []
+            load = 0.0
+        current.append(i)
+        load += weights[i]
+    clusters.append(current)
+    return clusters
+
+
+def savings_clusters(
+    distances: np.ndarray, weights, capacity: float
+) -> list[list[int]]:
+    """
+    Splits deliveries into capacity-bounded routes with the Clarke-Wright savings algorithm.
+
+    Every delivery starts on its own route. Pairs are then visited in order
+    of decreasing saving ``d(0, i) + d(0, j) - d(i, j)``, the distance saved
+    by serving i and j in one trip instead of two, and their routes are
+    joined end to end when both are route ends and the combined load fits.
+
+    Args:
+        distances: Matrix from `route_optimizer.location_matrix`, with the
+            depot at index 0.
+        weights: Weight of every delivery, from `package_weights`.
+        capacity: Maximum load of one vehicle in kg.
+
+    Returns:
+        Lists of indices into the deliveries, one per vehicle, in the order
+        the merged routes visit them.
+    """
+    count = len(distances) - 1
+    if count <= 0:
+        return []
+
+    depot = distances[0, 1:].astype(np.float64)
+    first, second = np.triu_indices(count, k=1)
+    savings = depot[first] + depot[second] - distances[first + 1, second + 1]
+    positive = savings > 0
+    first, second, savings = first[positive], second[positive], savings[positive]
+    ranked = np.argsort(-savings, kind="stable")
+
+    routes = {i: [i] for i in range(count)}
+    route_of = list(range(count))
+    load = {i: float(weights[i]) for i in range(count)}
+
+    for i, j in zip(first[ranked].tolist(), second[ranked].tolist()):
+        a, b = route_of[i], route_of[j]
+        if a == b or load[a] + load[b] > capacity:
+            continue
+        route_a, route_b = routes[a], routes[b]
+        if route_a[0] != i and route_a[-1] != i:
+            continue
+        if route_b[0] != j and route_b[-1] != j:
+            continue
+
+        # Orient the routes so that i ends the first and j starts the second.
+        if route_a[-1] != i:
+            route_a.reverse()
+        if route_b[0] != j:
+            route_b.reverse()
+        route_a.extend(route_b)
+        load[a] += load.pop(b)
+        del routes[b]
+        for k in route_b:
+            route_of[k] = a
+
+    return sorted(routes.values(), key=lambda route: route[0])
+
+
+def plan_fleet(
+    deliveries,
+    depot_location: tuple[float, float],
+    capacity: float,
+    vehicles: int | None = None,
+    mode: str = "Car",
+    criterion: str = "time",
+    distances: np.ndarray | None = None,
+    time_budget: float | None = None,
+    method: str = "sweep",
+    workers: int | None = None,
+) -> list[tuple[list[Delivery], list[float], float]]:
+    """
+    Plans one capacity-bounded round trip per vehicle.
+
+    Deliveries are clustered with `sweep_clusters` or `savings_clusters`,
+    then every cluster is routed with `route_optimizer.plan_route` in a
+    process pool. Clusters reuse their part of the shared distance matrix.
+
+    Args:
+        deliveries: List of Delivery objects or an `ingest.DeliveryTable`.
+        depot_location: Tuple (latitude, longitude) of the depot.
+        capacity: Maximum load of one vehicle in kg.
+        vehicles: Size of the fleet, or None to use as many as needed.
+        mode: Key of `TRANSPORT_MODES`.
+        criterion: One of `route_optimizer.CRITERIA`.
+        distances: Optional shared matrix from `location_matrix`.
+        time_budget: Seconds of local search per route, or None to skip it.
+        method: One of `FLEET_METHODS`.
+        workers: Worker processes (default: CPUs).
+
+    Returns:
+        A (route, legs, saved_km) tuple from `plan_route` for every vehicle.
+
+    Raises:
+        ValueError: If a delivery is heavier than the capacity, the fleet is
+            too small, or the method is unknown.
+    """
+    if method not in FLEET_METHODS:
+        raise ValueError(f"Unknown fleet method '{method}'.")
+
+    weights = package_weights(deliveries)
+    if len(weights) and weights.max() > capacity:
+        raise ValueError(
+            f"A delivery weighs {weights.max():g} kg, more than the "
+            f"{capacity:g} kg capacity."
+        )
+
+    if method == "savings" and len(deliveries) > SAVINGS_MAX_STOPS:
+        logging.warning(
+            f"Savings clustering is limited to {SAVINGS_MAX_STOPS} stops. "
+            "Using the sweep instead."
+        )
+        method = "sweep"
+
+    if method == "savings":
+        if distances is None:
+            distances = location_matrix(deliveries, depot_location)
+        clusters = savings_clusters(distances, weights, capacity)
+    else:
+        clusters = sweep_clusters(deliveries, depot_location, weights, capacity)
+
+    if vehicles is not None and len(clusters) > vehicles:
+        raise ValueError(
+            f"{len(clusters)} vehicles of {capacity:g} kg are needed, "
+            f"but the fleet has {vehicles}."
+        )
+
+    jobs = []
+    for cluster in clusters:
+        cluster_distances = None
+        if distances is not None:
+            locations = [0] + [i + 1 for i in cluster]
+            cluster_distances = distances[np.ix_(locations, locations)]
+        jobs.append(
+            (
+                subset(deliveries, cluster),
+                depot_location,
+                mode,
+                criterion,
+                cluster_distances,
+                time_budget,
+            )
+        )
+
+    workers = min(workers or os.cpu_count() or 1, len(jobs))
+    if workers <= 1:
+        return [plan_route(*job) for job in jobs]
+
+    with multiprocessing.Pool(workers) as pool:
+        return pool.starmap(plan_route, jobs)
@@ -0,0 +1,266 @@
+import csv
+import itertools
+from operator import itemgetter
+
+import numpy as np
+
+from delivery import PRIORITY_PATTERN, Delivery
+from distance_matrix import to_radians
+
+FIELDS = ["customer", "latitude", "longitude", "priority", "weight_kg"]
+
+PRIORITY_LEVELS = ("High", "Medium", "Low")
+PRIORITY_CODES = {level: code for code, level in enumerate(PRIORITY_LEVELS)}
+
+# Rows read and validated at a time. Bounds the memory of the raw rows,
+# which are far larger than the columns kept from them.
+CHUNK_ROWS = 65536
+
+
+class DeliveryTable:
+    """
+    Valid deliveries stored as columns instead of one object per row.
+
+    Coordinates are kept in a single (n, 2) float64 array, priorities as
+    int8 codes into `PRIORITY_LEVELS` and weights as float32, which takes a
+    fraction of the memory of `Delivery` objects holding strings. Indexing
+    builds a `Delivery` on demand, so the table can be passed wherever a
+    list of deliveries is expected.
+
+    Args:
+        customers: Customer names.
+        coordinates: (n, 2) array of latitudes and longitudes in degrees.
+        priorities: (n,) array of codes into `PRIORITY_LEVELS`.
+        weights_kg: (n,) array of package weights.
+    """
+
+    def __init__(self, customers, coordinates, priorities, weights_kg):
+        self.customers = list(customers)
+        self.coordinates = np.asarray(coordinates, dtype=np.float64).reshape(-1, 2)
+        self.priorities = np.asarray(priorities, dtype=np.int8)
+        self.weights_kg = np.asarray(weights_kg, dtype=np.float32)
+
+    def __len__(self) -> int:
+        return len(self.customers)
+
+    def __getitem__(self, index: int) -> Delivery:
+        latitude, longitude = self.coordinates[index].tolist()
+        return Delivery(
+            self.customers[index],
+            latitude,
+            longitude,
+            PRIORITY_LEVELS[self.priorities[index]],
+            float(self.weights_kg[index]),
+        )
+
+    def __iter__(self):
+        return (self[i] for i in range(len(self)))
+
+    @classmethod
+    def concatenate(cls, tables: list["DeliveryTable"]) -> "DeliveryTable":
+        """Returns one table holding the deliveries of several, in order."""
+        if not tables:
+            return cls([], [], [], [])
+        return cls(
+            [customer for table in tables for customer in table.customers],
+            np.concatenate([table.coordinates for table in tables]),
+            np.concatenate([table.priorities for table in tables]),
+            np.concatenate([table.weights_kg for table in tables]),
+        )
+
+    def take(self, indices) -> "DeliveryTable":
+        """Returns a new table holding the deliveries at `indices`, in order."""
+        indices = np.asarray(indices, dtype=np.intp)
+        return DeliveryTable(
+            [self.customers[i] for i in indices.tolist()],
+            self.coordinates[indices],
+            self.priorities[indices],
+            self.weights_kg[indices],
+        )
+
+    def points(self, dtype=np.float64) -> np.ndarray:
+        """Returns the coordinates in radians, as `distance_matrix.to_radians`."""
+        return to_radians(self.coordinates, dtype)
+
+    def priority_weights(self) -> np.ndarray:
+        """Returns the `Delivery.PRIORITY_WEIGHTS` weight of every delivery."""
+        table = np.array(
+            [Delivery.PRIORITY_WEIGHTS[level] for level in PRIORITY_LEVELS]
+        )
+        return table[self.priorities]
+
+
+def _parse_floats(values) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Converts a column of strings with `float`, as `Delivery.validate` does.
+
+    Returns:
+        A tuple (numbers, parsed) where `parsed` marks the values that could be
+        converted; the others are NaN in `numbers`.
+    """
+    try:
+        return (
+            np.array([float(value) for value in values], dtype=np.float64),
+            np.ones(len(values), dtype=bool),
+        )
+    except (TypeError, ValueError):
+        pass
+
+    # At least one value is malformed; convert them one by one.
+    numbers = np.full(len(values), np.nan)
+    parsed = np.zeros(len(values), dtype=bool)
+    for i, value in enumerate(values):
+        try:
+            numbers[i] = float(value)
+            parsed[i] = True
+        except (TypeError, ValueError):
+            pass
+    return numbers, parsed
+
+
+def _priority_codes(priorities) -> np.ndarray:
+    """Returns the code of every priority string, or -1 where it is invalid."""
+    codes = [PRIORITY_CODES.get(priority, -1) for priority in priorities]
+    for i, code in enumerate(codes):
+        # The pattern also accepts a level followed by a trailing newline.
+        if code < 0 and priorities[i] is not None:
+            match = PRIORITY_PATTERN.match(priorities[i])
+            if match:
+                codes[i] = PRIORITY_CODES[match.group(1)]
+    return np.array(codes, dtype=np.int8)
+
+
+def validate_columns(customers, latitudes, longitudes, priorities, weights):
+    """
+    Validates a chunk of rows given column by column.
+
+    Applies the same rules as `Delivery.validate`, but the numeric checks
+    run on whole arrays at once. Missing values (None) are invalid.
+
+    Args:
+        customers, latitudes, longitudes, priorities, weights: Equally long
+            sequences of the raw CSV strings of each column.
+
+    Returns:
+        A tuple (valid, coordinates, priority_codes, weights_kg) of numpy
+        arrays over all rows of the chunk; `valid` marks the rows to keep.
+    """
+    latitude, latitude_parsed = _parse_floats(latitudes)
+    longitude, longitude_parsed = _parse_floats(longitudes)
+    weight, weight_parsed = _parse_floats(weights)
+    codes = _priority_codes(priorities)
+    printable = np.array(
+        [customer is not None and customer.isprintable() for customer in customers],
+        dtype=bool,
+    )
+
+    with np.errstate(invalid="ignore"):
+        valid = (
+            printable
+            & (codes >= 0)
+            & latitude_parsed
+            & longitude_parsed
+            & weight_parsed
+            & (latitude >= -90)
+            & (latitude <= 90)
+            & (longitude >= -180)
+            & (longitude <= 180)
+            # NaN weights pass, as `weight < 0` is False for them.
+            & ~(weight < 0)
+        )
+
+    return valid, np.column_stack((latitude, longitude)), codes, weight
+
+
+def read_deliveries(
+    path: str, rejected_path: str | None = None, chunk_rows: int = CHUNK_ROWS
+) -> tuple[DeliveryTable, int]:
+    """
+    Streams a delivery CSV into a `DeliveryTable`, chunk by chunk.
+
+    Only one chunk of raw rows is held at a time. Invalid rows are appended
+    to `rejected_path` as they are found; the file is created when the
+    first one is, so nothing is written for a clean input.
+
+    Args:
+        path: Input CSV with a header containing `FIELDS`.
+        rejected_path: CSV file receiving the invalid rows, or None to only
+            count them.
+        chunk_rows: Number of rows read and validated at a time.
+
+    Returns:
+        A tuple (table, rejected) of the valid deliveries and the number of
+        rejected rows.
+
+    Raises:
+        ValueError: If the header lacks one of `FIELDS`.
+    """
+    customers = []
+    coordinates = []
+    priorities = []
+    weights = []
+    rejected = 0
+    rejected_file = None
+    rejected_writer = None
+
+    try:
+        with open(path, "r", newline="", encoding="utf-8") as f:
+            reader = csv.reader(f)
+            header = next(reader, None)
+            if header is None:
+                return DeliveryTable([], [], [], []), 0
+
+            missing = [field for field in FIELDS if field not in header]
+            if missing:
+                raise ValueError(f"Missing columns: {', '.join(missing)}")
+            columns = [header.index(field) for field in FIELDS]
+            width = max(columns) + 1
+            select = itemgetter(*columns)
+
+            rows = filter(None, reader)
+            while True:
+                chunk = list(itertools.islice(rows, chunk_rows))
+                if not chunk:
+                    break
+
+                # Short rows are padded so that their missing fields fail.
+                chunk = [
+                    row if len(row) >= width else row + [None] * (width - len(row))
+                    for row in chunk
+                ]
+                values = list(zip(*map(select, chunk)))
+                valid, points, codes, weight = validate_columns(*values)
+
+                keep = np.flatnonzero(valid)
+                customers.extend(values[0][i] for i in keep.tolist())
+                coordinates.append(points[keep])
+                priorities.append(codes[keep])
+                weights.append(weight[keep].astype(np.float32))
+
+                if len(keep) < len(chunk):
+                    if rejected_path is not None and rejected_writer is None:
+                        rejected_file = open(
+                            rejected_path, "w", newline="", encoding="utf-8"
+                        )
+                        rejected_writer = csv.writer(rejected_file)
+                        rejected_writer.writerow(FIELDS)
+                    for i in np.flatnonzero(~valid).tolist():
+                        rejected += 1
+                        if rejected_writer is not None:
+                            rejected_writer.writerow(select(chunk[i]))
+    finally:
+        if rejected_file is not None:
+            rejected_file.close()
+
+    if not coordinates:
+        return DeliveryTable([], [], [], []), rejected
+
+    return (
+        DeliveryTable(
+            customers,
+            np.concatenate(coordinates),
+            np.concatenate(priorities),
+            np.concatenate(weights),
+        ),
+        rejected,
+    )
@@ -0,0 +1,231 @@
+import time
+
+import numpy as np
+
+# Moves must shorten the tour by more than this many kilometers, which keeps
+# floating point noise from making the search cycle.
+MIN_IMPROVEMENT = 1e-9
+
+# Matrix rows searched for nearest neighbors at a time.
+NEIGHBOR_BLOCK_ROWS = 512
+
+
+def tour_length(tour: list[int], matrix: np.ndarray) -> float:
+    """Returns the total length of a tour visiting matrix indices in order."""
+    tour = np.asarray(tour)
+    return float(matrix[tour[:-1], tour[1:]].sum())
+
+
+def neighbor_lists(matrix: np.ndarray, count: int) -> list[list[int]]:
+    """
+    Finds the `count` nearest other locations of every location.
+
+    Args:
+        matrix: (n, n) distance matrix.
+        count: Number of neighbors to keep per location.
+
+    Returns:
+        For every location, the indices of its nearest neighbors, closest first.
+    """
+    size = len(matrix)
+    count = min(count, size - 1)
+    if count <= 0:
+        return [[] for _ in range(size)]
+
+    lists = []
+    # Rows are partitioned a block at a time, so the index array argpartition
+    # builds stays at NEIGHBOR_BLOCK_ROWS x n instead of n x n.
+    for start in range(0, size, NEIGHBOR_BLOCK_ROWS):
+        block = matrix[start : start + NEIGHBOR_BLOCK_ROWS]
+        nearest = np.argpartition(block, count, axis=1)[:, : count + 1]
+        for row, candidates in enumerate(nearest, start):
+            candidates = candidates[candidates != row]
+            order = np.argsort(matrix[row, candidates], kind="stable")
+            lists.append(candidates[order][:count].tolist())
+    return lists
+
+
+class _Tour:
+    """A tour with fixed start and end positions and a location -> position map."""
+
+    def __init__(self, tour: list[int]):
+        self.order = list(tour)
+        self.position = {}
+        self.reindex(0, len(self.order) - 1)
+
+    def reindex(self, start: int, stop: int) -> None:
+        """Refreshes the positions of the locations at positions start..stop-1."""
+        for i in range(start, stop):
+            self.position[self.order[i]] = i
+
+
+def _two_opt(tour: _Tour, distance, near: list[list[int]], deadline: float) -> float:
+    """
+    Applies improving 2-opt moves until none is found or time runs out.
+
+    A move removes edges (t[lo], t[lo+1]) and (t[hi], t[hi+1]) and reconnects
+    the tour as (t[lo], t[hi]) and (t[lo+1], t[hi+1]) by reversing the stops
+    in between. Only moves whose new edge joins a location to one of its
+    neighbors are tried, and each is scored in O(1) from four distances.
+
+    Returns:
+        The distance saved.
+    """
+    order = tour.order
+    last = len(order) - 1
+    saved = 0.0
+
+    for i in range(last):
+        if i % 64 == 0 and time.perf_counter() > deadline:
+            break
+
+        a = order[i]
+        for c in near[a]:
+            j = tour.position.get(c)
+            if j is None or j == last:
+                continue
+            lo, hi = (i, j) if i < j else (j, i)
+            if hi - lo < 2:
+                continue
+
+            first, after_first = order[lo], order[lo + 1]
+            second, after_second = order[hi], order[hi + 1]
+            delta = (
+                distance(first, second)
+                + distance(after_first, after_second)
+                - distance(first, after_first)
+                - distance(second, after_second)
+            )
+            if delta < -MIN_IMPROVEMENT:
+                order[lo + 1 : hi + 1] = order[hi:lo:-1]
+                tour.reindex(lo + 1, hi + 1)
+                saved -= delta
+                break
+
+    return saved
+
+
+def _or_opt(
+    tour: _Tour, distance, near: list[list[int]], deadline: float, max_segment: int
+) -> float:
+    """
+    Applies improving Or-opt moves until none is found or time runs out.
+
+    A move takes a segment of 1 to `max_segment` consecutive stops and
+    reinserts it, possibly reversed, between two other adjacent stops next
+    to a neighbor of one of the segment's ends. Each candidate is scored in
+    O(1) as the distance saved by closing the gap minus the cost of the
+    detour.
+
+    Returns:
+        The distance saved.
+    """
+    order = tour.order
+    saved = 0.0
+
+    i = 1
+    while i < len(order) - 1:
+        if i % 64 == 0 and time.perf_counter() > deadline:
+            break
+
+        moved = False
+        for length in range(1, max_segment + 1):
+            end = i + length - 1
+            if end >= len(order) - 1:
+                break
+
+            start_stop, end_stop = order[i], order[end]
+            before, after = order[i - 1], order[end + 1]
+            gain = (
+                distance(before, start_stop)
+                + distance(end_stop, after)
+                - distance(before, after)
+            )
+            if gain <= MIN_IMPROVEMENT:
+                continue
+
+            best = None
+            for c in near[start_stop] + near[end_stop]:
+                j = tour.position.get(c)
+                if j is None:
+                    continue
+                # Try the gaps on both sides of the neighbor.
+                for u_position in (j - 1, j):
+                    if u_position < 0 or u_position >= len(order) - 1:
+                        continue
+                    if i - 1 <= u_position <= end:
+                        continue
+                    u, v = order[u_position], order[u_position + 1]
+                    base = distance(u, v)
+                    forward = distance(u, start_stop) + distance(end_stop, v) - base
+                    backward = distance(u, end_stop) + distance(start_stop, v) - base
+                    cost, reverse = min((forward, False), (backward, True))
+                    if cost < gain - MIN_IMPROVEMENT and (
+                        best is None or cost < best[0]
+                    ):
+                        best = (cost, u_position, reverse)
+
+            if best is None:
+                continue
+
+            cost, u_position, reverse = best
+            segment = order[i : end + 1]
+            if reverse:
+                segment.reverse()
+            del order[i : end + 1]
+            if u_position > end:
+                u_position -= length
+            order[u_position + 1 : u_position + 1] = segment
+
+            changed_start = min(i, u_position + 1)
+            changed_stop = max(end + 1, u_position + 1 + length)
+            tour.reindex(changed_start, changed_stop)
+            saved += gain - cost
+            moved = True
+            break
+
+        if not moved:
+            i += 1
+
+    return saved
+
+
+def improve_tour(
+    tour: list[int],
+    matrix: np.ndarray,
+    time_budget: float = 1.0,
+    neighbors: int = 8,
+    max_segment: int = 3,
+) -> tuple[list[int], float]:
+    """
+    Shortens a tour with 2-opt and Or-opt local search.
+
+    The first and last entries of the tour (the depot) stay in place. The
+    search alternates 2-opt and Or-opt passes until a pass finds no
+    improving move or the time budget runs out, so it always returns a
+    tour at least as short as the one it was given.
+
+    Args:
+        tour: Matrix indices in visiting order, starting and ending at the depot.
+        matrix: Symmetric (n, n) distance matrix.
+        time_budget: Maximum time to spend, in seconds.
+        neighbors: Number of nearest neighbors considered for each location.
+        max_segment: Longest segment of consecutive stops moved by Or-opt.
+
+    Returns:
+        A tuple (tour, saved) of the improved tour and the distance it saves.
+    """
+    deadline = time.perf_counter() + time_budget
+    near = neighbor_lists(matrix, neighbors)
+    distance = matrix.item
+
+    state = _Tour(tour)
+    saved = 0.0
+    while time.perf_counter() < deadline:
+        improvement = _two_opt(state, distance, near, deadline)
+        improvement += _or_opt(state, distance, near, deadline, max_segment)
+        if improvement <= MIN_IMPROVEMENT:
+            break
+        saved += improvement
+
+    return state.order, saved
@@ -0,0 +1,327 @@
+import csv
+import io
+import itertools
+
+import numpy as np
+
+from delivery import Delivery
+from distance_matrix import (
+    delivery_points,
+    distance_matrix,
+    distances_from,
+    leg_distances,
+    to_radians,
+)
+from local_search import improve_tour
+from report import ROUTE_FIELDS, calculate_metrics
+
+# Stops on each side of a change that local repair may reorder.
+REPAIR_WINDOW = 8
+# Seconds of local search spent on one repair window.
+REPAIR_TIME_BUDGET = 0.005
+
+LINE_END = "\r\n"
+
+
+class RoutePlan:
+    """
+    A planned round trip that can be changed without replanning it.
+
+    Stops are inserted where they lengthen the route the least and removed
+    by closing the gap. After each change a window of `REPAIR_WINDOW` stops
+    around it is improved with 2-opt/Or-opt while the rest of the tour
+    stays fixed, so a change costs O(n) array work plus a constant-size
+    search instead of a full `optimize_route`.
+
+    Leg distances and cumulative distances are kept up to date, and
+    `apply` reports the first stop whose row changed, so only the rows
+    from there on need to be recomputed and rewritten.
+
+    Args:
+        route: Delivery objects in visiting order.
+        depot_location: Tuple (latitude, longitude) of the start/end depot.
+        mode: Key of `TRANSPORT_MODES`, used for the metric columns.
+        legs: Distance of every leg, depot to depot, as returned by
+            `route_optimizer.plan_route`. Computed if omitted.
+    """
+
+    def __init__(
+        self,
+        route: list[Delivery],
+        depot_location: tuple[float, float],
+        mode: str = "Car",
+        legs: list[float] | None = None,
+    ):
+        self.route = list(route)
+        self.depot_location = depot_location
+        self.mode = mode
+        self._depot = to_radians([depot_location])[0]
+        self.points = delivery_points(self.route).reshape(-1, 2)
+
+        if legs is None:
+            legs = leg_distances(self._tour_points()).tolist()
+        if len(legs) != len(self.route) + 1:
+            raise ValueError("Expected one leg more than there are stops.")
+        self.legs = list(legs)
+        self.cumulative = list(itertools.accumulate(self.legs))
+
+        # Byte offset of every data row in the last CSV written by write_csv.
+        self._offsets = None
+        self._csv_path = None
+        # Encoded CSV fields of every row before and after Cumulative_km,
+        # which stay valid until the row's leg changes.
+        self._parts = [None] * len(self.legs)
+        self._buffer = io.StringIO()
+        self._writer = csv.writer(self._buffer, lineterminator=LINE_END)
+
+    def __len__(self) -> int:
+        return len(self.route)
+
+    def _tour_points(self, start: int = 0, stop: int | None = None) -> np.ndarray:
+        """
+        Returns the radian points of tour positions start..stop-1.
+
+        Tour position 0 is the depot, i + 1 is `route[i]` and len(route) + 1
+        is the depot again.
+        """
+        tour = np.concatenate(([self._depot], self.points, [self._depot]))
+        return tour[start:stop]
+
+    def total_distance(self) -> float:
+        """Returns the length of the round trip in kilometers."""
+        return self.cumulative[-1]
+
+    def position(self, customer: str) -> int:
+        """
+        Returns the index of the first stop of a customer.
+
+        Raises:
+            KeyError: If the customer is not on the route.
+        """
+        for i, delivery in enumerate(self.route):
+            if delivery.customer == customer:
+                return i
+        raise KeyError(customer)
+
+    def remove(self, customer: str, repair: bool = True, refresh: bool = True) -> int:
+        """
+        Removes a customer's stop and joins its neighbors directly.
+
+        Args:
+            customer: Name of the customer whose stop is cancelled.
+            repair: Whether to run local repair around the gap.
+            refresh: Whether to update the cumulative distances right away.
+
+        Returns:
+            The index of the first stop whose row changed.
+
+        Raises:
+            KeyError: If the customer is not on the route.
+        """
+        index = self.position(customer)
+        del self.route[index]
+        self.points = np.delete(self.points, index, axis=0)
+
+        before, after = self._tour_points(index, index + 2)
+        self.legs[index : index + 2] = leg_distances(np.array([before, after])).tolist()
+        self._parts[index : index + 2] = [None]
+
+        changed = index
+        if repair:
+            changed = min(changed, self.repair(index))
+        if refresh:
+            self._refresh(changed)
+        return changed
+
+    def insert(
+        self, delivery: Delivery, repair: bool = True, refresh: bool = True
+    ) -> int:
+        """
+        Inserts a stop where it adds the least distance (cheapest insertion).
+
+        Every edge of the tour is scored at once as
+        ``d(a, x) + d(x, b) - d(a, b)``.
+
+        Args:
+            delivery: The Delivery to add.
+            repair: Whether to run local repair around the new stop.
+            refresh: Whether to update the cumulative distances right away.
+
+        Returns:
+            The index of the first stop whose row changed.
+        """
+        point = to_radians([(delivery.latitude, delivery.longitude)])[0]
+        to_point = distances_from(self._tour_points(), point)
+        added = to_point[:-1] + to_point[1:] - np.array(self.legs)
+        index = int(np.argmin(added))
+
+        self.route.insert(index, delivery)
+        self.points = np.insert(self.points, index, point, axis=0)
+        self.legs[index : index + 1] = [
+            float(to_point[index]),
+            float(to_point[index + 1]),
+        ]
+        self._parts[index : index + 1] = [None, None]
+
+        changed = index
+        if repair:
+            changed = min(changed, self.repair(index))
+        if refresh:
+            self._refresh(changed)
+        return changed
+
+    def repair(self, index: int) -> int:
+        """
+        Improves the tour around stop `index` with local search.
+
+        Only the `REPAIR_WINDOW` stops on each side are reordered; the stops
+        at both ends of the window stay in place, so the rest of the tour
+        and its legs are untouched. Cumulative distances are not refreshed.
+
+        Returns:
+            The index of the first row whose leg changed, or len(self) + 1
+            if the tour did not change.
+        """
+        # Tour positions of the window ends; stop i is at tour position i + 1.
+        first = max(0, index + 1 - REPAIR_WINDOW)
+        last = min(len(self.route) + 1, index + 1 + REPAIR_WINDOW)
+        if last - first < 4:
+            return len(self.route) + 1
+
+        matrix = distance_matrix(self._tour_points(first, last + 1))
+        tour, saved = improve_tour(list(range(len(matrix))), matrix, REPAIR_TIME_BUDGET)
+        if not saved:
+            return len(self.route) + 1
+
+        order = [k - 1 for k in tour[1:-1]]
+        window = slice(first, last - 1)
+        stops = self.route[window]
+        self.route[window] = [stops[k] for k in order]
+        self.points[window] = self.points[window][order]
+        self.legs[first:last] = matrix[tour[:-1], tour[1:]].tolist()
+        self._parts[first:last] = [None] * (last - first)
+
+        moved = [k for k, original in enumerate(order) if k != original]
+        return first + moved[0] if moved else len(self.route) + 1
+
+    def _refresh(self, start: int) -> None:
+        """Recomputes the cumulative distances from row `start` on."""
+        initial = self.cumulative[start - 1] if start else 0.0
+        cumulative = itertools.accumulate(self.legs[start:], initial=initial)
+        next(cumulative)
+        self.cumulative[start:] = cumulative
+
+    def apply(self, insertions: list[Delivery] = (), removals: list[str] = ()) -> int:
+        """
+        Applies a set of cancelled and added stops.
+
+        Removals are checked before anything changes, so an unknown customer
+        leaves the plan untouched.
+
+        Args:
+            insertions: Deliveries to add.
+            removals: Customers whose stop is cancelled.
+
+        Returns:
+            The index of the first changed row; rows before it are unchanged.
+
+        Raises:
+            KeyError: If a removed customer is not on the route.
+        """
+        customers = [delivery.customer for delivery in self.route]
+        for customer in removals:
+            if customer not in customers:
+                raise KeyError(customer)
+            customers.remove(customer)
+
+        # Cumulative distances are refreshed once, from the earliest change.
+        changed = len(self.route) + 1
+        for customer in removals:
+            changed = min(changed, self.remove(customer, refresh=False))
+        for delivery in insertions:
+            changed = min(changed, self.insert(delivery, refresh=False))
+        self._refresh(min(changed, len(self.legs) - 1))
+        return changed
+
+    def rows(self, start: int = 0) -> list[tuple]:
+        """
+        Returns the route CSV rows from row `start` on.
+
+        The rows match those written by `report.route_rows`: one per stop
+        and a final DEPOT_END row, with the leg's distance, cumulative
+        distance, ETA, cost and CO2.
+        """
+        rows = []
+        for i in range(start, len(self.legs)):
+            customer = self.route[i].customer if i < len(self.route) else "DEPOT_END"
+            distance = self.legs[i]
+            eta, cost, co2 = calculate_metrics(distance, self.mode)
+            rows.append(
+                (
+                    customer,
+                    round(distance, 2),
+                    round(self.cumulative[i], 2),
+                    round(eta, 2),
+                    round(cost, 2),
+                    round(co2, 2),
+                )
+            )
+        return rows
+
+    def _encode(self, row) -> bytes:
+        """Formats a row as a CSV line, exactly as `csv.writer` writes it."""
+        self._writer.writerow(row)
+        line = self._buffer.getvalue().encode("utf-8")
+        self._buffer.seek(0)
+        self._buffer.truncate()
+        return line
+
+    def _line(self, i: int) -> bytes:
+        """Returns the encoded CSV line of row `i`."""
+        parts = self._parts[i]
+        if parts is None:
+            customer = self.route[i].customer if i < len(self.route) else "DEPOT_END"
+            distance = self.legs[i]
+            eta, cost, co2 = calculate_metrics(distance, self.mode)
+            head = self._encode((customer, round(distance, 2)))[: -len(LINE_END)]
+            tail = self._encode(("", round(eta, 2), round(cost, 2), round(co2, 2)))
+            parts = self._parts[i] = (head + b",", tail)
+        return parts[0] + repr(round(self.cumulative[i], 2)).encode() + parts[1]
+
+    def write_csv(self, path: str, start: int = 0) -> None:
+        """
+        Writes the route CSV, rewriting only the rows from `start` on.
+
+        The file is truncated at the first rewritten row, so the rows before
+        it are not written again, and rows whose leg did not change only
+        have their cumulative distance formatted. A partial write needs the
+        file to have been written by this plan before; otherwise the whole
+        file is written.
+        """
+        if self._csv_path != path or not self._offsets:
+            start = 0
+        start = min(start, len(self._offsets or [0]) - 1)
+        lines = [self._line(i) for i in range(start, len(self.legs))]
+
+        if start == 0:
+            header = self._encode(ROUTE_FIELDS)
+            with open(path, "wb") as f:
+                f.write(header)
+                offset = len(header)
+                self._offsets = []
+                for line in lines:
+                    self._offsets.append(offset)
+                    offset += len(line)
+                f.writelines(lines)
+            self._csv_path = path
+            return
+
+        with open(path, "r+b") as f:
+            offset = self._offsets[start]
+            f.seek(offset)
+            f.truncate()
+            del self._offsets[start:]
+            for line in lines:
+                self._offsets.append(offset)
+                offset += len(line)
+            f.writelines(lines)
@@ -0,0 +1,78 @@
+import csv
+
+from transport import TRANSPORT_MODES
+
+ROUTE_FIELDS = [
+    "Customer",
+    "Distance_km",
+    "Cumulative_km",
+    "ETA_h",
+    "Cost_NOK",
+    "CO2_g",
+]
+
+
+def calculate_metrics(distance: float, mode: str) -> tuple[float, float, float]:
+    """Calculates ETA, Cost, and CO2 for a given distance and transport mode."""
+    mode_data = TRANSPORT_MODES[mode]
+    speed = mode_data["speed"]
+    cost_per_km = mode_data["cost"]
+    co2_per_km = mode_data["co2"]
+
+    eta = distance / speed
+    cost = distance * cost_per_km
+    co2 = distance * co2_per_km
+    return eta, cost, co2
+
+
+def route_rows(
+    route: list, legs: list[float], mode: str
+) -> tuple[list[tuple], tuple[float, float, float, float]]:
+    """
+    Computes the per-stop metrics of a route.
+
+    Returns:
+        A tuple (rows, totals): a (customer, distance, cumulative, eta, cost,
+        co2) row per leg, ending with DEPOT_END, and the route's total
+        (distance, eta, cost, co2).
+    """
+    stops = [stop.customer for stop in route] + ["DEPOT_END"]
+
+    total_distance = 0
+    total_eta = 0
+    total_cost = 0
+    total_co2 = 0
+    cumulative = 0
+
+    output_rows = []
+
+    for customer, distance in zip(stops, legs):
+        eta, cost, co2 = calculate_metrics(distance, mode)
+
+        total_distance += distance
+        total_eta += eta
+        total_cost += cost
+        total_co2 += co2
+
+        cumulative += distance
+
+        output_rows.append(
+            (
+                customer,
+                round(distance, 2),
+                round(cumulative, 2),
+                round(eta, 2),
+                round(cost, 2),
+                round(co2, 2),
+            )
+        )
+
+    return output_rows, (total_distance, total_eta, total_cost, total_co2)
+
+
+def write_route_csv(output: str, rows: list[tuple]) -> None:
+    """Writes rows from `route_rows` to a route CSV file."""
+    with open(output, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(ROUTE_FIELDS)
+        writer.writerows(rows)
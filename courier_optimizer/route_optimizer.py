@@ -1,11 +1,167 @@
-from haversine import get_haversine_distance
+import numpy as np
+
 from delivery import Delivery
+from distance_cache import DistanceCache
+from distance_matrix import (
+    delivery_points,
+    distance_matrix,
+    distances_from,
+    leg_distances,
+    to_radians,
+)
+from local_search import improve_tour, tour_length
+from spatial_index import PriorityIndex
 from transport import TRANSPORT_MODES
 
+CRITERIA = ("time", "cost", "co2")
+
+# Above this many deliveries, stops are selected through a spatial index
+# instead of a full scan of the remaining deliveries at every step.
+SPATIAL_INDEX_THRESHOLD = 3000
+
+# Local search needs the full distance matrix, which grows quadratically.
+LOCAL_SEARCH_MAX_STOPS = 10000
+
+
+def criterion_factor(mode_data: dict, criterion: str) -> float:
+    """
+    Returns what one kilometer costs under an optimization criterion.
+
+    Args:
+        mode_data: A `TRANSPORT_MODES` entry with speed, cost and co2.
+        criterion: One of "time" (hours), "cost" (NOK) or "co2" (grams).
+
+    Raises:
+        ValueError: If the criterion is unknown.
+    """
+    if criterion == "time":
+        return 1 / mode_data["speed"]
+    if criterion == "cost":
+        return mode_data["cost"]
+    if criterion == "co2":
+        return mode_data["co2"]
+    raise ValueError(f"Unknown criterion '{criterion}'.")
+
+
+def priority_weights(deliveries) -> np.ndarray:
+    """Returns the `Delivery.PRIORITY_WEIGHTS` weight of every delivery."""
+    if hasattr(deliveries, "priority_weights"):
+        return deliveries.priority_weights()
+    PRIORITY_WEIGHTS = Delivery.PRIORITY_WEIGHTS
+    return np.array(
+        [PRIORITY_WEIGHTS.get(delivery.priority, 1.0) for delivery in deliveries]
+    )
+
+
+def location_matrix(
+    deliveries: list[Delivery],
+    depot_location: tuple[float, float],
+    cache: DistanceCache | None = None,
+) -> np.ndarray:
+    """
+    Computes the distances between the depot and all deliveries.
+
+    Index 0 is the depot and index i + 1 is `deliveries[i]`. The matrix is
+    computed once and shared by every criterion and stage of a run. It is
+    stored as float32 above 4000 deliveries to halve its size.
+
+    Args:
+        deliveries: List of Delivery objects.
+        depot_location: Tuple (latitude, longitude) of the depot.
+        cache: Optional `DistanceCache` that the matrix is read from and
+            stored in.
+    """
+    dtype = np.float32 if len(deliveries) > 4000 else np.float64
+    points = np.concatenate(
+        (to_radians([depot_location], dtype), delivery_points(deliveries, dtype))
+    )
+    if cache is not None:
+        return cache.matrix(points)
+    return distance_matrix(points)
+
+
+def edge_costs(distances: np.ndarray, mode_data: dict, criterion: str) -> np.ndarray:
+    """
+    Builds the edge-cost matrix of a criterion from a distance matrix.
+
+    Modes with no cost under the criterion (cost and CO2 for Bicycle and
+    Walk) would make every route cost nothing. Their edges are ranked by
+    distance instead, so the result is still deterministic and short.
+
+    Args:
+        distances: Matrix from `location_matrix`.
+        mode_data: A `TRANSPORT_MODES` entry.
+        criterion: One of `CRITERIA`.
+
+    Returns:
+        A matrix of the same shape holding the cost of every edge.
+    """
+    factor = criterion_factor(mode_data, criterion)
+    if factor == 0:
+        return distances
+    return distances * np.asarray(factor, dtype=distances.dtype)
+
+
+def nearest_neighbor_order(
+    deliveries: list[Delivery],
+    depot_location: tuple[float, float],
+    distances: np.ndarray | None = None,
+) -> list[int]:
+    """
+    Orders deliveries with the Weighted Nearest Neighbor heuristic.
+
+    Each step picks the remaining delivery with the lowest distance times
+    its priority weight, and the delivery listed first on ties.
+
+    Args:
+        deliveries: List of Delivery objects to be routed.
+        depot_location: Tuple (latitude, longitude) of the start/end depot.
+        distances: Optional shared matrix from `location_matrix`. Its rows
+            are reused instead of computing distances again.
+
+    Returns:
+        Indices into `deliveries` in visiting order.
+    """
+    if not deliveries:
+        return []
+
+    points = delivery_points(deliveries)
+    weights = priority_weights(deliveries)
+
+    order = []
+    current = to_radians([depot_location])[0]
+
+    if distances is None and len(deliveries) > SPATIAL_INDEX_THRESHOLD:
+        index = PriorityIndex(points, weights)
+        for _ in range(len(deliveries)):
+            best = index.nearest(current)
+            order.append(best)
+            index.remove(best)
+            current = points[best]
+        return order
+
+    visited = np.zeros(len(deliveries), dtype=bool)
+    row = 0
+    for _ in range(len(deliveries)):
+        if distances is None:
+            weighted_distance = distances_from(points, current) * weights
+        else:
+            weighted_distance = distances[row, 1:] * weights
+        weighted_distance[visited] = np.inf
+
+        best = int(np.argmin(weighted_distance))
+        order.append(best)
+        visited[best] = True
+        current = points[best]
+        row = best + 1
+
+    return order
+
 
 def optimize_route(
     deliveries: list[Delivery],
     depot_location: tuple[float, float],
+    distances: np.ndarray | None = None,
 ) -> list[Delivery]:
     """
     Computes an optimized delivery route using the Weighted Nearest Neighbor heuristic.
@@ -14,48 +170,138 @@ def optimize_route(
     priority factors influence the selection order (e.g., High priority makes the
     effective distance smaller).
 
+    Coordinates are converted to radians once. Small instances compute the
+    distances from the current stop to every delivery in a single vectorized
+    pass per step, masking out visited deliveries. Larger ones query a
+    `PriorityIndex`, which brings the whole route to roughly O(n log n).
+    Both select the same stops; ties go to the delivery listed first, as in
+    a sequential scan.
+
     Args:
         deliveries: List of Delivery objects to be routed.
         depot_location: Tuple (latitude, longitude) of the start/end depot.
+        distances: Optional shared matrix from `location_matrix`.
 
     Returns:
         A list of Delivery objects representing the optimized route order.
     """
-    if not deliveries:
-        return []
+    order = nearest_neighbor_order(deliveries, depot_location, distances)
+    return [deliveries[i] for i in order]
 
-    PRIORITY_WEIGHTS = Delivery.PRIORITY_WEIGHTS
 
-    route = []
-    remaining = deliveries.copy()
+def improve_order(
+    order: list[int],
+    costs: np.ndarray,
+    time_budget: float = 1.0,
+    neighbors: int = 8,
+) -> list[int]:
+    """
+    Improves a delivery order with local search over a location cost matrix.
 
-    current_lat, current_lon = depot_location
+    Args:
+        order: Indices into the deliveries, e.g. from `nearest_neighbor_order`.
+        costs: Edge costs over the depot and deliveries, laid out as in
+            `location_matrix`.
+        time_budget: Maximum time to spend searching, in seconds.
+        neighbors: Number of nearest neighbors considered for each stop.
 
-    while remaining:
-        best_delivery = None
-        min_weighted_distance = float("inf")
+    Returns:
+        The improved order.
+    """
+    if len(order) < 3:
+        return list(order)
 
-        for next_delivery in remaining:
-            distance = get_haversine_distance(
-                float(current_lat),
-                float(current_lon),
-                float(next_delivery.latitude),
-                float(next_delivery.longitude),
-            )
+    tour = [0] + [i + 1 for i in order] + [0]
+    tour, _ = improve_tour(tour, costs, time_budget, neighbors)
+    return [i - 1 for i in tour[1:-1]]
 
-            priority_weight = PRIORITY_WEIGHTS.get(next_delivery.priority, 1.0)
 
-            weighted_distance = distance * priority_weight
+def improve_route(
+    route: list[Delivery],
+    depot_location: tuple[float, float],
+    time_budget: float = 1.0,
+    neighbors: int = 8,
+) -> tuple[list[Delivery], float]:
+    """
+    Shortens a round trip from the depot with 2-opt and Or-opt local search.
 
-            if weighted_distance < min_weighted_distance:
-                min_weighted_distance = weighted_distance
-                best_delivery = next_delivery
+    The moves only consider distance, so they may reorder stops chosen early
+    because of their priority.
 
-        if best_delivery:
-            route.append(best_delivery)
-            remaining.remove(best_delivery)
-            current_lat, current_lon = best_delivery.latitude, best_delivery.longitude
-        else:
-            break
+    Args:
+        route: Delivery objects in visiting order, e.g. from `optimize_route`.
+        depot_location: Tuple (latitude, longitude) of the start/end depot.
+        time_budget: Maximum time to spend searching, in seconds.
+        neighbors: Number of nearest neighbors considered for each stop.
+
+    Returns:
+        A tuple (route, saved_km) of the improved route and the distance saved.
+    """
+    if len(route) < 3:
+        return list(route), 0.0
+
+    matrix = location_matrix(route, depot_location)
+    tour = [0] + list(range(1, len(route) + 1)) + [0]
+    tour, saved = improve_tour(tour, matrix, time_budget, neighbors)
+
+    return [route[i - 1] for i in tour[1:-1]], saved
+
+
+def plan_route(
+    deliveries: list[Delivery],
+    depot_location: tuple[float, float],
+    mode: str = "Car",
+    criterion: str = "time",
+    distances: np.ndarray | None = None,
+    time_budget: float | None = None,
+) -> tuple[list[Delivery], list[float], float]:
+    """
+    Plans a round trip for one transport mode and optimization criterion.
+
+    The greedy route is built and, when a time budget is given, improved
+    with local search on the criterion's edge costs. Pass the same
+    `distances` matrix to plan several criteria without recomputing it.
+
+    Every criterion is a linear per-kilometer cost of the mode (hours,
+    NOK or grams per km), so it ranks edges exactly as distance does: the
+    greedy route is the same for every criterion, local search makes the
+    same moves up to rounding, and mostly the reported totals differ. Costs
+    that are not proportional to distance, such as fixed per-stop costs or
+    traffic-dependent speeds, are not modeled.
+
+    Args:
+        deliveries: List of validated Delivery objects.
+        depot_location: Tuple (latitude, longitude) of the start/end depot.
+        mode: Key of `TRANSPORT_MODES`.
+        criterion: One of `CRITERIA`.
+        distances: Optional shared matrix from `location_matrix`. Computed
+            here when local search needs it.
+        time_budget: Seconds of local search, or None to skip it. Routes with
+            more than `LOCAL_SEARCH_MAX_STOPS` stops are not improved.
+
+    Returns:
+        A tuple (route, legs, saved_km): the deliveries in visiting order, the
+        distance of every leg from the depot back to the depot, and the
+        distance saved by local search.
+    """
+    mode_data = TRANSPORT_MODES[mode]
+    order = nearest_neighbor_order(deliveries, depot_location, distances)
+
+    saved = 0.0
+    if time_budget and 3 <= len(order) <= LOCAL_SEARCH_MAX_STOPS:
+        if distances is None:
+            distances = location_matrix(deliveries, depot_location)
+        before = tour_length([0] + [i + 1 for i in order] + [0], distances)
+        costs = edge_costs(distances, mode_data, criterion)
+        order = improve_order(order, costs, time_budget)
+        saved = before - tour_length([0] + [i + 1 for i in order] + [0], distances)
+
+    tour = [0] + [i + 1 for i in order] + [0]
+    if distances is not None:
+        legs = distances[tour[:-1], tour[1:]].tolist()
+    else:
+        depot = to_radians([depot_location])
+        stops = np.concatenate((depot, delivery_points(deliveries)[order], depot))
+        legs = leg_distances(stops).tolist()
 
-    return route
+    return [deliveries[i] for i in order], legs, saved
@@ -0,0 +1,452 @@
+import argparse
+import asyncio
+import concurrent.futures
+import json
+import os
+
+import numpy as np
+
+from distance_cache import DEFAULT_MAX_BYTES, MemoryDistanceCache
+from ingest import FIELDS, DeliveryTable, validate_columns
+from logger import logging
+from report import route_rows
+from route_optimizer import (
+    CRITERIA,
+    LOCAL_SEARCH_MAX_STOPS,
+    location_matrix,
+    plan_route,
+)
+from transport import TRANSPORT_MODES
+
+# Small requests for the same depot arriving within this many seconds of
+# each other are planned together in one worker task.
+BATCH_WINDOW = 0.005
+SMALL_REQUEST_STOPS = 200
+# Batches share one distance matrix; location_matrix switches to float32
+# above 4000 deliveries, which would change the routes of batched requests.
+BATCH_MAX_STOPS = 4000
+
+MAX_BODY_BYTES = 64 * 1024 * 1024
+
+RESPONSE_FIELDS = [
+    "customer",
+    "distance_km",
+    "cumulative_km",
+    "eta_h",
+    "cost_nok",
+    "co2_g",
+]
+
+STATUS_TEXT = {
+    200: "OK",
+    400: "Bad Request",
+    404: "Not Found",
+    405: "Method Not Allowed",
+    413: "Payload Too Large",
+    500: "Internal Server Error",
+}
+
+# Distance matrices kept warm in each worker process between requests.
+_cache = None
+
+
+def _init_worker(cache_bytes: int) -> None:
+    """Pool initializer: create the worker's distance cache."""
+    global _cache
+    _cache = MemoryDistanceCache(cache_bytes)
+
+
+def _ping() -> int:
+    """Does nothing; used to start the worker processes ahead of requests."""
+    return os.getpid()
+
+
+def _text(value):
+    """Converts a JSON value to the string form validated for CSV fields."""
+    if value is None or isinstance(value, (bool, dict, list)):
+        return None
+    return value if isinstance(value, str) else str(value)
+
+
+def parse_request(payload: dict) -> dict:
+    """
+    Validates a route request and converts it to a planning job.
+
+    A request is a JSON object with `depot` ([lat, lon] or "lat,lon"),
+    `deliveries` (objects with the `ingest.FIELDS` keys) and optionally
+    `mode`, `criterion` and `improve` (seconds of local search). Invalid
+    deliveries are dropped and reported by index, like rows in
+    `rejected.csv`.
+
+    Raises:
+        ValueError: If the request itself is malformed.
+    """
+    if not isinstance(payload, dict):
+        raise ValueError("Expected a JSON object.")
+
+    depot = payload.get("depot")
+    try:
+        if isinstance(depot, str):
+            depot = depot.split(",")
+        latitude, longitude = map(float, depot)
+    except (TypeError, ValueError):
+        raise ValueError("Invalid depot. Expected [lat, lon] or 'lat,lon'.")
+
+    mode = str(payload.get("mode") or "Car").title()
+    if mode not in TRANSPORT_MODES:
+        raise ValueError(f"Invalid mode '{payload.get('mode')}'.")
+    criterion = str(payload.get("criterion") or "time").lower()
+    if criterion not in CRITERIA:
+        raise ValueError(f"Invalid criterion '{payload.get('criterion')}'.")
+
+    improve = payload.get("improve")
+    if improve is not None:
+        try:
+            improve = float(improve)
+        except (TypeError, ValueError):
+            raise ValueError(f"Invalid improve time '{improve}'.")
+        if not improve >= 0:
+            raise ValueError(f"Invalid improve time '{improve}'.")
+
+    items = payload.get("deliveries")
+    if not isinstance(items, list):
+        raise ValueError("Expected a list of deliveries.")
+
+    columns = [
+        [_text(item.get(field)) if isinstance(item, dict) else None for item in items]
+        for field in FIELDS
+    ]
+    valid, coordinates, codes, weights = validate_columns(*columns)
+    keep = np.flatnonzero(valid)
+
+    return {
+        "depot": (latitude, longitude),
+        "mode": mode,
+        "criterion": criterion,
+        "improve": improve or None,
+        "deliveries": DeliveryTable(
+            [columns[0][i] for i in keep.tolist()],
+            coordinates[keep],
+            codes[keep],
+            weights[keep],
+        ),
+        "rejected": np.flatnonzero(~valid).tolist(),
+    }
+
+
+def _response(job: dict, route, legs: list[float], saved: float) -> dict:
+    """Builds the JSON response of a planned job."""
+    rows, (distance, eta, cost, co2) = route_rows(route, legs, job["mode"])
+    return {
+        "mode": job["mode"],
+        "criterion": job["criterion"],
+        "deliveries": len(route),
+        "rejected": job["rejected"],
+        "route": [dict(zip(RESPONSE_FIELDS, row)) for row in rows],
+        "totals": {
+            "distance_km": round(distance, 2),
+            "eta_h": round(eta, 2),
+            "cost_nok": round(cost, 2),
+            "co2_g": round(co2, 2),
+        },
+        "saved_km": round(saved, 2),
+    }
+
+
+def plan_batch(jobs: list[dict]) -> list[dict]:
+    """
+    Plans the route of every job in a batch for one depot.
+
+    Runs in a worker process. The deliveries of all jobs share one distance
+    matrix from the worker's warm cache, and each job routes over its own
+    block of it. A failing job returns an `error` instead of a route.
+
+    Args:
+        jobs: Jobs from `parse_request` with the same depot.
+
+    Returns:
+        A response for every job, in order.
+    """
+    global _cache
+    if _cache is None:
+        _cache = MemoryDistanceCache(DEFAULT_MAX_BYTES)
+
+    depot = jobs[0]["depot"]
+    combined = DeliveryTable.concatenate([job["deliveries"] for job in jobs])
+    distances = None
+    if 0 < len(combined) <= LOCAL_SEARCH_MAX_STOPS:
+        distances = location_matrix(combined, depot, _cache)
+
+    responses = []
+    start = 0
+    for job in jobs:
+        deliveries = job["deliveries"]
+        stop = start + len(deliveries)
+        try:
+            job_distances = None
+            if distances is not None:
+                locations = [0] + list(range(start + 1, stop + 1))
+                job_distances = distances[np.ix_(locations, locations)]
+            route, legs, saved = plan_route(
+                deliveries,
+                depot,
+                job["mode"],
+                job["criterion"],
+                job_distances,
+                job["improve"],
+            )
+            responses.append(_response(job, route, legs, saved))
+        except Exception as e:
+            logging.error(f"Route request failed: {e}")
+            responses.append({"error": str(e)})
+        start = stop
+
+    return responses
+
+
+class RoutingService:
+    """
+    Plans routes for JSON requests over HTTP, keeping worker state warm.
+
+    Route planning runs in a process pool so the event loop only parses
+    and answers requests. Each worker keeps a `MemoryDistanceCache`, so
+    re-plans around the same locations reuse their distances. Small
+    requests without local search for the same depot are collected for
+    `batch_window` seconds and planned in a single worker task.
+
+    Args:
+        workers: Worker processes (default: CPUs).
+        batch_window: Seconds to wait for more requests to batch.
+        cache_bytes: Size limit of each worker's distance cache.
+        executor: Executor to plan in instead of a new process pool.
+    """
+
+    def __init__(
+        self,
+        workers: int | None = None,
+        batch_window: float = BATCH_WINDOW,
+        cache_bytes: int = DEFAULT_MAX_BYTES,
+        executor: concurrent.futures.Executor | None = None,
+    ):
+        self.workers = workers or os.cpu_count() or 1
+        self.batch_window = batch_window
+        if executor is None:
+            executor = concurrent.futures.ProcessPoolExecutor(
+                self.workers, initializer=_init_worker, initargs=(cache_bytes,)
+            )
+        self.executor = executor
+        self.requests = 0
+        self.batches = 0
+        # Maps a depot to the (job, future) pairs waiting to be batched.
+        self._pending = {}
+        # Maps a depot to the timer that flushes its pending batch.
+        self._timers = {}
+        self._tasks = set()
+
+    async def warm_up(self) -> None:
+        """Starts the worker processes before the first request."""
+        loop = asyncio.get_running_loop()
+        await asyncio.gather(
+            *(loop.run_in_executor(self.executor, _ping) for _ in range(self.workers))
+        )
+
+    def close(self) -> None:
+        """Shuts down the worker processes."""
+        self.executor.shutdown(cancel_futures=True)
+
+    async def plan(self, payload: dict) -> dict:
+        """
+        Plans the route of one request.
+
+        Raises:
+            ValueError: If the request is malformed.
+        """
+        job = parse_request(payload)
+        self.requests += 1
+        loop = asyncio.get_running_loop()
+        size = len(job["deliveries"])
+
+        if job["improve"] or size > SMALL_REQUEST_STOPS:
+            self.batches += 1
+            responses = await loop.run_in_executor(self.executor, plan_batch, [job])
+            return responses[0]
+
+        key = job["depot"]
+        pending = self._pending.get(key)
+        if pending and sum(len(j["deliveries"]) for j, _ in pending) + size > (
+            BATCH_MAX_STOPS
+        ):
+            self._flush(key)
+            pending = None
+        if not pending:
+            pending = self._pending[key] = []
+            self._timers[key] = loop.call_later(self.batch_window, self._flush, key)
+
+        future = loop.create_future()
+        pending.append((job, future))
+        return await future
+
+    def _flush(self, key) -> None:
+        """Sends the requests waiting for a depot to a worker."""
+        # A batch flushed early must not leave its timer to cut the next short.
+        timer = self._timers.pop(key, None)
+        if timer is not None:
+            timer.cancel()
+        pending = self._pending.pop(key, None)
+        if pending:
+            task = asyncio.ensure_future(self._run_batch(pending))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _run_batch(self, pending: list) -> None:
+        self.batches += 1
+        loop = asyncio.get_running_loop()
+        try:
+            responses = await loop.run_in_executor(
+                self.executor, plan_batch, [job for job, _ in pending]
+            )
+        except Exception as e:
+            for _, future in pending:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        for (_, future), response in zip(pending, responses):
+            if not future.done():
+                future.set_result(response)
+
+    async def respond(self, method: str, path: str, body: bytes) -> tuple[int, dict]:
+        """Returns the status and JSON body answering an HTTP request."""
+        path = path.split("?", 1)[0]
+        if path == "/health":
+            if method != "GET":
+                return 405, {"error": "Use GET."}
+            return 200, {
+                "status": "ok",
+                "requests": self.requests,
+                "batches": self.batches,
+            }
+        if path == "/modes":
+            if method != "GET":
+                return 405, {"error": "Use GET."}
+            return 200, TRANSPORT_MODES
+        if path != "/route":
+            return 404, {"error": f"Unknown path '{path}'."}
+        if method != "POST":
+            return 405, {"error": "Use POST."}
+
+        try:
+            payload = json.loads(body)
+            response = await self.plan(payload)
+        except ValueError as e:
+            return 400, {"error": str(e)}
+        except Exception as e:
+            logging.error(f"Route request failed: {e}")
+            return 500, {"error": str(e)}
+        return (500 if "error" in response else 200), response
+
+    async def handle(self, reader, writer) -> None:
+        """Serves the HTTP/1.1 requests of one connection."""
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line.strip():
+                    break
+                try:
+                    method, path, version = request_line.decode("latin-1").split()
+                except ValueError:
+                    await self._send(writer, 400, {"error": "Bad request line."}, False)
+                    break
+
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+
+                try:
+                    length = int(headers.get("content-length", 0))
+                except ValueError:
+                    length = -1
+                if not 0 <= length <= MAX_BODY_BYTES:
+                    await self._send(
+                        writer, 413, {"error": "Invalid body size."}, False
+                    )
+                    break
+                body = await reader.readexactly(length) if length else b""
+
+                status, response = await self.respond(method, path, body)
+                keep_alive = (
+                    version == "HTTP/1.1"
+                    and headers.get("connection", "").lower() != "close"
+                )
+                await self._send(writer, status, response, keep_alive)
+                if not keep_alive:
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    async def _send(self, writer, status: int, response, keep_alive: bool) -> None:
+        body = json.dumps(response).encode()
+        head = (
+            f"HTTP/1.1 {status} {STATUS_TEXT[status]}\r\n"
+            "Content-Type: application/json\r\n"
+            f"Content-Length: {len(body)}\r\n"
+            f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n"
+        )
+        writer.write(head.encode("latin-1") + body)
+        await writer.drain()
+
+    async def serve(self, host: str = "127.0.0.1", port: int = 8080) -> None:
+        """Warms up the workers and serves requests until cancelled."""
+        await self.warm_up()
+        server = await asyncio.start_server(self.handle, host, port)
+        logging.info(f"Routing service listening on {host}:{port}")
+        print(f"Routing service listening on http://{host}:{port}")
+        async with server:
+            await server.serve_forever()
+
+
+def main(args):
+    service = RoutingService(
+        workers=args.workers,
+        batch_window=args.batch_window / 1000,
+        cache_bytes=int(args.cache_size * 1024 * 1024),
+    )
+    try:
+        asyncio.run(service.serve(args.host, args.port))
+    except KeyboardInterrupt:
+        print("Shutting down.")
+    finally:
+        service.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Serve route planning for NordicExpress over HTTP."
+    )
+    parser.add_argument("--host", default="127.0.0.1", help="Address to listen on")
+    parser.add_argument("--port", type=int, default=8080, help="Port to listen on")
+    parser.add_argument(
+        "--workers", type=int, default=None, help="Worker processes (default: CPUs)"
+    )
+    parser.add_argument(
+        "--batch-window",
+        type=float,
+        default=BATCH_WINDOW * 1000,
+        metavar="MS",
+        help="Milliseconds to collect small requests for the same depot",
+    )
+    parser.add_argument(
+        "--cache-size",
+        type=float,
+        default=DEFAULT_MAX_BYTES / (1024 * 1024),
+        metavar="MB",
+        help="Distance cache size of each worker in megabytes (default: %(default)g)",
+    )
+
+    args = parser.parse_args()
+    main(args)
@@ -0,0 +1,256 @@
+import math
+
+import numpy as np
+
+from distance_matrix import distances_from
+
+# Candidates whose chord length is within this relative margin of the nearest
+# one are re-checked with the haversine formula, so floating point rounding in
+# the 3-D coordinates can never change which stop is selected.
+CHORD_TOLERANCE = 1e-9
+CHORD_ABSOLUTE_TOLERANCE = 1e-12
+
+
+def to_unit_sphere(points: np.ndarray) -> np.ndarray:
+    """
+    Maps radian (latitude, longitude) pairs to 3-D points on the unit sphere.
+
+    The straight-line (chord) distance between two such points grows
+    monotonically with their great-circle distance, so nearest neighbors in
+    3-D are nearest neighbors on the globe, without the distortion of
+    treating latitude and longitude as flat coordinates.
+    """
+    latitude = points[:, 0].astype(np.float64)
+    longitude = points[:, 1].astype(np.float64)
+    cos_latitude = np.cos(latitude)
+    return np.column_stack(
+        (
+            cos_latitude * np.cos(longitude),
+            cos_latitude * np.sin(longitude),
+            np.sin(latitude),
+        )
+    )
+
+
+class KDTree:
+    """
+    A 3-D KD-tree over a fixed set of points that supports deletion.
+
+    The tree is built once by splitting at the median of the widest axis.
+    Each node keeps a bounding box and a count of points not yet removed,
+    so removal is O(log n) and searches skip emptied subtrees entirely.
+
+    Args:
+        xyz: (n, 3) array of point coordinates.
+        indices: Identifiers of the points, returned by queries. Defaults to
+            0..n-1.
+        leaf_size: Maximum number of points stored in a leaf.
+    """
+
+    def __init__(self, xyz: np.ndarray, indices=None, leaf_size: int = 16):
+        if indices is None:
+            indices = np.arange(len(xyz))
+        indices = np.asarray(indices)
+
+        self._coordinates = {
+            int(i): (float(x), float(y), float(z)) for i, (x, y, z) in zip(indices, xyz)
+        }
+        self._alive = set(self._coordinates)
+        self._leaf_of = {}
+
+        self._low = []
+        self._high = []
+        self._children = []
+        self._parent = []
+        self._count = []
+        self._leaves = []
+
+        if len(indices):
+            self._build(np.asarray(xyz, dtype=np.float64), indices, -1, leaf_size)
+
+    def __len__(self) -> int:
+        return len(self._alive)
+
+    def _build(self, xyz, indices, parent, leaf_size) -> int:
+        """Recursively builds the subtree over `indices` and returns its node id."""
+        node = len(self._low)
+        low = xyz.min(axis=0)
+        high = xyz.max(axis=0)
+        self._low.append(tuple(low.tolist()))
+        self._high.append(tuple(high.tolist()))
+        self._parent.append(parent)
+        self._count.append(len(indices))
+        self._children.append(None)
+        self._leaves.append(None)
+
+        if len(indices) <= leaf_size:
+            self._leaves[node] = [int(i) for i in indices]
+            for i in self._leaves[node]:
+                self._leaf_of[i] = node
+            return node
+
+        axis = int(np.argmax(high - low))
+        middle = len(indices) // 2
+        order = np.argpartition(xyz[:, axis], middle)
+        left = self._build(
+            xyz[order[:middle]], indices[order[:middle]], node, leaf_size
+        )
+        right = self._build(
+            xyz[order[middle:]], indices[order[middle:]], node, leaf_size
+        )
+        self._children[node] = (left, right)
+        return node
+
+    def remove(self, index: int) -> None:
+        """Removes a point so that it is no longer returned by queries."""
+        self._alive.remove(index)
+        node = self._leaf_of[index]
+        while node != -1:
+            self._count[node] -= 1
+            node = self._parent[node]
+
+    def nearest(self, point, tolerance: float = 0.0) -> tuple[float, list[int]]:
+        """
+        Finds the remaining points closest to `point`.
+
+        The search descends into the nearer child first and prunes nodes whose
+        bounding box lies beyond the best distance found so far.
+
+        Args:
+            point: (x, y, z) coordinates to search from.
+            tolerance: Relative margin; every point within
+                ``distance * (1 + tolerance) + CHORD_ABSOLUTE_TOLERANCE`` of
+                the nearest one is returned with it.
+
+        Returns:
+            A tuple (distance, indices) of the nearest distance and the sorted
+            indices of the points within the margin, or (inf, []) if the tree
+            is empty.
+        """
+        x, y, z = point
+        scale = (1 + tolerance) ** 2
+        low_bounds = self._low
+        high_bounds = self._high
+        coordinates = self._coordinates
+        alive = self._alive
+
+        best = math.inf
+        limit = math.inf
+        found = []
+
+        stack = [(0.0, 0)] if self._count and self._count[0] else []
+        while stack:
+            distance, node = stack.pop()
+            if distance > limit or not self._count[node]:
+                continue
+
+            leaf = self._leaves[node]
+            if leaf is not None:
+                for i in leaf:
+                    if i not in alive:
+                        continue
+                    px, py, pz = coordinates[i]
+                    d = (px - x) ** 2 + (py - y) ** 2 + (pz - z) ** 2
+                    if d > limit:
+                        continue
+                    found.append((d, i))
+                    if d < best:
+                        best = d
+                        limit = (math.sqrt(d * scale) + CHORD_ABSOLUTE_TOLERANCE) ** 2
+                continue
+
+            for child in self._children[node]:
+                low = low_bounds[child]
+                high = high_bounds[child]
+                d = 0.0
+                if x < low[0]:
+                    d += (low[0] - x) ** 2
+                elif x > high[0]:
+                    d += (x - high[0]) ** 2
+                if y < low[1]:
+                    d += (low[1] - y) ** 2
+                elif y > high[1]:
+                    d += (y - high[1]) ** 2
+                if z < low[2]:
+                    d += (low[2] - z) ** 2
+                elif z > high[2]:
+                    d += (z - high[2]) ** 2
+                stack.append((d, child))
+            # Visit the nearer child first.
+            if stack[-1][0] > stack[-2][0]:
+                stack[-1], stack[-2] = stack[-2], stack[-1]
+
+        return math.sqrt(best), sorted(i for d, i in found if d <= limit)
+
+
+class PriorityIndex:
+    """
+    Answers "minimum distance x priority weight" queries over deliveries.
+
+    Deliveries are split by priority weight into one `KDTree` each. A query
+    finds the nearest remaining delivery of every class, scales its distance
+    by the class weight and keeps the smallest, which is the same choice as
+    scanning every delivery but costs O(log n) per class.
+
+    The haversine distances of the nearest candidates are computed exactly
+    as in `route_optimizer.optimize_route`, and ties go to the lowest
+    delivery index, so both produce identical routes.
+
+    Args:
+        points: (n, 2) radian array from `distance_matrix.to_radians`.
+        weights: (n,) array of priority weights.
+        leaf_size: Maximum number of points stored in a tree leaf.
+    """
+
+    def __init__(self, points: np.ndarray, weights: np.ndarray, leaf_size: int = 16):
+        self.points = points
+        self.weights = np.asarray(weights, dtype=np.float64)
+
+        xyz = to_unit_sphere(points)
+        self._class_of = {}
+        self._trees = []
+        for weight in np.unique(self.weights):
+            members = np.flatnonzero(self.weights == weight)
+            self._trees.append(
+                (weight, KDTree(xyz[members], members, leaf_size=leaf_size))
+            )
+            for i in members.tolist():
+                self._class_of[i] = len(self._trees) - 1
+
+    def __len__(self) -> int:
+        return sum(len(tree) for _, tree in self._trees)
+
+    def remove(self, index: int) -> None:
+        """Removes a delivery from the index once it has been visited."""
+        self._trees[self._class_of[index]][1].remove(index)
+
+    def nearest(self, origin) -> int:
+        """
+        Finds the remaining delivery with the smallest weighted distance.
+
+        Args:
+            origin: (latitude, longitude) of the current location in radians.
+
+        Returns:
+            The index of the selected delivery, or -1 if none remain.
+        """
+        latitude, longitude = float(origin[0]), float(origin[1])
+        point = (
+            math.cos(latitude) * math.cos(longitude),
+            math.cos(latitude) * math.sin(longitude),
+            math.sin(latitude),
+        )
+
+        candidates = []
+        for _, tree in self._trees:
+            if tree:
+                candidates.extend(tree.nearest(point, CHORD_TOLERANCE)[1])
+        if not candidates:
+            return -1
+
+        # Sorted so that argmin, which returns the first minimum, picks the
+        # lowest index among equal scores.
+        candidates = np.array(sorted(candidates))
+        scores = distances_from(self.points[candidates], origin)
+        scores *= self.weights[candidates]
+        return int(candidates[np.argmin(scores)])
@@ -0,0 +1,9 @@
+import os
+import sys
+
+# Modules inside the packages import their siblings by bare name, since the
+# packages are run as scripts (e.g. ``python conway``). Make those imports
+# resolvable when the modules are imported from the tests.
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+for package in ("conway", "courier_optimizer"):
+    sys.path.append(os.path.join(ROOT, package))
@@ -0,0 +1,31 @@
+import pytest
+from conway.backends import BACKENDS, create_grid, randomize
+from conway.benchmark import run_benchmark
+
+
+@pytest.mark.parametrize("backend", ["dense", "packed", "numpy", "sparse"])
+def test_create_grid_is_empty(backend):
+    grid = create_grid(backend, 8)
+    assert all(grid.get_cell(x, y) == 0 for y in range(8) for x in range(8))
+
+
+def test_randomize_is_reproducible_across_backends():
+    dense = create_grid("dense", 16)
+    packed = create_grid("packed", 16)
+    randomize(dense, 16, 0.5, seed=4)
+    randomize(packed, 16, 0.5, seed=4)
+    assert [dense.get_cell(x, y) for y in range(16) for x in range(16)] == [
+        packed.get_cell(x, y) for y in range(16) for x in range(16)
+    ]
+
+
+def test_create_grid_unknown_backend():
+    with pytest.raises(ValueError):
+        create_grid("gpu", 8)
+
+
+def test_run_benchmark_reports_throughput():
+    result = run_benchmark("packed", "b3/s23", 16, generations=4, seed=1)
+    assert result["rule"] == "B3/S23"
+    assert result["generations"] == 4
+    assert result["cell_updates_per_second"] > 0
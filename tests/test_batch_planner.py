@@ -0,0 +1,93 @@
+import csv
+
+import pytest
+
+pytest.importorskip("numpy")
+
+from courier_optimizer.batch_planner import read_manifest, run_batch, write_summary
+
+INPUT = """customer,latitude,longitude,priority,weight_kg
+Oslo City Hall,59.9139,10.7387,High,2.5
+Aker Brygge,59.9096,10.7245,Medium,1.2
+Grunerlokka Market,59.9230,10.7586,Low,3.1
+Nydalen School,59.9507,10.7604,Urgent,0.8
+Majorstuen Station,59.9291,10.7183,Medium,5.0
+"""
+
+
+def write_manifest(tmp_path, rows):
+    path = tmp_path / "manifest.csv"
+    with open(path, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["input", "depot", "mode", "criterion", "name"])
+        writer.writerows(rows)
+    return path
+
+
+def test_read_manifest(tmp_path):
+    path = write_manifest(
+        tmp_path,
+        [["a.csv", "59.91,10.75", "walk", "CO2", ""], ["b.csv", "60,11", "", "", "b"]],
+    )
+    first, second = read_manifest(path)
+    assert first["name"] == "0001_a"
+    assert first["input"] == str(tmp_path / "a.csv")
+    assert first["depot"] == (59.91, 10.75)
+    assert (first["mode"], first["criterion"]) == ("Walk", "co2")
+    assert (second["name"], second["mode"], second["criterion"]) == ("b", "Car", "time")
+
+
+@pytest.mark.parametrize(
+    "row",
+    [
+        ["a.csv", "59.91", "", "", ""],
+        ["a.csv", "59.91,10.75", "boat", "", ""],
+        ["a.csv", "59.91,10.75", "", "speed", ""],
+        ["", "59.91,10.75", "", "", ""],
+    ],
+)
+def test_invalid_manifest(tmp_path, row):
+    with pytest.raises(ValueError):
+        read_manifest(write_manifest(tmp_path, [row]))
+
+
+def test_duplicate_names(tmp_path):
+    path = write_manifest(
+        tmp_path, [["a.csv", "60,11", "", "", "x"], ["b.csv", "60,11", "", "", "x"]]
+    )
+    with pytest.raises(ValueError):
+        read_manifest(path)
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_run_batch(tmp_path, workers):
+    (tmp_path / "input.csv").write_text(INPUT)
+    path = write_manifest(
+        tmp_path,
+        [
+            ["input.csv", "59.91,10.75", "car", "time", "north"],
+            ["input.csv", "59.95,10.78", "walk", "time", "south"],
+            ["missing.csv", "59.91,10.75", "", "", "missing"],
+        ],
+    )
+    output = tmp_path / "out"
+    summaries = run_batch(read_manifest(path), str(output), workers=workers)
+
+    assert [s["name"] for s in summaries] == ["north", "south", "missing"]
+    assert [s["status"] for s in summaries[:2]] == ["ok", "ok"]
+    assert summaries[2]["status"].startswith("error")
+    assert summaries[0]["deliveries"] == 4
+    assert summaries[0]["rejected"] == 1
+    assert summaries[1]["eta_h"] == pytest.approx(summaries[1]["distance_km"] / 5)
+
+    for name in ("north", "south"):
+        with open(output / f"{name}_rejected.csv") as f:
+            assert [row[0] for row in csv.reader(f)] == ["customer", "Nydalen School"]
+        with open(output / f"{name}_route.csv") as f:
+            rows = list(csv.reader(f))
+        assert len(rows) == 6
+        assert rows[-1][0] == "DEPOT_END"
+
+    write_summary(output / "summary.csv", summaries)
+    with open(output / "summary.csv") as f:
+        assert len(list(csv.DictReader(f))) == 3
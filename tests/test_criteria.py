@@ -0,0 +1,86 @@
+import random
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from courier_optimizer import route_optimizer
+from courier_optimizer.delivery import Delivery
+from courier_optimizer.route_optimizer import (
+    criterion_factor,
+    edge_costs,
+    location_matrix,
+    nearest_neighbor_order,
+    plan_route,
+)
+from courier_optimizer.transport import TRANSPORT_MODES
+
+DEPOT = (59.91, 10.75)
+
+
+def random_deliveries(count, seed=0):
+    rng = random.Random(seed)
+    return [
+        Delivery(
+            f"C{i}",
+            str(round(59.8 + rng.random() * 0.3, 4)),
+            str(round(10.6 + rng.random() * 0.4, 4)),
+            rng.choice(["High", "Medium", "Low"]),
+            "1.0",
+        )
+        for i in range(count)
+    ]
+
+
+def test_criterion_factor():
+    car = TRANSPORT_MODES["Car"]
+    assert criterion_factor(car, "time") == pytest.approx(1 / 50)
+    assert criterion_factor(car, "cost") == 4
+    assert criterion_factor(TRANSPORT_MODES["Walk"], "co2") == 0
+    with pytest.raises(ValueError):
+        criterion_factor(car, "fun")
+
+
+def test_free_criterion_falls_back_to_distance():
+    distances = location_matrix(random_deliveries(5), DEPOT)
+    assert edge_costs(distances, TRANSPORT_MODES["Bicycle"], "cost") is distances
+    assert np.allclose(
+        edge_costs(distances, TRANSPORT_MODES["Car"], "co2"), distances * 120
+    )
+
+
+@pytest.mark.parametrize("seed", [0, 4])
+def test_shared_matrix_gives_same_order(seed):
+    deliveries = random_deliveries(80, seed=seed)
+    distances = location_matrix(deliveries, DEPOT)
+    expected = nearest_neighbor_order(deliveries, DEPOT)
+    assert nearest_neighbor_order(deliveries, DEPOT, distances) == expected
+
+
+def test_plan_route_reuses_matrix(monkeypatch):
+    deliveries = random_deliveries(30, seed=1)
+    distances = location_matrix(deliveries, DEPOT)
+    monkeypatch.setattr(
+        route_optimizer,
+        "location_matrix",
+        lambda *args: pytest.fail("distance matrix recomputed"),
+    )
+    for criterion in ["time", "cost", "co2"]:
+        route, legs, saved = plan_route(
+            deliveries, DEPOT, "Bicycle", criterion, distances, time_budget=1
+        )
+        tour = [0] + [deliveries.index(d) + 1 for d in route] + [0]
+        assert sorted(tour[1:-1]) == list(range(1, 31))
+        assert legs == pytest.approx(distances[tour[:-1], tour[1:]].tolist())
+        assert saved >= 0
+
+
+def test_plan_route_without_matrix_matches_shared():
+    deliveries = random_deliveries(25, seed=2)
+    distances = location_matrix(deliveries, DEPOT)
+    route, legs, _ = plan_route(deliveries, DEPOT, "Car", "cost")
+    shared_route, shared_legs, _ = plan_route(
+        deliveries, DEPOT, "Car", "cost", distances
+    )
+    assert route == shared_route
+    assert legs == pytest.approx(shared_legs)
@@ -0,0 +1,62 @@
+import pytest
+from conway.cycles import CycleDetector, cell_key, hash_cells, run_until_stable
+from conway.grid import Grid
+from conway.packed import PackedGrid
+from conway.rules import RuleSet
+from conway.sparse import SparseGrid
+
+conway_rule = RuleSet("B3/S23")
+
+
+def grid_with(cells, size=8, grid_type=Grid):
+    grid = grid_type(grid=[0] * size * size, grid_size=size, grid_wrap=False)
+    for x, y in cells:
+        grid.set_cell(x, y, 1)
+    return grid
+
+
+def test_hash_cells_matches_numpy():
+    np = pytest.importorskip("numpy")
+    cells = [0, 5, 17, 123456789]
+    assert hash_cells(np.array(cells)) == hash_cells(cells)
+    assert hash_cells(cells) == cell_key(0) ^ cell_key(5) ^ cell_key(17) ^ cell_key(
+        123456789
+    )
+
+
+def test_detects_extinction():
+    report = run_until_stable(grid_with([(3, 3)]), conway_rule, 10)
+    assert report["result"] == {"kind": "extinct", "period": 1, "start": 1}
+
+
+def test_detects_still_life():
+    block = [(3, 3), (4, 3), (3, 4), (4, 4)]
+    report = run_until_stable(grid_with(block), conway_rule, 10)
+    assert report["result"] == {"kind": "still life", "period": 1, "start": 0}
+    assert report["generations"] == 1
+
+
+@pytest.mark.parametrize("grid_type", [Grid, PackedGrid])
+def test_detects_blinker_period(grid_type):
+    blinker = [(2, 3), (3, 3), (4, 3)]
+    report = run_until_stable(grid_with(blinker, grid_type=grid_type), conway_rule, 10)
+    assert report["result"] == {"kind": "oscillator", "period": 2, "start": 0}
+
+
+def test_detects_oscillator_after_transient():
+    # An L-tromino becomes a block after one generation.
+    report = run_until_stable(grid_with([(3, 3), (4, 3), (3, 4)]), conway_rule, 10)
+    assert report["result"] == {"kind": "still life", "period": 1, "start": 1}
+
+
+def test_sparse_glider_never_repeats():
+    report = run_until_stable(SparseGrid(), conway_rule, 50)
+    assert report["result"] is None
+    assert report["generations"] == 50
+
+
+def test_history_is_bounded():
+    detector = CycleDetector(history=1)
+    blinker = [(2, 3), (3, 3), (4, 3)]
+    report = run_until_stable(grid_with(blinker), conway_rule, 10, detector)
+    assert report["result"] is None
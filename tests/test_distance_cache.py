@@ -0,0 +1,105 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from courier_optimizer.distance_cache import DistanceCache, MemoryDistanceCache
+from courier_optimizer.distance_matrix import distance_matrix, to_radians
+
+
+def random_points(count, seed, dtype=np.float64):
+    rng = np.random.default_rng(seed)
+    return to_radians(rng.uniform([59.8, 10.6], [60.1, 11.0], (count, 2)), dtype)
+
+
+@pytest.mark.parametrize("dtype", [np.float64, np.float32])
+def test_exact_hit_is_memory_mapped(tmp_path, dtype):
+    points = random_points(30, 1, dtype)
+    cache = DistanceCache(tmp_path)
+    first = cache.matrix(points)
+    assert cache.misses == 1
+
+    second = DistanceCache(tmp_path).matrix(points)
+    assert isinstance(second, np.memmap)
+    assert np.array_equal(first, second)
+    assert np.array_equal(second, distance_matrix(points))
+
+
+def test_partial_hit_computes_only_new_locations(tmp_path, monkeypatch):
+    points = random_points(40, 2)
+    cache = DistanceCache(tmp_path)
+    cache.matrix(points[:35])
+
+    # Drop five cached locations, add five new ones and shuffle the rest.
+    changed = np.concatenate((points[5:40], random_points(5, 3)))[::-1].copy()
+    computed = []
+    original = cache._reuse
+
+    def reuse(*args):
+        matrix, count = original(*args)
+        computed.append(count)
+        return matrix, count
+
+    monkeypatch.setattr(cache, "_reuse", reuse)
+    matrix = cache.matrix(changed)
+
+    assert cache.partial_hits == 1
+    assert computed == [10]
+    assert np.array_equal(matrix, distance_matrix(changed))
+
+
+def test_dtype_is_part_of_the_key(tmp_path):
+    cache = DistanceCache(tmp_path)
+    cache.matrix(random_points(10, 4))
+    assert cache.matrix(random_points(10, 4, np.float32)).dtype == np.float32
+    assert cache.misses == 2
+
+
+def test_least_recently_used_entries_are_evicted(tmp_path):
+    entry = 20 * 20 * 8 + 20 * 2 * 8
+    cache = DistanceCache(tmp_path, max_bytes=2 * entry)
+    first, second, third = (random_points(20, seed) for seed in (10, 11, 12))
+
+    cache.matrix(first)
+    cache.matrix(second)
+    cache.matrix(first)
+    cache.matrix(third)
+
+    assert cache.size() <= 2 * entry
+    reopened = DistanceCache(tmp_path, max_bytes=2 * entry)
+    reopened.matrix(first)
+    reopened.matrix(third)
+    assert reopened.hits == 2
+    reopened.matrix(second)
+    assert reopened.misses == 1
+
+
+def test_oversized_matrices_are_not_stored(tmp_path):
+    cache = DistanceCache(tmp_path, max_bytes=100)
+    cache.matrix(random_points(20, 5))
+    assert cache.size() == 0
+    assert list(tmp_path.glob("*.npy")) == []
+
+
+def test_memory_cache():
+    cache = MemoryDistanceCache()
+    points = random_points(30, 6)
+    first = cache.matrix(points)
+    assert cache.matrix(points) is first
+    assert not first.flags.writeable
+
+    changed = np.concatenate((points[3:], random_points(2, 7)))
+    assert np.array_equal(cache.matrix(changed), distance_matrix(changed))
+    assert (cache.hits, cache.partial_hits, cache.misses) == (1, 1, 1)
+
+
+def test_memory_cache_evicts_least_recently_used():
+    entry = 10 * 10 * 8 + 10 * 2 * 8
+    cache = MemoryDistanceCache(max_bytes=2 * entry)
+    first, second, third = (random_points(10, seed) for seed in (20, 21, 22))
+    cache.matrix(first)
+    cache.matrix(second)
+    cache.matrix(first)
+    cache.matrix(third)
+    assert cache.size() == 2 * entry
+    cache.matrix(first)
+    assert cache.hits == 2
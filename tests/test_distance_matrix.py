@@ -0,0 +1,84 @@
+import random
+
+import pytest
+from courier_optimizer.delivery import Delivery
+from courier_optimizer.haversine import get_haversine_distance
+
+np = pytest.importorskip("numpy")
+
+from courier_optimizer.distance_matrix import (
+    distance_matrix,
+    distance_rows,
+    distances_from,
+    leg_distances,
+    to_radians,
+)
+from courier_optimizer.route_optimizer import optimize_route
+
+COORDINATES = [(59.91, 10.75), (59.95, 10.70), (60.39, 5.32), (-33.86, 151.21)]
+
+
+def random_deliveries(count, seed=0):
+    rng = random.Random(seed)
+    return [
+        Delivery(
+            f"C{i}",
+            str(round(59.8 + rng.random() * 0.3, 4)),
+            str(round(10.6 + rng.random() * 0.4, 4)),
+            rng.choice(["High", "Medium", "Low"]),
+            "1.0",
+        )
+        for i in range(count)
+    ]
+
+
+def reference_route(deliveries, depot):
+    """The original scalar weighted nearest-neighbor loop."""
+    route = []
+    remaining = deliveries.copy()
+    lat, lon = depot
+    while remaining:
+        best = min(
+            remaining,
+            key=lambda d: get_haversine_distance(
+                float(lat), float(lon), float(d.latitude), float(d.longitude)
+            )
+            * Delivery.PRIORITY_WEIGHTS[d.priority],
+        )
+        route.append(best)
+        remaining.remove(best)
+        lat, lon = best.latitude, best.longitude
+    return route
+
+
+def test_matrix_matches_scalar_haversine():
+    points = to_radians(COORDINATES)
+    matrix = distance_matrix(points, block_rows=3)
+    for i, (lat1, lon1) in enumerate(COORDINATES):
+        for j, (lat2, lon2) in enumerate(COORDINATES):
+            expected = get_haversine_distance(lat1, lon1, lat2, lon2)
+            assert matrix[i, j] == pytest.approx(expected, abs=1e-9)
+
+
+def test_rows_and_float32():
+    points = to_radians(COORDINATES)
+    full = distance_matrix(points)
+    assert np.allclose(distance_rows(points, 1, 3), full[1:3])
+    assert np.allclose(distances_from(points, points[2]), full[2])
+    assert np.allclose(leg_distances(points), np.diag(full, 1))
+
+    single = distance_matrix(to_radians(COORDINATES, dtype=np.float32))
+    assert single.dtype == np.float32
+    assert np.allclose(single, full, rtol=1e-4, atol=1e-2)
+
+
+def test_accepts_strings():
+    assert np.array_equal(
+        to_radians([("59.91", "10.75")]), to_radians([(59.91, 10.75)])
+    )
+
+
+def test_route_matches_scalar_heuristic():
+    deliveries = random_deliveries(60, seed=3)
+    depot = (59.91, 10.75)
+    assert optimize_route(deliveries, depot) == reference_route(deliveries, depot)
@@ -0,0 +1,119 @@
+import random
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from courier_optimizer.delivery import Delivery
+from courier_optimizer.fleet import (
+    package_weights,
+    plan_fleet,
+    savings_clusters,
+    sweep_clusters,
+)
+from courier_optimizer.ingest import DeliveryTable
+from courier_optimizer.route_optimizer import location_matrix
+
+DEPOT = (59.91, 10.75)
+
+
+def random_deliveries(count, seed=0):
+    rng = random.Random(seed)
+    return [
+        Delivery(
+            f"C{i}",
+            str(round(59.8 + rng.random() * 0.3, 4)),
+            str(round(10.6 + rng.random() * 0.4, 4)),
+            rng.choice(["High", "Medium", "Low"]),
+            str(round(rng.uniform(0.5, 8), 1)),
+        )
+        for i in range(count)
+    ]
+
+
+def check_clusters(clusters, weights, capacity):
+    assert sorted(i for cluster in clusters for i in cluster) == list(
+        range(len(weights))
+    )
+    for cluster in clusters:
+        assert weights[cluster].sum() <= capacity + 1e-9
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_sweep_respects_capacity(seed):
+    deliveries = random_deliveries(60, seed)
+    weights = package_weights(deliveries)
+    clusters = sweep_clusters(deliveries, DEPOT, weights, 20)
+    check_clusters(clusters, weights, 20)
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_savings_respects_capacity_and_saves_distance(seed):
+    deliveries = random_deliveries(60, seed)
+    weights = package_weights(deliveries)
+    distances = location_matrix(deliveries, DEPOT)
+    clusters = savings_clusters(distances, weights, 20)
+    check_clusters(clusters, weights, 20)
+
+    def length(cluster):
+        tour = [0] + [i + 1 for i in cluster] + [0]
+        return distances[tour[:-1], tour[1:]].sum()
+
+    one_trip_each = 2 * distances[0, 1:].sum()
+    assert sum(length(cluster) for cluster in clusters) < one_trip_each
+
+
+def test_nan_weights_count_as_zero():
+    deliveries = random_deliveries(3)
+    deliveries[1].weight_kg = "nan"
+    assert package_weights(deliveries)[1] == 0
+
+
+@pytest.mark.parametrize("method", ["sweep", "savings"])
+def test_plan_fleet_routes_every_delivery(method):
+    deliveries = random_deliveries(40, 5)
+    routes = plan_fleet(
+        deliveries, DEPOT, 25, method=method, time_budget=0.1, workers=1
+    )
+    served = [d.customer for route, _, _ in routes for d in route]
+    assert sorted(served) == sorted(d.customer for d in deliveries)
+    for route, legs, saved in routes:
+        assert len(legs) == len(route) + 1
+        assert sum(float(d.weight_kg) for d in route) <= 25
+        assert saved >= 0
+
+
+def test_process_pool_matches_inline():
+    deliveries = random_deliveries(50, 6)
+    distances = location_matrix(deliveries, DEPOT)
+    inline = plan_fleet(deliveries, DEPOT, 30, distances=distances, workers=1)
+    pooled = plan_fleet(deliveries, DEPOT, 30, distances=distances, workers=2)
+    assert [[d.customer for d in r] for r, _, _ in pooled] == [
+        [d.customer for d in r] for r, _, _ in inline
+    ]
+    assert [legs for _, legs, _ in pooled] == [legs for _, legs, _ in inline]
+
+
+def test_delivery_table():
+    deliveries = random_deliveries(30, 7)
+    table = DeliveryTable(
+        [d.customer for d in deliveries],
+        [(float(d.latitude), float(d.longitude)) for d in deliveries],
+        [["High", "Medium", "Low"].index(d.priority) for d in deliveries],
+        [float(d.weight_kg) for d in deliveries],
+    )
+    expected = plan_fleet(deliveries, DEPOT, 30, workers=1)
+    routes = plan_fleet(table, DEPOT, 30, workers=1)
+    assert [[d.customer for d in r] for r, _, _ in routes] == [
+        [d.customer for d in r] for r, _, _ in expected
+    ]
+
+
+def test_errors():
+    deliveries = random_deliveries(20, 8)
+    with pytest.raises(ValueError):
+        plan_fleet(deliveries, DEPOT, 1)
+    with pytest.raises(ValueError):
+        plan_fleet(deliveries, DEPOT, 10, vehicles=1)
+    with pytest.raises(ValueError):
+        plan_fleet(deliveries, DEPOT, 10, method="random")
@@ -1,3 +1,5 @@
+import random
+
 import pytest
 from conway.grid import Grid
 from conway.rules import RuleSet
@@ -45,3 +47,33 @@ def test_get_cell_out_of_bounds_no_wrap():
     assert grid.get_cell(0, -1) == 0
     assert grid.get_cell(3, 0) == 0
     assert grid.get_cell(0, 3) == 0
+
+
+@pytest.mark.parametrize("wrap", [True, False])
+def test_evolve_tiles_match_full_recompute(wrap):
+    rng = random.Random(3)
+    tiled = Grid(grid_size=21, grid_wrap=wrap, tile_size=4)
+    full = Grid(grid_size=21, grid_wrap=wrap, tile_size=21)
+    for index in range(21 * 21):
+        state = 1 if rng.random() < 0.3 else 0
+        tiled.set_cell(index % 21, index // 21, state)
+        full.set_cell(index % 21, index // 21, state)
+
+    for generation in range(30):
+        if generation == 15:
+            tiled.set_cell(10, 10, 1)
+            full.set_cell(10, 10, 1)
+        tiled.evolve(conway_rule)
+        full.evolve(conway_rule)
+        assert tiled.grid == full.grid
+
+
+def test_evolve_skips_stable_tiles():
+    grid = Grid(grid_size=8, tile_size=4)
+    grid.grid = [0] * 64
+    for x, y in [(1, 1), (2, 1), (1, 2), (2, 2)]:
+        grid.set_cell(x, y, 1)
+
+    grid.evolve(conway_rule)
+    grid.evolve(conway_rule)
+    assert grid._active_tiles(conway_rule) == set()
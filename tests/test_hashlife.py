@@ -0,0 +1,73 @@
+import random
+
+import pytest
+from conway.grid import Grid
+from conway.hashlife import HashLife
+from conway.rules import RuleSet
+
+
+def random_grid(size, seed):
+    """A non-wrapping grid with a random soup in its centre."""
+    rng = random.Random(seed)
+    grid = Grid(grid_size=size, grid_wrap=False)
+    for y in range(size):
+        for x in range(size):
+            grid.set_cell(x, y, 0)
+    for y in range(size // 2 - 4, size // 2 + 4):
+        for x in range(size // 2 - 4, size // 2 + 4):
+            grid.set_cell(x, y, 1 if rng.random() < 0.5 else 0)
+    return grid
+
+
+def test_set_and_get_cell():
+    life = HashLife(RuleSet("B3/S23"))
+    life.set_cell(100, -40, 1)
+    assert life.get_cell(100, -40) == 1
+    assert life.population == 1
+    life.set_cell(100, -40, 0)
+    assert life.get_cell(100, -40) == 0
+
+
+def test_rejects_b0_rules():
+    with pytest.raises(ValueError):
+        HashLife(RuleSet("B03/S23"))
+
+
+def test_step_rejects_negative():
+    with pytest.raises(ValueError):
+        HashLife(RuleSet("B3/S23")).step(-1)
+
+
+@pytest.mark.parametrize("rule", ["B3/S23", "B36/S23", "B2/S"])
+@pytest.mark.parametrize("generations", [1, 3, 8, 13])
+def test_step_matches_grid(rule, generations):
+    ruleset = RuleSet(rule)
+    grid = random_grid(64, seed=generations)
+    life = HashLife(ruleset)
+    life.from_grid(grid)
+
+    for _ in range(generations):
+        grid.evolve(ruleset)
+    life.step(generations)
+
+    exported = Grid(grid_size=64, grid_wrap=False)
+    life.to_grid(exported)
+    assert exported.grid == grid.grid
+    assert life.generation == generations
+
+
+def test_glider_jumps_far_ahead():
+    life = HashLife(RuleSet("B3/S23"), max_cache=1000)
+    life.load_cells([(1, 0), (2, 1), (0, 2), (1, 2), (2, 2)])
+    life.step(2**20)
+
+    # A glider moves one cell diagonally every four generations.
+    offset = 2**18
+    assert life.population == 5
+    assert set(life.live_cells()) == {
+        (1 + offset, 0 + offset),
+        (2 + offset, 1 + offset),
+        (0 + offset, 2 + offset),
+        (1 + offset, 2 + offset),
+        (2 + offset, 2 + offset),
+    }
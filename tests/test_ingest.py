@@ -0,0 +1,118 @@
+import csv
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from courier_optimizer.delivery import Delivery
+from courier_optimizer.ingest import FIELDS, read_deliveries
+from courier_optimizer.route_optimizer import location_matrix, plan_route
+
+ROWS = [
+    ["Alice", "59.91", "10.75", "High", "2.5"],
+    ["Bob\x00", "59.92", "10.76", "Medium", "1"],
+    ["Charlie", "59.93", "10.77", "Urgent", "1"],
+    ["Dana", "91", "10.78", "Low", "1"],
+    ["Eve", "59.94", "-181", "Low", "1"],
+    ["Frank", "north", "10.79", "Low", "1"],
+    ["Grace", "59.95", "10.80", "Low", "-1"],
+    ["Heidi", "nan", "10.81", "Low", "1"],
+    ["Ivan", " 59.96 ", "10.82", "Medium", "nan"],
+    ["Judy", "59.97", "10.83", "Low", "heavy"],
+    ["", "59.98", "10.84", "High", "0"],
+    ["Mallory", "59.99"],
+]
+
+
+def write_csv(path, rows, header=FIELDS):
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(header)
+        writer.writerows(rows)
+
+
+@pytest.mark.parametrize("chunk_rows", [1, 3, 100])
+def test_matches_delivery_validate(tmp_path, chunk_rows):
+    path = tmp_path / "input.csv"
+    rejected_path = tmp_path / "rejected.csv"
+    write_csv(path, ROWS)
+
+    table, rejected = read_deliveries(path, rejected_path, chunk_rows)
+
+    complete = [row for row in ROWS if len(row) == len(FIELDS)]
+    expected = [row for row in complete if Delivery.validate(dict(zip(FIELDS, row)))]
+    assert [d.customer for d in table] == [row[0] for row in expected]
+    assert rejected == len(ROWS) - len(expected)
+
+    with open(rejected_path, newline="", encoding="utf-8") as f:
+        written = list(csv.reader(f))
+    assert written[0] == FIELDS
+    assert [row[0] for row in written[1:]] == [
+        row[0] for row in ROWS if row not in expected
+    ]
+
+
+def test_columns(tmp_path):
+    path = tmp_path / "input.csv"
+    write_csv(path, ROWS)
+    table, _ = read_deliveries(path)
+
+    assert table.coordinates.shape == (len(table), 2)
+    assert table.coordinates[0].tolist() == [59.91, 10.75]
+    assert table.priority_weights().tolist() == [0.6, 1.0, 0.6]
+    assert table[0].priority == "High"
+    assert table[0].weight_kg == 2.5
+
+
+def test_column_order_and_clean_input(tmp_path):
+    path = tmp_path / "input.csv"
+    rejected_path = tmp_path / "rejected.csv"
+    header = ["priority", "weight_kg", "note", "longitude", "latitude", "customer"]
+    write_csv(path, [["Low", "3", "x", "10.7", "59.9", "Zed"]], header)
+
+    table, rejected = read_deliveries(path, rejected_path)
+
+    assert rejected == 0
+    assert not rejected_path.exists()
+    assert table[0].customer == "Zed"
+    assert table.coordinates.tolist() == [[59.9, 10.7]]
+
+
+def test_missing_column(tmp_path):
+    path = tmp_path / "input.csv"
+    write_csv(path, [], header=["customer", "latitude", "longitude"])
+    with pytest.raises(ValueError):
+        read_deliveries(path)
+
+
+def test_empty_file(tmp_path):
+    path = tmp_path / "input.csv"
+    path.write_text("")
+    table, rejected = read_deliveries(path)
+    assert len(table) == 0
+    assert rejected == 0
+
+
+def test_table_routes_like_objects(tmp_path):
+    rng = np.random.default_rng(3)
+    rows = [
+        [f"C{i}", f"{lat:.5f}", f"{lon:.5f}", priority, "1"]
+        for i, (lat, lon, priority) in enumerate(
+            zip(
+                rng.uniform(59.8, 60.1, 60),
+                rng.uniform(10.6, 11.0, 60),
+                rng.choice(["High", "Medium", "Low"], 60),
+            )
+        )
+    ]
+    path = tmp_path / "input.csv"
+    write_csv(path, rows)
+    table, _ = read_deliveries(path)
+    objects = [Delivery(**dict(zip(FIELDS, row))) for row in rows]
+    depot = (59.91, 10.75)
+
+    for distances in (None, location_matrix(table, depot)):
+        route, legs, _ = plan_route(table, depot, "Car", "time", distances)
+        expected_route, expected_legs, _ = plan_route(objects, depot)
+        assert [d.customer for d in route] == [d.customer for d in expected_route]
+        assert legs == pytest.approx(expected_legs)
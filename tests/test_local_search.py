@@ -0,0 +1,76 @@
+import itertools
+import random
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from courier_optimizer import local_search
+from courier_optimizer.delivery import Delivery
+from courier_optimizer.distance_matrix import distance_matrix, to_radians
+from courier_optimizer.local_search import improve_tour, neighbor_lists, tour_length
+from courier_optimizer.route_optimizer import improve_route, optimize_route
+
+
+def random_matrix(count, seed):
+    rng = np.random.default_rng(seed)
+    return distance_matrix(
+        to_radians(rng.uniform([59.8, 10.6], [60.1, 11.0], (count, 2)))
+    )
+
+
+def test_neighbor_lists_are_sorted_and_exclude_self():
+    matrix = random_matrix(20, 1)
+    near = neighbor_lists(matrix, 5)
+    for row, neighbors in enumerate(near):
+        assert row not in neighbors
+        assert len(neighbors) == 5
+        assert neighbors == sorted(neighbors, key=lambda c: matrix[row, c])
+
+
+def test_neighbor_lists_in_blocks_match_whole_matrix(monkeypatch):
+    matrix = random_matrix(50, 2)
+    whole = neighbor_lists(matrix, 6)
+    monkeypatch.setattr(local_search, "NEIGHBOR_BLOCK_ROWS", 7)
+    assert neighbor_lists(matrix, 6) == whole
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_improve_tour_reports_exact_savings(seed):
+    matrix = random_matrix(60, seed)
+    tour = [0] + list(np.random.default_rng(seed).permutation(np.arange(1, 60))) + [0]
+    improved, saved = improve_tour(tour, matrix, time_budget=5)
+
+    assert improved[0] == improved[-1] == 0
+    assert sorted(improved[1:-1]) == list(range(1, 60))
+    assert saved > 0
+    assert tour_length(tour, matrix) - tour_length(improved, matrix) == pytest.approx(
+        saved
+    )
+
+
+def test_improve_tour_finds_optimum_on_small_instance():
+    matrix = random_matrix(7, 3)
+    best = min(
+        tour_length([0, *p, 0], matrix) for p in itertools.permutations(range(1, 7))
+    )
+    improved, _ = improve_tour([0, 1, 2, 3, 4, 5, 6, 0], matrix, neighbors=6)
+    assert tour_length(improved, matrix) <= best * 1.05
+
+
+def test_improve_route_keeps_every_delivery():
+    rng = random.Random(2)
+    deliveries = [
+        Delivery(
+            f"C{i}",
+            str(59.8 + rng.random() * 0.3),
+            str(10.6 + rng.random() * 0.4),
+            "Medium",
+            "1",
+        )
+        for i in range(40)
+    ]
+    route = optimize_route(deliveries, (59.91, 10.75))
+    improved, saved = improve_route(route, (59.91, 10.75), time_budget=2)
+    assert sorted(d.customer for d in improved) == sorted(d.customer for d in route)
+    assert saved >= 0
@@ -0,0 +1,58 @@
+import pytest
+from conway.grid import Grid
+from conway.packed import PackedGrid
+from conway.rules import RuleSet
+
+np = pytest.importorskip("numpy")
+
+from conway.multiboard import BatchGrid
+from conway.vectorized import NumpyGrid
+
+conway_rule = RuleSet("B3/S23")
+
+
+def cells_of(grid, size):
+    return [grid.get_cell(x, y) for y in range(size) for x in range(size)]
+
+
+@pytest.mark.parametrize("wrap", [True, False])
+def test_matches_individual_grids(wrap):
+    batch = BatchGrid.random(6, 12, 0.4, seed=5, grid_wrap=wrap)
+    grids = batch.to_grids()
+
+    for _ in range(8):
+        batch.evolve(conway_rule)
+        for grid in grids:
+            grid.evolve(conway_rule)
+
+    for board, grid in enumerate(grids):
+        assert cells_of(batch.to_grid(board), 12) == cells_of(grid, 12)
+
+
+def test_populations():
+    batch = BatchGrid(3, 5)
+    batch.set_cell(0, 1, 1, 1)
+    batch.set_cell(2, 0, 0, 1)
+    batch.set_cell(2, 4, 4, 1)
+    assert batch.populations.tolist() == [1, 0, 2]
+    assert batch.get_cell(2, 4, 4) == 1
+
+
+@pytest.mark.parametrize("grid_type", [Grid, PackedGrid, NumpyGrid])
+def test_from_grids_round_trip(grid_type):
+    grids = [grid_type(grid_size=10), grid_type(grid_size=10)]
+    grids[1].set_cell(9, 9, 1)
+    batch = BatchGrid.from_grids(grids)
+    assert len(batch) == 2
+    for board, grid in enumerate(grids):
+        assert cells_of(batch.to_grid(board, grid_type), 10) == cells_of(grid, 10)
+
+
+def test_from_grids_rejects_mixed_sizes():
+    with pytest.raises(ValueError):
+        BatchGrid.from_grids([Grid(grid_size=5), Grid(grid_size=6)])
+
+
+def test_rejects_bad_shape():
+    with pytest.raises(ValueError):
+        BatchGrid(2, 4, cells=np.zeros((2, 4, 5)))
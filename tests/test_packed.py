@@ -0,0 +1,48 @@
+import random
+
+import pytest
+from conway.grid import Grid
+from conway.packed import PackedGrid
+from conway.rules import RuleSet
+
+
+def random_pair(size, wrap, seed):
+    rng = random.Random(seed)
+    grid = Grid(grid_size=size, grid_wrap=wrap)
+    packed = PackedGrid(grid_size=size, grid_wrap=wrap)
+    for y in range(size):
+        for x in range(size):
+            state = 1 if rng.random() < 0.4 else 0
+            grid.set_cell(x, y, state)
+            packed.set_cell(x, y, state)
+    return grid, packed
+
+
+def test_set_and_get_cell():
+    grid = PackedGrid(grid_size=5)
+    grid.set_cell(3, 3, 1)
+    assert grid.get_cell(3, 3) == 1
+    grid.set_cell(3, 3, 0)
+    assert grid.get_cell(3, 3) == 0
+
+
+def test_get_cell_out_of_bounds_no_wrap():
+    grid = PackedGrid(grid_size=3, grid_wrap=False)
+    assert grid.get_cell(-1, 0) == 0
+    assert grid.get_cell(3, 0) == 0
+    assert grid.get_cell(0, 3) == 0
+
+
+@pytest.mark.parametrize("wrap", [True, False])
+@pytest.mark.parametrize("rule", ["B3/S23", "B36/S23", "B2/S", "B1357/S1357"])
+def test_evolve_matches_grid(wrap, rule):
+    ruleset = RuleSet(rule)
+    grid, packed = random_pair(13, wrap, seed=7)
+
+    for _ in range(5):
+        grid.evolve(ruleset)
+        packed.evolve(ruleset)
+
+    for y in range(13):
+        for x in range(13):
+            assert packed.get_cell(x, y) == grid.get_cell(x, y)
@@ -0,0 +1,33 @@
+import random
+
+import pytest
+from conway.rules import RuleSet
+
+np = pytest.importorskip("numpy")
+
+from conway.parallel import ParallelGrid
+from conway.vectorized import NumpyGrid
+
+
+@pytest.mark.parametrize("wrap", [True, False])
+@pytest.mark.parametrize("workers", [1, 3])
+def test_evolve_matches_numpy_grid(wrap, workers):
+    ruleset = RuleSet("B36/S23")
+    rng = random.Random(2)
+    reference = NumpyGrid(grid_size=17, grid_wrap=wrap)
+    with ParallelGrid(grid_size=17, grid_wrap=wrap, workers=workers) as grid:
+        for y in range(17):
+            for x in range(17):
+                state = 1 if rng.random() < 0.4 else 0
+                reference.set_cell(x, y, state)
+                grid.set_cell(x, y, state)
+
+        for _ in range(6):
+            reference.evolve(ruleset)
+            grid.evolve(ruleset)
+            assert np.array_equal(grid.cells, reference.cells)
+            for ours, theirs in zip(grid.changes(), reference.changes()):
+                assert np.array_equal(ours, theirs)
+
+    # The board stays readable after the pool is shut down.
+    assert grid.get_cell(0, 0) == reference.get_cell(0, 0)
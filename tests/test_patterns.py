@@ -0,0 +1,79 @@
+import pytest
+from conway.grid import Grid
+from conway.packed import PackedGrid
+from conway.patterns import load_pattern, save_pattern
+from conway.sparse import SparseGrid
+
+GLIDER_RLE = """#N Glider
+#C A comment line
+x = 3, y = 3, rule = B3/S23
+bob$2bo$3o!
+"""
+
+GLIDER = {(1, 0), (2, 1), (0, 2), (1, 2), (2, 2)}
+
+
+def live_cells(grid, size):
+    return {(x, y) for y in range(size) for x in range(size) if grid.get_cell(x, y)}
+
+
+def test_load_rle_into_dense_grid(tmp_path):
+    path = tmp_path / "glider.rle"
+    path.write_text(GLIDER_RLE)
+    grid = Grid(grid=[0] * 100, grid_size=10)
+
+    header = load_pattern(str(path), grid, x=4, y=5)
+
+    assert header == {"width": 3, "height": 3, "rule": "B3/S23"}
+    assert live_cells(grid, 10) == {(x + 4, y + 5) for x, y in GLIDER}
+
+
+def test_load_plaintext_into_packed_grid(tmp_path):
+    path = tmp_path / "glider.cells"
+    path.write_text("!Name: Glider\n.O\n..O\nOOO\n")
+    grid = PackedGrid(grid=[0] * 64, grid_size=8)
+
+    load_pattern(str(path), grid)
+
+    assert live_cells(grid, 8) == GLIDER
+
+
+def test_load_life106_into_sparse_grid(tmp_path):
+    path = tmp_path / "glider.lif"
+    path.write_text("#Life 1.06\n0 -1\n1 0\n-1 1\n0 1\n1 1\n")
+    grid = SparseGrid(cells=[])
+
+    header = load_pattern(str(path), grid, x=1, y=1)
+
+    assert grid.cells == GLIDER
+    assert header["width"] == 3
+
+
+def test_load_rejects_pattern_outside_grid(tmp_path):
+    path = tmp_path / "glider.rle"
+    path.write_text(GLIDER_RLE)
+    with pytest.raises(ValueError):
+        load_pattern(str(path), Grid(grid=[0] * 16, grid_size=4), x=2)
+
+
+def test_grid_rejects_wrong_initial_length():
+    with pytest.raises(ValueError):
+        Grid(grid=[0] * 5, grid_size=3)
+
+
+@pytest.mark.parametrize("extension", [".rle", ".cells", ".lif"])
+def test_save_and_load_roundtrip(tmp_path, extension):
+    cells = GLIDER | {(30, 40), (31, 40), (32, 40), (7, 45)}
+    original = SparseGrid(cells=cells)
+    path = tmp_path / f"pattern{extension}"
+
+    save_pattern(original, str(path))
+    loaded = Grid(grid=[0] * 50 * 50, grid_size=50)
+    load_pattern(str(path), loaded)
+
+    assert live_cells(loaded, 50) == cells
+
+
+def test_unknown_extension(tmp_path):
+    with pytest.raises(ValueError):
+        load_pattern(str(tmp_path / "pattern.xyz"), Grid())
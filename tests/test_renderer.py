@@ -0,0 +1,83 @@
+import io
+
+import pytest
+from conway.backends import create_grid, randomize
+from conway.grid import Grid
+from conway.renderer import BLOCK, DiffRenderer, Viewport, grid_to_cells
+
+
+def empty_grid(size):
+    grid = Grid(grid_size=size)
+    grid.grid = [0] * (size * size)
+    return grid
+
+
+def test_grid_to_cells_packs_half_blocks():
+    grid = empty_grid(3)
+    grid.set_cell(0, 0, 1)
+    grid.set_cell(1, 1, 1)
+    grid.set_cell(2, 2, 1)
+    assert grid_to_cells(grid) == [[2, 1, 0], [0, 0, 2]]
+
+
+@pytest.mark.parametrize("backend", ["dense", "packed", "numpy", "sparse"])
+def test_grid_to_cells_matches_across_engines(backend):
+    size = 7
+    reference = empty_grid(size)
+    randomize(reference, size, 0.4, seed=3)
+    cells = [
+        (x, y) for y in range(size) for x in range(size) if reference.get_cell(x, y)
+    ]
+
+    grid = create_grid(backend, size)
+    for x in range(size):
+        for y in range(size):
+            grid.set_cell(x, y, 0)
+    for x, y in cells:
+        grid.set_cell(x, y, 1)
+    view = Viewport(grid, grid_size=size) if backend == "sparse" else grid
+    assert grid_to_cells(view) == grid_to_cells(reference)
+
+
+def test_first_frame_draws_every_cell():
+    stream = io.StringIO()
+    renderer = DiffRenderer(stream=stream)
+    renderer.refresh(empty_grid(4))
+    assert stream.getvalue().count(BLOCK) == 8
+
+
+def test_second_frame_only_draws_changes():
+    stream = io.StringIO()
+    renderer = DiffRenderer(stream=stream)
+    grid = empty_grid(4)
+    renderer.refresh(grid)
+
+    stream.seek(0)
+    stream.truncate()
+    grid.set_cell(2, 3, 1)
+    grid.set_cell(3, 3, 1)
+    renderer.refresh(grid)
+
+    output = stream.getvalue()
+    assert output.count(BLOCK) == 2
+    # Adjacent cells share one cursor move and one color sequence.
+    assert output.count("H") == 2
+    assert output.count("\x1b[47m") == 1
+
+
+def test_unchanged_frame_draws_nothing():
+    stream = io.StringIO()
+    renderer = DiffRenderer(stream=stream)
+    grid = empty_grid(4)
+    renderer.refresh(grid)
+    stream.seek(0)
+    stream.truncate()
+    renderer.refresh(grid)
+    assert BLOCK not in stream.getvalue()
+
+
+def test_frame_cap_drops_frames():
+    renderer = DiffRenderer(max_fps=0.001, stream=io.StringIO())
+    grid = empty_grid(4)
+    assert renderer.refresh(grid) is True
+    assert renderer.refresh(grid) is False
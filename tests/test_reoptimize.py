@@ -0,0 +1,119 @@
+import itertools
+import random
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from courier_optimizer.delivery import Delivery
+from courier_optimizer.distance_matrix import leg_distances, to_radians
+from courier_optimizer.reoptimize import RoutePlan
+from courier_optimizer.report import route_rows, write_route_csv
+from courier_optimizer.route_optimizer import plan_route
+
+DEPOT = (59.91, 10.75)
+
+
+def make_delivery(rng, name):
+    return Delivery(
+        name,
+        59.8 + rng.random() * 0.3,
+        10.6 + rng.random() * 0.4,
+        rng.choice(["High", "Medium", "Low"]),
+        1.0,
+    )
+
+
+def make_plan(count, seed=0):
+    rng = random.Random(seed)
+    deliveries = [make_delivery(rng, f"C{i}") for i in range(count)]
+    route, legs, _ = plan_route(deliveries, DEPOT, "Car")
+    return RoutePlan(route, DEPOT, "Car", legs), rng
+
+
+def full_legs(plan):
+    stops = [DEPOT] + [(d.latitude, d.longitude) for d in plan.route] + [DEPOT]
+    return leg_distances(to_radians(stops)).tolist()
+
+
+def check_consistent(plan):
+    legs = full_legs(plan)
+    assert plan.legs == pytest.approx(legs, abs=1e-9)
+    assert plan.cumulative == pytest.approx(list(itertools.accumulate(legs)))
+    assert plan.rows() == route_rows(plan.route, plan.legs, "Car")[0]
+
+
+def test_cheapest_insertion_is_optimal():
+    plan, rng = make_plan(40, 1)
+    delivery = make_delivery(rng, "New")
+    candidates = []
+    for index in range(len(plan) + 1):
+        route = plan.route[:index] + [delivery] + plan.route[index:]
+        candidates.append(sum(RoutePlan(route, DEPOT).legs))
+
+    plan.insert(delivery, repair=False)
+    assert plan.total_distance() == pytest.approx(min(candidates))
+    check_consistent(plan)
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_apply_keeps_legs_and_rows_consistent(seed):
+    plan, rng = make_plan(150, seed)
+    for step in range(10):
+        removals = list(
+            dict.fromkeys(
+                plan.route[rng.randrange(len(plan))].customer for _ in range(2)
+            )
+        )
+        insertions = [make_delivery(rng, f"N{step}-{i}") for i in range(3)]
+        before = plan.rows()
+
+        start = plan.apply(insertions, removals)
+
+        assert plan.rows()[:start] == before[:start]
+        assert {d.customer for d in plan.route}.isdisjoint(removals)
+        assert {d.customer for d in insertions} <= {d.customer for d in plan.route}
+        check_consistent(plan)
+
+
+def test_repair_never_lengthens_the_tour():
+    plan, rng = make_plan(100, 7)
+    for step in range(20):
+        unrepaired = RoutePlan(plan.route, DEPOT, "Car", plan.legs)
+        delivery = make_delivery(rng, f"N{step}")
+        unrepaired.insert(delivery, repair=False)
+        plan.insert(delivery)
+        assert plan.total_distance() <= unrepaired.total_distance() + 1e-9
+
+
+def test_partial_csv_write_matches_full_write(tmp_path):
+    plan, rng = make_plan(200, 3)
+    path = tmp_path / "route.csv"
+    plan.write_csv(path)
+    for step in range(5):
+        start = plan.apply(
+            [make_delivery(rng, f"Nyt-{step}")], [plan.route[step * 7].customer]
+        )
+        plan.write_csv(path, start)
+
+    expected = tmp_path / "expected.csv"
+    write_route_csv(expected, route_rows(plan.route, plan.legs, "Car")[0])
+    assert path.read_bytes() == expected.read_bytes()
+
+
+def test_unknown_removal_leaves_plan_unchanged():
+    plan, rng = make_plan(20, 4)
+    route = list(plan.route)
+    with pytest.raises(KeyError):
+        plan.apply([make_delivery(rng, "New")], [route[0].customer, "Nobody"])
+    assert plan.route == route
+
+
+def test_empty_route():
+    plan = RoutePlan([], DEPOT)
+    rng = random.Random(5)
+    plan.apply([make_delivery(rng, "A"), make_delivery(rng, "B")])
+    check_consistent(plan)
+    plan.apply(removals=["A", "B"])
+    assert plan.legs == [0.0]
+    assert plan.rows() == [("DEPOT_END", 0.0, 0.0, 0.0, 0.0, 0.0)]
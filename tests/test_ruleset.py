@@ -39,3 +39,44 @@ def test_ruleset_invalid_format():
 
     with pytest.raises(ValueError):
         RuleSet("B3S23")
+
+
+def test_ruleset_transition_table():
+    """Table is indexed by alive * 9 + neighbors"""
+    ruleset = RuleSet("B36/S23")
+    assert len(ruleset.table) == 18
+    assert [n for n in range(9) if ruleset.table[n]] == [3, 6]
+    assert [n for n in range(9) if ruleset.table[9 + n]] == [2, 3]
+
+
+def test_ruleset_masks():
+    ruleset = RuleSet("B36/S23")
+    assert ruleset.birth_mask == 0b001001000
+    assert ruleset.survive_mask == 0b000001100
+
+
+def test_ruleset_cached_by_normalized_rule():
+    first = RuleSet("B3/S23")
+    second = RuleSet(" b3/s32 ")
+    assert second.rule == "B3/S23"
+    assert second.table is first.table
+    assert second.rule_func is first.rule_func
+
+
+def test_ruleset_invalid_neighbor_count():
+    with pytest.raises(ValueError):
+        RuleSet("B9/S23")
+
+
+def test_ruleset_rule_func_compiled_lazily(monkeypatch):
+    calls = []
+    compile_life_rule = RuleSet.compile_life_rule
+    monkeypatch.setattr(
+        RuleSet,
+        "compile_life_rule",
+        staticmethod(lambda rule: calls.append(rule) or compile_life_rule(rule)),
+    )
+    ruleset = RuleSet("B1357/S02468")
+    assert calls == []
+    assert ruleset.evaluate(False, 5) == "born"
+    assert calls == ["B1357/S02468"]
@@ -0,0 +1,201 @@
+import asyncio
+import concurrent.futures
+import json
+
+import pytest
+
+pytest.importorskip("numpy")
+
+from courier_optimizer import service as service_module
+from courier_optimizer.delivery import Delivery
+from courier_optimizer.route_optimizer import plan_route
+from courier_optimizer.service import RoutingService, parse_request, plan_batch
+
+DELIVERIES = [
+    {
+        "customer": "Oslo City Hall",
+        "latitude": 59.9139,
+        "longitude": 10.7387,
+        "priority": "High",
+        "weight_kg": 2.5,
+    },
+    {
+        "customer": "Aker Brygge",
+        "latitude": "59.9096",
+        "longitude": "10.7245",
+        "priority": "Medium",
+        "weight_kg": "1.2",
+    },
+    {
+        "customer": "Grunerlokka Market",
+        "latitude": 59.9230,
+        "longitude": 10.7586,
+        "priority": "Low",
+        "weight_kg": 3.1,
+    },
+    {
+        "customer": "Nydalen School",
+        "latitude": 59.9507,
+        "longitude": 10.7604,
+        "priority": "High",
+        "weight_kg": 0.8,
+    },
+    {
+        "customer": "Majorstuen Station",
+        "latitude": 59.9291,
+        "longitude": 10.7183,
+        "priority": "Medium",
+        "weight_kg": 5.0,
+    },
+]
+INVALID = [
+    {"customer": "Far away", "latitude": 91, "longitude": 10, "priority": "Low"},
+    {"customer": "Urgent", "latitude": 59.9, "longitude": 10.7, "priority": "Urgent"},
+    "not an object",
+]
+
+
+def test_parse_request():
+    job = parse_request(
+        {
+            "depot": "59.91,10.75",
+            "mode": "walk",
+            "criterion": "CO2",
+            "deliveries": DELIVERIES + INVALID,
+        }
+    )
+    assert job["depot"] == (59.91, 10.75)
+    assert (job["mode"], job["criterion"], job["improve"]) == ("Walk", "co2", None)
+    assert len(job["deliveries"]) == len(DELIVERIES)
+    assert job["rejected"] == [5, 6, 7]
+
+
+@pytest.mark.parametrize(
+    "payload",
+    [
+        [],
+        {"depot": "59.91", "deliveries": []},
+        {"depot": [59.91, 10.75], "deliveries": {}},
+        {"depot": [59.91, 10.75], "deliveries": [], "mode": "boat"},
+        {"depot": [59.91, 10.75], "deliveries": [], "criterion": "fun"},
+        {"depot": [59.91, 10.75], "deliveries": [], "improve": -1},
+    ],
+)
+def test_invalid_requests(payload):
+    with pytest.raises(ValueError):
+        parse_request(payload)
+
+
+def test_batch_matches_single_routes():
+    jobs = [
+        parse_request({"depot": [59.91, 10.75], "deliveries": DELIVERIES[:count]})
+        for count in (5, 3, 4)
+    ]
+    responses = plan_batch(jobs)
+
+    for count, response in zip((5, 3, 4), responses):
+        objects = [
+            Delivery(**{k: str(v) for k, v in d.items()}) for d in DELIVERIES[:count]
+        ]
+        route, legs, _ = plan_route(objects, (59.91, 10.75))
+        assert [stop["customer"] for stop in response["route"]] == [
+            d.customer for d in route
+        ] + ["DEPOT_END"]
+        assert response["totals"]["distance_km"] == round(sum(legs), 2)
+
+
+def make_service(batch_window=0.05):
+    return RoutingService(
+        workers=2,
+        batch_window=batch_window,
+        executor=concurrent.futures.ThreadPoolExecutor(2),
+    )
+
+
+def test_small_requests_are_batched():
+    service = make_service()
+
+    async def run():
+        payloads = [
+            {"depot": [59.91, 10.75], "deliveries": DELIVERIES[: i % 5 + 1]}
+            for i in range(10)
+        ]
+        other = {"depot": [59.95, 10.78], "deliveries": DELIVERIES}
+        return await asyncio.gather(*map(service.plan, payloads + [other]))
+
+    responses = asyncio.run(run())
+    service.close()
+
+    assert [r["deliveries"] for r in responses] == [i % 5 + 1 for i in range(10)] + [5]
+    assert service.requests == 11
+    assert service.batches == 2
+
+
+def test_early_flush_cancels_batch_timer(monkeypatch):
+    monkeypatch.setattr(service_module, "BATCH_MAX_STOPS", 5)
+    service = make_service(batch_window=0.2)
+
+    async def run():
+        depot = [59.91, 10.75]
+        first = asyncio.create_task(
+            service.plan({"depot": depot, "deliveries": DELIVERIES[:3]})
+        )
+        await asyncio.sleep(0.1)
+        # Does not fit with the first request, which is flushed early.
+        second = asyncio.create_task(
+            service.plan({"depot": depot, "deliveries": DELIVERIES[:3]})
+        )
+        # Arrives after the first request's timer would have fired.
+        await asyncio.sleep(0.15)
+        third = asyncio.create_task(
+            service.plan({"depot": depot, "deliveries": DELIVERIES[:2]})
+        )
+        return await asyncio.gather(first, second, third)
+
+    responses = asyncio.run(run())
+    service.close()
+
+    assert [r["deliveries"] for r in responses] == [3, 3, 2]
+    assert service.batches == 2
+
+
+async def request(port, method, path, body=b""):
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    writer.write(
+        f"{method} {path} HTTP/1.1\r\nContent-Length: {len(body)}\r\n"
+        "Connection: close\r\n\r\n".encode() + body
+    )
+    await writer.drain()
+    response = await reader.read()
+    writer.close()
+    head, _, payload = response.partition(b"\r\n\r\n")
+    return int(head.split()[1]), json.loads(payload)
+
+
+def test_http():
+    service = make_service(batch_window=0.001)
+
+    async def run():
+        server = await asyncio.start_server(service.handle, "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        async with server:
+            body = json.dumps(
+                {"depot": [59.91, 10.75], "deliveries": DELIVERIES, "improve": 0.1}
+            ).encode()
+            return [
+                await request(port, "POST", "/route", body),
+                await request(port, "POST", "/route", b"{"),
+                await request(port, "GET", "/route"),
+                await request(port, "GET", "/nowhere"),
+                await request(port, "GET", "/health"),
+            ]
+
+    results = asyncio.run(run())
+    service.close()
+
+    status, response = results[0]
+    assert status == 200
+    assert response["deliveries"] == 5
+    assert response["route"][-1]["customer"] == "DEPOT_END"
+    assert [status for status, _ in results[1:]] == [400, 405, 404, 200]
+    assert results[-1][1]["requests"] == 1
@@ -0,0 +1,94 @@
+import os
+
+import pytest
+from conway.backends import create_grid, randomize
+from conway.rules import RuleSet
+from conway.snapshot import Checkpointer, Snapshot, save_snapshot
+
+conway_rule = RuleSet("B3/S23")
+
+
+def cells_of(grid, size):
+    return [grid.get_cell(x, y) for y in range(size) for x in range(size)]
+
+
+@pytest.mark.parametrize("compress", [False, True])
+@pytest.mark.parametrize("source", ["dense", "packed", "numpy"])
+@pytest.mark.parametrize("target", ["dense", "packed", "numpy"])
+def test_round_trip_between_backends(tmp_path, source, target, compress):
+    path = str(tmp_path / "board.snap")
+    grid = create_grid(source, 13, grid_wrap=False)
+    randomize(grid, 13, 0.4, seed=1)
+    save_snapshot(grid, path, rule="B36/S23", generation=42, compress=compress)
+
+    with Snapshot(path) as snapshot:
+        assert snapshot.grid_size == 13
+        assert snapshot.grid_wrap is False
+        assert snapshot.rule == "B36/S23"
+        assert snapshot.generation == 42
+        assert snapshot.compressed is compress
+        loaded = create_grid(target, 13, grid_wrap=False)
+        snapshot.load_into(loaded)
+        assert snapshot.get_cell(5, 7) == grid.get_cell(5, 7)
+
+    assert cells_of(loaded, 13) == cells_of(grid, 13)
+
+
+def test_payload_is_bit_packed(tmp_path):
+    path = str(tmp_path / "board.snap")
+    save_snapshot(create_grid("packed", 1000), path)
+    assert os.path.getsize(path) < 1000 * 1000 // 8 + 64
+
+
+def test_array_is_a_view_of_the_file(tmp_path):
+    np = pytest.importorskip("numpy")
+    path = str(tmp_path / "board.snap")
+    grid = create_grid("packed", 16)
+    grid.set_cell(9, 3, 1)
+    save_snapshot(grid, path)
+
+    with Snapshot(path) as snapshot:
+        rows = snapshot.array()
+        assert rows.shape == (16, 2)
+        assert not rows.flags.owndata
+        assert rows[3, 1] == 1 << 1
+        del rows
+
+
+def test_rejects_other_files(tmp_path):
+    path = tmp_path / "not.snap"
+    path.write_bytes(b"x = 3, y = 3\n" * 4)
+    with pytest.raises(ValueError):
+        Snapshot(str(path))
+
+
+def test_load_into_checks_size(tmp_path):
+    path = str(tmp_path / "board.snap")
+    save_snapshot(create_grid("dense", 8), path)
+    with Snapshot(path) as snapshot, pytest.raises(ValueError):
+        snapshot.load_into(create_grid("dense", 9))
+
+
+def test_checkpointer_saves_at_interval_and_resumes(tmp_path):
+    path = str(tmp_path / "run.snap")
+    grid = create_grid("packed", 16)
+    randomize(grid, 16, 0.35, seed=3)
+    reference = create_grid("packed", 16)
+    randomize(reference, 16, 0.35, seed=3)
+
+    checkpointer = Checkpointer(path, 5, conway_rule.rule)
+    saved = []
+    for _ in range(12):
+        grid.evolve(conway_rule)
+        saved.append(checkpointer.update(grid))
+    assert [i + 1 for i, flag in enumerate(saved) if flag] == [5, 10]
+
+    with Snapshot(path) as snapshot:
+        assert snapshot.generation == 10
+        resumed = create_grid("dense", 16)
+        snapshot.load_into(resumed)
+
+    for _ in range(10):
+        reference.evolve(conway_rule)
+    assert cells_of(resumed, 16) == cells_of(reference, 16)
+    assert not os.path.exists(path + ".tmp")
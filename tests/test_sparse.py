@@ -0,0 +1,88 @@
+import random
+
+import pytest
+from conway.grid import Grid
+from conway.renderer import Viewport, grid_to_string
+from conway.rules import RuleSet
+from conway.sparse import SparseGrid, cell_id
+
+conway_rule = RuleSet("B3/S23")
+
+
+def test_set_and_get_cell():
+    grid = SparseGrid(cells=[])
+    grid.set_cell(-1000, 5000, 1)
+    assert grid.get_cell(-1000, 5000) == 1
+    grid.set_cell(-1000, 5000, 0)
+    assert grid.get_cell(-1000, 5000) == 0
+    assert grid.population == 0
+
+
+def test_count_neighbors():
+    grid = SparseGrid(cells=[(0, 0), (0, 1), (1, 0)])
+    assert grid.count_neighbors(1, 1) == 3
+    assert grid.count_neighbors(3, 3) == 0
+
+
+def test_evolve_blinker():
+    grid = SparseGrid(cells=[(0, 1), (1, 1), (2, 1)])
+    grid.evolve(conway_rule)
+    assert grid.cells == {(1, 0), (1, 1), (1, 2)}
+
+
+def test_glider_travels_unbounded():
+    grid = SparseGrid()
+    for _ in range(400):
+        grid.evolve(conway_rule)
+    assert grid.population == 5
+    assert grid.bounding_box() == (100, 100, 102, 102)
+
+
+def test_rejects_b0_rules():
+    with pytest.raises(ValueError):
+        SparseGrid().evolve(RuleSet("B0/S"))
+
+
+@pytest.mark.parametrize("rule", ["B3/S23", "B36/S23", "B2/S0"])
+def test_evolve_matches_grid(rule):
+    ruleset = RuleSet(rule)
+    rng = random.Random(5)
+    grid = Grid(grid_size=40, grid_wrap=False)
+    sparse = SparseGrid(cells=[])
+    for y in range(40):
+        for x in range(40):
+            state = 1 if 16 <= x < 24 and 16 <= y < 24 and rng.random() < 0.5 else 0
+            grid.set_cell(x, y, state)
+            sparse.set_cell(x, y, state)
+
+    for _ in range(6):
+        grid.evolve(ruleset)
+        sparse.evolve(ruleset)
+
+    view = Viewport(sparse, grid_size=40)
+    assert grid_to_string(view) == grid_to_string(grid)
+
+
+def test_changes_and_bounding_box_follow_evolve():
+    rng = random.Random(3)
+    grid = SparseGrid(cells=[])
+    for y in range(30):
+        for x in range(30):
+            if rng.random() < 0.35:
+                grid.set_cell(x - 15, y - 15, 1)
+
+    for _ in range(20):
+        before = set(grid.cells)
+        grid.evolve(conway_rule)
+        births, deaths = grid.changes()
+        assert sorted(births) == sorted(cell_id(*c) for c in grid.cells - before)
+        assert sorted(deaths) == sorted(cell_id(*c) for c in before - grid.cells)
+
+        xs = [x for x, _ in grid.cells]
+        ys = [y for _, y in grid.cells]
+        assert grid.bounding_box() == (min(xs), min(ys), max(xs), max(ys))
+
+    grid.set_run(-40, 2, 3, 1)
+    assert grid.bounding_box()[0] == -40
+    grid.set_run(-40, 2, 3, 0)
+    assert grid.bounding_box()[0] > -40
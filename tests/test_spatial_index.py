@@ -0,0 +1,60 @@
+import random
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from courier_optimizer import route_optimizer
+from courier_optimizer.delivery import Delivery
+from courier_optimizer.distance_matrix import to_radians
+from courier_optimizer.spatial_index import KDTree, to_unit_sphere
+
+
+def test_kdtree_nearest_with_removals():
+    rng = np.random.default_rng(0)
+    xyz = to_unit_sphere(to_radians(rng.uniform([59, 10], [61, 12], size=(300, 2))))
+    tree = KDTree(xyz, leaf_size=4)
+    removed = set(rng.choice(300, size=150, replace=False).tolist())
+    for i in removed:
+        tree.remove(i)
+    assert len(tree) == 150
+
+    for query in xyz[:20]:
+        distance, indices = tree.nearest(query.tolist())
+        alive = [i for i in range(300) if i not in removed]
+        expected = min(alive, key=lambda i: np.linalg.norm(xyz[i] - query))
+        assert indices == [expected]
+        assert distance == pytest.approx(np.linalg.norm(xyz[expected] - query))
+
+
+def test_kdtree_returns_ties_and_empties():
+    xyz = to_unit_sphere(to_radians([(60, 10), (60, 10), (61, 11)]))
+    tree = KDTree(xyz)
+    assert tree.nearest(xyz[0].tolist())[1] == [0, 1]
+    for i in range(3):
+        tree.remove(i)
+    assert tree.nearest(xyz[0].tolist())[1] == []
+
+
+def test_indexed_route_matches_scan(monkeypatch):
+    rng = random.Random(7)
+    deliveries = [
+        Delivery(
+            f"C{i}",
+            str(round(59.8 + rng.random() * 0.3, 3)),
+            str(round(10.6 + rng.random() * 0.4, 3)),
+            rng.choice(["High", "Medium", "Low"]),
+            "1.0",
+        )
+        for i in range(400)
+    ]
+    # Duplicate locations exercise the lowest-index tie-break.
+    deliveries += [
+        Delivery("Dup", d.latitude, d.longitude, d.priority, "1")
+        for d in deliveries[:20]
+    ]
+    depot = (59.91, 10.75)
+
+    scanned = route_optimizer.optimize_route(deliveries, depot)
+    monkeypatch.setattr(route_optimizer, "SPATIAL_INDEX_THRESHOLD", 0)
+    assert route_optimizer.optimize_route(deliveries, depot) == scanned
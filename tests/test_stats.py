@@ -0,0 +1,57 @@
+import pytest
+from conway.backends import create_grid, randomize
+from conway.benchmark import measure
+from conway.rules import RuleSet
+from conway.sparse import SparseGrid
+from conway.stats import StatsCollector, StatsRecorder
+
+conway_rule = RuleSet("B3/S23")
+
+
+def scanned_bounding_box(grid, size):
+    live = [(x, y) for y in range(size) for x in range(size) if grid.get_cell(x, y)]
+    if not live:
+        return None
+    xs, ys = zip(*live)
+    return min(xs), min(ys), max(xs), max(ys)
+
+
+@pytest.mark.parametrize("backend", ["dense", "packed", "numpy"])
+def test_stats_match_a_rescan(backend):
+    grid = create_grid(backend, 20, grid_wrap=False)
+    randomize(grid, 20, 0.3, seed=8)
+    seen = []
+    collector = StatsCollector([seen.append])
+
+    for _ in range(15):
+        before = grid.population
+        stats = collector.evolve(grid, conway_rule)
+        assert stats.population == grid.population
+        assert stats.births - stats.deaths == grid.population - before
+        assert stats.bounding_box == scanned_bounding_box(grid, 20)
+
+    assert [s.generation for s in seen] == list(range(1, 16))
+
+
+def test_render_time_and_sparse_bounding_box():
+    grid = SparseGrid()
+    rendered = []
+    stats = StatsCollector().evolve(
+        grid, conway_rule, render=lambda: rendered.append(1)
+    )
+    assert rendered == [1]
+    assert stats.render_seconds >= 0
+    assert stats.bounding_box == grid.bounding_box()
+    assert stats.population == 5
+
+
+def test_recorder_samples(tmp_path):
+    path = tmp_path / "stats.csv"
+    grid = create_grid("packed", 16)
+    randomize(grid, 16, 0.35, seed=1)
+    with StatsRecorder(str(path), every=3) as recorder:
+        measure(grid, conway_rule, 10, 16, collector=StatsCollector([recorder]))
+
+    lines = path.read_text().splitlines()
+    assert lines[0].startswith("generation,population,births,deaths")
+    assert [line.split(",")[0] for line in lines[1:]] == ["3", "6", "9"]
@@ -0,0 +1,86 @@
+import csv
+import json
+
+import pytest
+from conway.rules import RuleSet
+from conway.sweep import (
+    _init_worker,
+    completed_jobs,
+    parse_rules,
+    parse_seeds,
+    run_job,
+    sweep,
+)
+
+
+def test_parse_rules_expands_indices():
+    assert parse_rules(["B3/S23", "0-1"]) == ["B3/S23", "B/S", "B0/S"]
+    # Index of B3/S23 is birth mask 1 << 3 plus survive mask (1 << 2 | 1 << 3) << 9.
+    assert parse_rules([str(8 | 12 << 9) + "-" + str(8 | 12 << 9)]) == ["B3/S23"]
+    assert len(parse_rules(["all"])) == 1 << 18
+
+
+def test_parse_rules_rejects_out_of_range():
+    with pytest.raises(ValueError):
+        parse_rules(["0-262144"])
+
+
+def test_parse_seeds():
+    assert parse_seeds(["3", "5-7"]) == [3, 5, 6, 7]
+
+
+def test_sweep_streams_and_resumes(tmp_path):
+    output = str(tmp_path / "sweep.jsonl")
+    rules = ["B3/S23", "B36/S23"]
+
+    assert sweep(rules[:1], [0, 1], output, generations=20, size=16, workers=2) == 2
+    with open(output, "a", encoding="utf-8") as f:
+        f.write('{"rule": "B36/S23", "se')  # interrupted write
+
+    assert completed_jobs(output) == {("B3/S23", 0), ("B3/S23", 1)}
+    assert sweep(rules, [0, 1], output, generations=20, size=16, workers=2) == 2
+    assert sweep(rules, [0, 1], output, generations=20, size=16, workers=2) == 0
+
+    with open(output, encoding="utf-8") as f:
+        results = [json.loads(line) for line in f]
+    assert {(r["rule"], r["seed"]) for r in results} == {
+        (rule, seed) for rule in rules for seed in [0, 1]
+    }
+    assert all(
+        r["population"][0] == results[0]["population"][0]
+        for r in results
+        if r["seed"] == results[0]["seed"]
+    )
+
+
+def test_sweep_matches_across_backends(tmp_path):
+    results = {}
+    for backend in ["dense", "packed"]:
+        output = str(tmp_path / f"{backend}.csv")
+        sweep(
+            ["B3/S23"], [2], output, generations=30, size=16, backend=backend, workers=1
+        )
+        with open(output, newline="", encoding="utf-8") as f:
+            (row,) = csv.DictReader(f)
+        results[backend] = row
+    assert results["dense"] == results["packed"]
+
+
+def test_run_job_does_not_compile_rule_functions(monkeypatch):
+    def compile_life_rule(rule):
+        raise AssertionError(f"compiled {rule}")
+
+    monkeypatch.setattr(RuleSet, "compile_life_rule", staticmethod(compile_life_rule))
+    _init_worker(
+        {
+            "generations": 5,
+            "size": 8,
+            "density": 0.35,
+            "backend": "packed",
+            "wrap": True,
+            "history": 16,
+            "sample_every": 1,
+        }
+    )
+    for rule in parse_rules(["0-63"]):
+        assert run_job((rule, 0))["rule"] == rule
@@ -0,0 +1,51 @@
+import random
+
+import pytest
+from conway.grid import Grid
+from conway.rules import RuleSet
+
+np = pytest.importorskip("numpy")
+
+from conway.vectorized import NumpyGrid, neighbor_counts
+
+
+def test_set_and_get_cell():
+    grid = NumpyGrid(grid_size=5)
+    grid.set_cell(3, 3, 1)
+    assert grid.get_cell(3, 3) == 1
+    grid.set_cell(3, 3, 0)
+    assert grid.get_cell(3, 3) == 0
+
+
+def test_neighbor_counts_no_wrap():
+    cells = np.zeros((3, 3), dtype=np.uint8)
+    cells[0, 0] = cells[1, 0] = cells[0, 1] = 1
+    counts = neighbor_counts(cells, wrap=False)
+    assert counts[1, 1] == 3
+    assert counts[2, 2] == 0
+
+
+def test_neighbor_counts_with_wrap():
+    cells = np.zeros((3, 3), dtype=np.uint8)
+    cells[0, 0] = 1
+    assert neighbor_counts(cells, wrap=True)[2, 2] == 1
+
+
+@pytest.mark.parametrize("wrap", [True, False])
+@pytest.mark.parametrize("rule", ["B3/S23", "B36/S23", "B2/S", "B1357/S1357"])
+def test_evolve_matches_grid(wrap, rule):
+    ruleset = RuleSet(rule)
+    rng = random.Random(11)
+    grid = Grid(grid_size=12, grid_wrap=wrap)
+    vectorized = NumpyGrid(grid_size=12, grid_wrap=wrap)
+    for y in range(12):
+        for x in range(12):
+            state = 1 if rng.random() < 0.4 else 0
+            grid.set_cell(x, y, state)
+            vectorized.set_cell(x, y, state)
+
+    for _ in range(5):
+        grid.evolve(ruleset)
+        vectorized.evolve(ruleset)
+
+    assert vectorized.cells.ravel().tolist() == grid.grid